@@ -3,11 +3,16 @@
 SLOTH Performance Benchmark Script
 
 Tests parsing and memory usage across different file sizes to update the README performance matrix.
+
+Run with --conversion to compare per-cell and bulk gemmi loop conversion,
+or with --storage to compare list-backed and columnar category storage.
 """
 
+import gc
 import os
 import time
 import tempfile
+import tracemalloc
 import psutil
 import sys
 from typing import Dict, List, Tuple
@@ -111,6 +116,192 @@ def benchmark_parsing(file_path: str, categories: List[str] = None) -> Dict:
     }
 
 
+def _convert_loops_per_cell(doc) -> int:
+    """Reference per-cell loop conversion (the pre-bulk MMCIFParser code path)."""
+    cell_count = 0
+    for block in doc:
+        for item in block:
+            if item.loop:
+                loop = item.loop
+                for i in range(loop.width()):
+                    column_data = []
+                    for row_idx in range(loop.length()):
+                        column_data.append(str(loop[row_idx, i]))
+                    cell_count += len(column_data)
+    return cell_count
+
+
+def _convert_loops_bulk(doc) -> int:
+    """Bulk loop conversion as used by MMCIFParser (one value buffer per loop)."""
+    cell_count = 0
+    for block in doc:
+        for item in block:
+            if item.loop:
+                loop = item.loop
+                values = loop.values
+                width = loop.width()
+                for i in range(width):
+                    cell_count += len(values[i::width])
+    return cell_count
+
+
+def benchmark_loop_conversion(file_path: str, repeats: int = 3) -> Dict:
+    """Compare per-cell and bulk gemmi loop conversion on the same document."""
+    import gemmi
+
+    doc = gemmi.cif.read_file(file_path)
+
+    def best_of(func) -> float:
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            func(doc)
+            timings.append(time.perf_counter() - start_time)
+        return min(timings)
+
+    per_cell_time = best_of(_convert_loops_per_cell)
+    bulk_time = best_of(_convert_loops_bulk)
+
+    handler = MMCIFHandler()
+    start_time = time.perf_counter()
+    handler.parse(file_path)
+    parse_time = time.perf_counter() - start_time
+
+    return {
+        'per_cell_time': per_cell_time,
+        'bulk_time': bulk_time,
+        'speedup': per_cell_time / bulk_time if bulk_time > 0 else float('inf'),
+        'parse_time': parse_time,
+    }
+
+
+def run_conversion_benchmarks():
+    """Benchmark gemmi loop conversion strategies on increasingly large files."""
+    print("🦥 SLOTH Loop Conversion Benchmark")
+    print("=" * 50)
+
+    test_cases = [1000, 10000, 50000]
+
+    print(f"{'File Size':<12} {'Per-cell':<12} {'Bulk':<12} {'Speedup':<10} {'Full Parse':<12}")
+    print("-" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size_kb in test_cases:
+            test_file = os.path.join(temp_dir, f"conversion_{size_kb}kb.cif")
+            test_file, actual_size = create_test_file(size_kb, test_file)
+            result = benchmark_loop_conversion(test_file)
+
+            size_str = f"{actual_size / 1024 / 1024:.1f}MB"
+            print(
+                f"{size_str:<12} {format_time(result['per_cell_time']):<12} "
+                f"{format_time(result['bulk_time']):<12} {result['speedup']:<10.1f} "
+                f"{format_time(result['parse_time']):<12}"
+            )
+
+
+def create_structure_file(atom_count: int, filename: str) -> str:
+    """Create an _atom_site loop with realistic value diversity (unique coordinates and ids)."""
+    residues = ["ALA", "GLY", "SER", "LEU", "LYS", "ASP", "GLU", "VAL", "ILE", "THR"]
+    atoms = [("N", "N"), ("CA", "C"), ("C", "C"), ("O", "O"), ("CB", "C")]
+    lines = [
+        "data_TEST",
+        "loop_",
+        "_atom_site.group_PDB",
+        "_atom_site.id",
+        "_atom_site.type_symbol",
+        "_atom_site.label_atom_id",
+        "_atom_site.label_comp_id",
+        "_atom_site.label_asym_id",
+        "_atom_site.label_seq_id",
+        "_atom_site.Cartn_x",
+        "_atom_site.Cartn_y",
+        "_atom_site.Cartn_z",
+        "_atom_site.occupancy",
+        "_atom_site.B_iso_or_equiv",
+    ]
+    for i in range(atom_count):
+        residue = i // len(atoms)
+        atom_name, element = atoms[i % len(atoms)]
+        lines.append(
+            f"ATOM {i + 1} {element} {atom_name} {residues[residue % len(residues)]} "
+            f"{chr(65 + residue // 1000 % 26)} {residue % 1000 + 1} "
+            f"{(i * 0.731) % 200 - 100:.3f} {(i * 1.137) % 200 - 100:.3f} {(i * 0.419) % 200 - 100:.3f} "
+            f"1.00 {10 + (i * 0.37) % 90:.2f}"
+        )
+    with open(filename, "w") as f:
+        f.write("\n".join(lines) + "\n#\n")
+    return filename
+
+
+def benchmark_storage(file_path: str, columnar: bool) -> Dict:
+    """Parse a file and measure the memory and objects retained by the container."""
+    handler = MMCIFHandler()
+    start_time = time.perf_counter()
+    handler.parse(file_path, columnar=columnar)
+    parse_time = time.perf_counter() - start_time
+
+    # Parse again under tracemalloc (which slows allocation) to measure what is kept
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    mmcif = handler.parse(file_path, columnar=columnar)
+    atom_site = mmcif.data[0]._atom_site
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = sys.getallocatedblocks() - blocks_before
+
+    start_time = time.perf_counter()
+    gc.collect()
+    gc_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for row in atom_site[::100]:
+        row.Cartn_x
+    row_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    atom_site.column("Cartn_x", dtype=float)
+    column_time = time.perf_counter() - start_time
+
+    result = {
+        'parse_time': parse_time,
+        'retained_mb': retained / 1024 / 1024,
+        'objects': objects,
+        'gc_time': gc_time,
+        'row_time': row_time,
+        'column_time': column_time,
+    }
+    del atom_site, mmcif
+    return result
+
+
+def run_storage_benchmarks():
+    """Compare default (list-backed) and columnar category storage on large _atom_site loops."""
+    print("🦥 SLOTH Category Storage Benchmark")
+    print("=" * 50)
+
+    test_cases = [100_000, 500_000, 1_000_000]
+
+    print(
+        f"{'Atoms':<10} {'Storage':<10} {'Parse':<10} {'Retained':<10} {'Objects':<12} "
+        f"{'Full GC':<10} {'Rows/100':<10} {'Column':<10}"
+    )
+    print("-" * 84)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for atom_count in test_cases:
+            test_file = create_structure_file(atom_count, os.path.join(temp_dir, f"storage_{atom_count}.cif"))
+            for columnar in (False, True):
+                result = benchmark_storage(test_file, columnar)
+                print(
+                    f"{atom_count:<10,} {'columnar' if columnar else 'default':<10} "
+                    f"{format_time(result['parse_time']):<10} {format_memory(result['retained_mb']):<10} "
+                    f"{result['objects']:<12,} {format_time(result['gc_time']):<10} "
+                    f"{format_time(result['row_time']):<10} {format_time(result['column_time']):<10}"
+                )
+
+
 def format_time(seconds: float) -> str:
     """Format time in a human-readable way."""
     if seconds < 0.001:
@@ -239,4 +430,9 @@ if __name__ == "__main__":
         os.system("pip install psutil")
         import psutil
     
-    run_benchmarks()
+    if "--conversion" in sys.argv:
+        run_conversion_benchmarks()
+    elif "--storage" in sys.argv:
+        run_storage_benchmarks()
+    else:
+        run_benchmarks()
@@ -45,9 +45,16 @@ from .models import (
     Category,
     Row,
     Item,
+    EncodedItem,
+    PackedItem,
+    ViewItem,
+    CategoryView,
     DataSourceFormat,
 )
+from .grouping import GroupBy
+from .hierarchy import Hierarchy
 from .parser import MMCIFParser
+from .spatial import SpatialIndex
 from .writer import MMCIFWriter
 from .exporter import MMCIFExporter
 from .loaders import (
@@ -93,6 +100,13 @@ __all__ = [
     "Category",
     "Row",
     "Item",
+    "EncodedItem",
+    "PackedItem",
+    "ViewItem",
+    "CategoryView",
+    "GroupBy",
+    "SpatialIndex",
+    "Hierarchy",
     "ValidatorFactory",
     "DataSourceFormat",
     "FormatLoader",
@@ -9,14 +9,101 @@ all parsers and writers must implement, ensuring consistency across different ba
 """
 
 import os
+import bz2
+import gzip
+import lzma
 from abc import ABC, abstractmethod
-from typing import Optional, Union, IO
+from typing import Optional, Union, IO, Tuple
 from pathlib import Path
 from .models import MMCIFDataContainer, DataSourceFormat
 from .plugins import ValidatorFactory
 from .validators import SchemaValidator
 
 
+# Compressed mmCIF inputs handled transparently (suffix -> magic number)
+COMPRESSION_MAGIC = {
+    ".gz": b"\x1f\x8b",
+    ".bz2": b"BZh",
+    ".xz": b"\xfd7zXZ\x00",
+}
+
+_DECOMPRESSORS = {
+    ".gz": gzip.decompress,
+    ".bz2": bz2.decompress,
+    ".xz": lzma.decompress,
+}
+
+
+_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def split_compression_suffix(file_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a recognised compression suffix off a path.
+
+    :param file_path: Path such as '1abc.cif.gz'
+    :return: Tuple of (path without suffix, suffix or None)
+    """
+    lowered = file_path.lower()
+    for suffix in COMPRESSION_MAGIC:
+        if lowered.endswith(suffix):
+            return file_path[: -len(suffix)], suffix
+    return file_path, None
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """
+    Decompress gzip, bzip2 or xz data detected by magic number.
+
+    Data without a recognised magic number is returned unchanged.
+
+    :param data: Raw or compressed bytes
+    :return: Uncompressed bytes
+    """
+    for suffix, magic in COMPRESSION_MAGIC.items():
+        if data[: len(magic)] == magic:
+            return _DECOMPRESSORS[suffix](data)
+    return data
+
+
+def open_text(
+    file_path: Union[str, Path], encoding: str = "utf-8", newline: Optional[str] = None
+) -> IO:
+    """
+    Open a possibly compressed text file for streaming reads.
+
+    :param file_path: Path to the file; .gz, .bz2 and .xz are decompressed on the fly
+    :param encoding: Text encoding
+    :param newline: Newline handling as for open() ('' keeps line endings untranslated)
+    :return: Text file object
+    """
+    file_path = str(file_path)
+    _, compression = split_compression_suffix(file_path)
+    if compression:
+        return _OPENERS[compression](file_path, "rt", encoding=encoding, newline=newline)
+    return open(file_path, "r", encoding=encoding, newline=newline)
+
+
+def open_binary(file_path: Union[str, Path]) -> IO:
+    """
+    Open a possibly compressed file for binary reads.
+
+    Compressed files support seek(), emulated by decompressing up to the offset.
+
+    :param file_path: Path to the file; .gz, .bz2 and .xz are decompressed on the fly
+    :return: Binary file object
+    """
+    file_path = str(file_path)
+    _, compression = split_compression_suffix(file_path)
+    if compression:
+        return _OPENERS[compression](file_path, "rb")
+    return open(file_path, "rb")
+
+
 def auto_detect_format_and_load(
     file_path: str,
     validator_factory: Optional[ValidatorFactory] = None,
@@ -82,7 +169,10 @@ def auto_detect_format_and_load(
             file_path, validator_factory, format_specific_validator
         )
 
-    ext = os.path.splitext(file_path.lower())[1]
+    base_path, compression = split_compression_suffix(file_path)
+    ext = os.path.splitext(base_path.lower())[1]
+    if compression and ext != ".cif":
+        raise ValueError(f"Unsupported compressed file: {file_path}")
     if ext == ".json":
         return MMCIFImporter.from_json(
             file_path, validator_factory, format_specific_validator
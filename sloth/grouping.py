@@ -0,0 +1,198 @@
+"""
+SLOTH Grouping and Aggregation
+
+Vectorised group-by over category columns, e.g. per-residue statistics::
+
+    atom_site.group_by("label_asym_id", "label_seq_id").agg(B_iso_or_equiv="mean", id="count")
+
+Key items are factorised into integer group ids (dictionary-encoded items
+reuse their codes), rows are sorted by group once, and every aggregate is a
+NumPy reduction over the sorted column. No Python code runs per row and
+pandas is not needed. The result is a new Category with one row per group,
+in order of first appearance.
+"""
+
+from typing import Iterator, List, Optional, Tuple, Union
+from .models import Category, CategoryView, _require_numpy
+from .selection import _encoded_column
+
+# Aggregates over numbers; unknown ('?') and inapplicable ('.') values are skipped
+_NUMERIC_AGGREGATES = ("sum", "mean", "min", "max")
+# Aggregates over the raw values
+_VALUE_AGGREGATES = ("count", "size", "nunique", "first", "last")
+AGGREGATES = _NUMERIC_AGGREGATES + _VALUE_AGGREGATES
+# Digits after the decimal point kept in numeric aggregates (trailing zeros trimmed)
+_AGGREGATE_DECIMALS = 6
+
+
+class GroupBy:
+    """
+    Rows of a category grouped by the values of one or more key items.
+
+    Created by :meth:`Category.group_by`. The grouping is computed once, on
+    first use, and shared by every :meth:`agg` call and iteration.
+    """
+
+    def __init__(self, category: Category, keys: Tuple[str, ...]):
+        """
+        Initialize a grouping.
+
+        :param category: The category (or view) to group
+        :param keys: Names of the key items
+        :raises KeyError: If a key item is not in the category
+        """
+        if not keys:
+            raise ValueError("group_by() needs at least one key item")
+        for item_name in keys:
+            if item_name not in category.items:
+                raise KeyError(f"Item '{item_name}' not found in category '{category.name}'")
+        self._category = category
+        self._keys = keys
+        self._groups = None
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """Names of the key items."""
+        return self._keys
+
+    def __len__(self) -> int:
+        return len(self._grouping()[1])
+
+    def __iter__(self) -> Iterator[Tuple[Tuple[str, ...], CategoryView]]:
+        """Iterate over (key values, view of the group's rows) in order of first appearance."""
+        order, starts = self._grouping()
+        bounds = list(starts[1:]) + [len(order)]
+        key_columns = [self._category.get_item(item_name) for item_name in self._keys]
+        for start, end in zip(starts.tolist(), bounds):
+            first = int(order[start])
+            key = tuple(column[first] for column in key_columns)
+            yield key, self._category.view(order[start:end])
+
+    def agg(self, name: Optional[str] = None, /, **aggregates: Union[str, Tuple[str, str]]) -> Category:
+        """
+        Aggregate items per group.
+
+        Each keyword names an output item. Its value is an aggregate applied
+        to the item of the same name, or an ``(item, aggregate)`` pair, e.g.
+        ``agg(B_iso_or_equiv="mean", n_atoms=("id", "count"))``.
+
+        Aggregates: ``sum``, ``mean``, ``min`` and ``max`` decode the item as
+        numbers and skip null values ('?' if a group has none); ``count``
+        counts non-null values, ``size`` counts rows, ``nunique`` counts
+        distinct values, ``first`` and ``last`` take a raw value. Numeric
+        results are written with at most six decimals, e.g. '54.13'.
+
+        :param name: Name of the result category, e.g. '_residue_stats'. The
+                     result is unnamed by default, so it never clashes with
+                     the grouped category when added to a block.
+        :return: A Category with the key items and one item per aggregate
+        :raises ValueError: If an aggregate is unknown or clashes with a key item
+        """
+        np = _require_numpy()
+        order, starts = self._grouping()
+        first_rows = order[starts]
+
+        result = Category(name or "", self._category.validator_factory)
+        for item_name in self._keys:
+            column = self._category.get_item(item_name)
+            result[item_name] = [column[row] for row in first_rows.tolist()]
+
+        for output_name, spec in aggregates.items():
+            item_name, function = (output_name, spec) if isinstance(spec, str) else spec
+            if function not in AGGREGATES:
+                raise ValueError(
+                    f"Unknown aggregate '{function}' for '{output_name}'; expected one of {', '.join(AGGREGATES)}"
+                )
+            if output_name in self._keys:
+                raise ValueError(f"Aggregate '{output_name}' has the same name as a key item")
+            if function != "size" and item_name not in self._category.items:
+                raise KeyError(f"Item '{item_name}' not found in category '{self._category.name}'")
+            result[output_name] = self._aggregate(np, item_name, function, order, starts)
+        return result
+
+    def _aggregate(self, np, item_name: str, function: str, order, starts) -> List[str]:
+        """Apply one aggregate to the rows sorted by group."""
+        if not len(starts):
+            return []
+        sizes = np.diff(np.append(starts, len(order)))
+        if function == "size":
+            return [str(size) for size in sizes.tolist()]
+        if function in ("first", "last"):
+            rows = order[starts] if function == "first" else order[starts + sizes - 1]
+            column = self._category.get_item(item_name)
+            return [column[row] for row in rows.tolist()]
+
+        if function in ("count", "nunique"):
+            column = self._category.column(item_name, dtype=str)
+            present = ~np.ma.getmaskarray(column)[order]
+            if function == "count":
+                counts = np.add.reduceat(present.astype(np.int64), starts)
+                return [str(count) for count in counts.tolist()]
+            # Distinct (group, value) pairs among the non-null values
+            values = np.unique(column.data, return_inverse=True)[1].reshape(-1)[order]
+            group_ids = np.repeat(np.arange(len(starts)), sizes)
+            pairs = np.unique(np.stack([group_ids[present], values[present]]), axis=1)
+            counts = np.bincount(pairs[0], minlength=len(starts))
+            return [str(count) for count in counts.tolist()]
+
+        column = self._category.column(item_name, dtype=float)
+        data = column.data[order]
+        present = ~np.ma.getmaskarray(column)[order]
+        counts = np.add.reduceat(present.astype(np.int64), starts)
+        if function in ("sum", "mean"):
+            totals = np.add.reduceat(np.where(present, data, 0.0), starts)
+            values = totals if function == "sum" else totals / np.maximum(counts, 1)
+        else:
+            fill = np.inf if function == "min" else -np.inf
+            reduce = np.minimum if function == "min" else np.maximum
+            values = reduce.reduceat(np.where(present, data, fill), starts)
+        return [
+            np.format_float_positional(value, precision=_AGGREGATE_DECIMALS, trim="0")
+            if count or function == "sum"
+            else "?"
+            for value, count in zip(values.tolist(), counts.tolist())
+        ]
+
+    def _grouping(self):
+        """
+        Sort rows by group.
+
+        :return: (row order with each group contiguous, start of each group in
+                 that order), groups in order of first appearance
+        """
+        if self._groups is not None:
+            return self._groups
+        np = _require_numpy()
+
+        group_ids = None
+        for item_name in self._keys:
+            codes, distinct = self._factorize(np, item_name)
+            group_ids = codes if group_ids is None else group_ids * distinct + codes
+            # Re-factorise so the combined ids stay small however many keys there are
+            group_ids = np.unique(group_ids, return_inverse=True)[1].reshape(-1)
+
+        if group_ids is None or not len(group_ids):
+            self._groups = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+            return self._groups
+
+        # Number groups by first appearance, then sort rows stably by group
+        _, first_rows, group_ids = np.unique(group_ids, return_index=True, return_inverse=True)
+        rank = np.empty(len(first_rows), dtype=np.int64)
+        rank[np.argsort(first_rows, kind="stable")] = np.arange(len(first_rows))
+        group_ids = rank[group_ids.reshape(-1)]
+        order = np.argsort(group_ids, kind="stable")
+        starts = np.flatnonzero(np.diff(group_ids[order], prepend=-1))
+        self._groups = (order, starts)
+        return self._groups
+
+    def _factorize(self, np, item_name: str):
+        """Map an item's values to integer codes: (codes, number of distinct codes)."""
+        table, codes = _encoded_column(self._category, item_name)
+        if table is not None:
+            return codes.astype(np.int64), len(table)
+        values = self._category.column(item_name, dtype=str).data
+        distinct, codes = np.unique(values, return_inverse=True)
+        return codes.reshape(-1).astype(np.int64), len(distinct)
+
+    def __repr__(self):
+        return f"GroupBy({self._category.name}, keys={list(self._keys)})"
@@ -1,10 +1,17 @@
-from typing import Optional, List, Dict, Any
+import os
+from collections import deque
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+import msgpack
 from .parser import MMCIFParser
 from .writer import MMCIFWriter
 from .exporter import MMCIFExporter
 from .loaders import MMCIFImporter
-from .models import MMCIFDataContainer, DataSourceFormat
+from .models import MMCIFDataContainer, DataSourceFormat, EncodedItem, Item, PackedItem
 from .plugins import ValidatorFactory
+from .streaming import iter_category_rows, scan_catalogue, scan_header_text
+from .index import build_index, index_path_for
 
 
 class MMCIFHandler:
@@ -20,9 +27,19 @@ class MMCIFHandler:
         self._parser = None
         self._writer = None
         self._file_obj = None
+        self._executor = None
+        self._executor_workers = 0
 
     def parse(
-        self, filename: str, categories: Optional[List[str]] = None
+        self,
+        filename: str,
+        categories: Optional[List[str]] = None,
+        lazy: bool = False,
+        items: Optional[List[str]] = None,
+        row_filters: Optional[Dict[str, Any]] = None,
+        use_index: bool = True,
+        columnar: bool = False,
+        models: Optional[List[Any]] = None,
     ) -> MMCIFDataContainer:
         """
         Parses an mmCIF file and returns a data container using gemmi's high-performance backend.
@@ -31,12 +48,300 @@ class MMCIFHandler:
         :type filename: str
         :param categories: The categories to parse. If None, all categories are included.
         :type categories: Optional[List[str]]
+        :param lazy: If True, loop columns stay in the gemmi document until first accessed.
+        :type lazy: bool
+        :param items: Full item names to parse (e.g. "_atom_site.Cartn_x"). Only these
+            columns are converted for the categories they name; those categories are
+            parsed even when not listed in ``categories``.
+        :type items: Optional[List[str]]
+        :param row_filters: Row filters keyed by full item name, applied while loops
+            are converted (e.g. {"_atom_site.label_atom_id": "CA"} or
+            {"_atom_site.type_symbol": lambda v: v != "H"}).
+        :type row_filters: Optional[Dict[str, Any]]
+        :param use_index: If only some categories are parsed and the file has an
+            up-to-date sidecar index (see :meth:`build_index`), read only their bytes.
+        :type use_index: bool
+        :param columnar: If True, long loop columns are stored as contiguous buffers
+            (codes into a value table, or packed UTF-8 with offsets) and decoded to
+            lists only when a whole column is accessed.
+        :type columnar: bool
+        :param models: Model numbers to keep (e.g. [1]). Rows of other models are
+            dropped from every loop with a ``pdbx_PDB_model_num`` item while it is
+            converted.
+        :type models: Optional[List[Any]]
         :return: The data container with lazy-loaded items.
         :rtype: MMCIFDataContainer
         """
-        self._parser = MMCIFParser(self.validator_factory, categories)
+        self._parser = MMCIFParser(
+            self.validator_factory,
+            categories,
+            lazy=lazy,
+            items=items,
+            row_filters=row_filters,
+            use_index=use_index,
+            columnar=columnar,
+            models=models,
+        )
         return self._parser.parse_file(filename)
 
+    def iter_models(
+        self,
+        filename: str,
+        categories: Optional[List[str]] = None,
+        items: Optional[List[str]] = None,
+        columnar: bool = False,
+        models: Optional[List[Any]] = None,
+    ) -> Iterator[Tuple[str, MMCIFDataContainer]]:
+        """
+        Parses a multi-model file (e.g. an NMR ensemble) one model at a time.
+
+        The file is read once. Each yielded container holds one model's rows of
+        ``_atom_site`` (and of any other loop with a ``pdbx_PDB_model_num`` item);
+        the remaining categories are converted once and shared by all of them.
+        Only the current model's columns are held as Python values, so memory
+        stays bounded by the largest model rather than the whole ensemble.
+
+        :param filename: The name of the file to parse (may be compressed).
+        :type filename: str
+        :param categories: The categories to parse. If None, all categories are included.
+        :type categories: Optional[List[str]]
+        :param items: Full item names to parse, as for :meth:`parse`.
+        :type items: Optional[List[str]]
+        :param columnar: Store long loop columns as contiguous buffers, as for :meth:`parse`.
+        :type columnar: bool
+        :param models: Model numbers to yield. If None, every model is yielded.
+        :type models: Optional[List[Any]]
+        :return: Iterator of (model number, data container) pairs, in file order.
+        :rtype: Iterator[Tuple[str, MMCIFDataContainer]]
+        """
+        self._parser = MMCIFParser(
+            self.validator_factory,
+            categories,
+            items=items,
+            columnar=columnar,
+            models=models,
+        )
+        return self._parser.iter_models(filename)
+
+    def scan_header(
+        self,
+        filename: str,
+        categories: Optional[List[str]] = None,
+        max_loop_lines: int = 1000,
+    ) -> MMCIFDataContainer:
+        """
+        Parses only the header of an mmCIF file: key-value items and small loops.
+
+        Loops longer than ``max_loop_lines`` value lines (such as ``_atom_site``)
+        are skipped while the file is scanned and never tokenized, which makes this
+        suitable for cataloguing entry metadata across large mirrors.
+
+        :param filename: The name of the file to scan (may be compressed).
+        :type filename: str
+        :param categories: The categories to keep (e.g. ["_entry", "_struct"]).
+            If None, all key-value categories and small loops are included.
+        :type categories: Optional[List[str]]
+        :param max_loop_lines: Loops with more value lines than this are skipped.
+        :type max_loop_lines: int
+        :return: A data container with the header categories.
+        :rtype: MMCIFDataContainer
+        """
+        text = scan_header_text(filename, categories, max_loop_lines)
+        self._parser = MMCIFParser(self.validator_factory, categories)
+        return self._parser.parse_string(text)
+
+    def inspect(self, filename: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Lists the categories of each data block without building any Category objects.
+
+        For every category the result holds its ``row_count``, its ``items`` (names
+        without the category prefix) and its ``byte_ranges``: ``(start, end)`` offsets
+        into the file (the decompressed stream for compressed files) whose
+        concatenation, below a ``data_`` line, parses back to that category.
+
+        :param filename: The name of the file to inspect (may be compressed).
+        :type filename: str
+        :return: {block name: {category name: {"row_count", "items", "byte_ranges"}}}
+        :rtype: Dict[str, Dict[str, Dict[str, Any]]]
+        """
+        return scan_catalogue(filename)
+
+    def build_index(self, filename: str, index_path: Optional[str] = None) -> str:
+        """
+        Writes a sidecar byte-offset index for a file (``<filename>.slothidx``).
+
+        Later calls to :meth:`parse` with ``categories`` or ``items`` use it to read
+        only the bytes of those categories, for as long as the file's size,
+        modification time and sampled hash still match.
+
+        :param filename: The name of the file to index (may be compressed).
+        :type filename: str
+        :param index_path: Where to write the index. Defaults to next to the file.
+        :type index_path: Optional[str]
+        :return: The path of the index file.
+        :rtype: str
+        """
+        index_path = index_path or index_path_for(filename)
+        build_index(filename, index_path)
+        return index_path
+
+    def parse_many(
+        self,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        categories: Optional[List[str]] = None,
+        items: Optional[List[str]] = None,
+        ordered: bool = False,
+        errors: str = "raise",
+    ) -> Iterator[Tuple[str, Union[MMCIFDataContainer, Exception]]]:
+        """
+        Parses many mmCIF files on a persistent process pool.
+
+        Workers return each file as packed columns rather than pickled Category
+        objects; containers are rebuilt in this process as results arrive.
+        The pool is kept for later calls until :meth:`close` is called. Files
+        not yet started are cancelled when the iterator is closed or raises.
+
+        :param paths: The files to parse.
+        :type paths: Iterable[str]
+        :param workers: Number of worker processes (defaults to the CPU count).
+        :type workers: Optional[int]
+        :param categories: The categories to parse. If None, all categories are included.
+        :type categories: Optional[List[str]]
+        :param items: Full item names to parse (see :meth:`parse`).
+        :type items: Optional[List[str]]
+        :param ordered: Yield results in input order instead of completion order.
+        :type ordered: bool
+        :param errors: 'raise' to raise the first file's error, or 'return' to
+                       yield (path, exception) for files that cannot be parsed
+                       and carry on with the others.
+        :type errors: str
+        :return: Iterator of (path, container) pairs, or (path, exception) pairs
+                 with errors='return'.
+        :rtype: Iterator[Tuple[str, Union[MMCIFDataContainer, Exception]]]
+        """
+        if errors not in ("raise", "return"):
+            raise ValueError(f"Unknown errors mode '{errors}', expected 'raise' or 'return'")
+        executor = self._get_executor(workers)
+        # Bound the number of in-flight files so results never pile up unread
+        max_pending = self._executor_workers * 4
+        path_iter = iter(paths)
+        pending = deque() if ordered else {}
+
+        def submit_next() -> bool:
+            for path in path_iter:
+                future = executor.submit(_parse_to_columns, path, categories, items)
+                if ordered:
+                    pending.append((path, future))
+                else:
+                    pending[future] = path
+                return True
+            return False
+
+        def result(future) -> Union[MMCIFDataContainer, Exception]:
+            try:
+                return self._container_from_columns(future.result())
+            except Exception as e:
+                if errors == "raise":
+                    raise
+                return e
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        try:
+            while pending:
+                if ordered:
+                    path, future = pending.popleft()
+                    yield path, result(future)
+                    submit_next()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = pending.pop(future)
+                        yield path, result(future)
+                        submit_next()
+        finally:
+            # Closed early (or raised): drop the files no worker has started
+            for future in ([future for _, future in pending] if ordered else list(pending)):
+                future.cancel()
+
+    def iter_rows(
+        self,
+        filename: str,
+        category: str,
+        items: Optional[List[str]] = None,
+        chunk_size: int = 100_000,
+        backend: Optional[str] = None,
+        as_columns: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Streams the rows of one category in chunks without building a container.
+
+        Only the lines of the requested category are buffered, so memory stays
+        bounded by ``chunk_size`` regardless of the file size.
+
+        :param filename: The name of the file to read (may be compressed).
+        :type filename: str
+        :param category: The category to stream, e.g. '_atom_site'.
+        :type category: str
+        :param items: Item names to return, in this order. If None, all items are returned.
+        :type items: Optional[List[str]]
+        :param chunk_size: Maximum number of rows per chunk.
+        :type chunk_size: int
+        :param backend: Tokenizer to use, 'gemmi' or 'legacy' (defaults to gemmi when installed).
+        :type backend: Optional[str]
+        :param as_columns: Yield dicts of item name to values instead of lists of row tuples.
+        :type as_columns: bool
+        :return: Iterator of row chunks.
+        :rtype: Iterator[Any]
+        """
+        return iter_category_rows(
+            filename,
+            category,
+            items=items,
+            chunk_size=chunk_size,
+            backend=backend,
+            as_columns=as_columns,
+        )
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool used by :meth:`parse_many`, if any.
+
+        :return: None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+
+    def _get_executor(self, workers: Optional[int]) -> ProcessPoolExecutor:
+        """Return the persistent process pool, recreating it if the size changes."""
+        workers = workers or os.cpu_count() or 1
+        if self._executor is None or self._executor_workers != workers:
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+        return self._executor
+
+    def _container_from_columns(self, payload: bytes) -> MMCIFDataContainer:
+        """Rebuild a data container from the packed columns sent by a worker."""
+        parser = MMCIFParser(self.validator_factory)
+        container = MMCIFDataContainer()
+        for block_name, categories in msgpack.unpackb(payload, raw=False):
+            container[block_name] = parser._build_sloth_block(
+                block_name,
+                {
+                    category_name: {
+                        field_name: _column_from_payload(field_name, column)
+                        for field_name, column in zip(field_names, columns)
+                    }
+                    for category_name, field_names, columns in categories
+                },
+            )
+        return container
+
     def write(self, mmcif: MMCIFDataContainer) -> None:
         """
         Writes a data container to a file using gemmi's high-performance backend.
@@ -278,3 +583,55 @@ class MMCIFHandler:
     def file_obj(self, file_obj):
         """Sets the file object."""
         self._file_obj = file_obj
+
+
+def _parse_to_columns(
+    path: str, categories: Optional[List[str]], items: Optional[List[str]]
+) -> bytes:
+    """
+    Worker entry point for :meth:`MMCIFHandler.parse_many`.
+
+    Returns the file as msgpack-encoded ``[block, [[category, fields, columns]]]``
+    so only flat string lists and buffers cross the process boundary (see
+    :func:`_column_payload`).
+    """
+    parser = MMCIFParser(None, categories, items=items)
+    blocks = []
+    for gemmi_block in parser._read_document(path):
+        columns = parser._collect_block_columns(gemmi_block, categories)
+        blocks.append(
+            [
+                gemmi_block.name,
+                [
+                    [category_name, list(fields.keys()), [_column_payload(values) for values in fields.values()]]
+                    for category_name, fields in columns.items()
+                ],
+            ]
+        )
+    return msgpack.packb(blocks, use_bin_type=True)
+
+
+def _column_payload(values: Union[List[str], Item]) -> Any:
+    """
+    Make a converted column msgpack-serialisable.
+
+    Lists are sent as they are; dictionary-encoded and packed columns keep
+    their compact form as ``{"codes", "typecode", "table"}`` or
+    ``{"data", "offsets", "typecode"}`` maps of buffers.
+    """
+    if isinstance(values, EncodedItem) and not values.is_loaded:
+        return {"codes": values.codes.tobytes(), "typecode": values.codes.typecode, "table": values.table}
+    if isinstance(values, PackedItem) and not values.is_loaded:
+        return {"data": values._data, "offsets": values._offsets.tobytes(), "typecode": values._offsets.typecode}
+    if isinstance(values, Item):
+        return list(values.values)
+    return values
+
+
+def _column_from_payload(name: str, payload: Any) -> Union[List[str], Item]:
+    """Rebuild a column sent by :func:`_column_payload`."""
+    if not isinstance(payload, dict):
+        return payload
+    if "codes" in payload:
+        return EncodedItem(name, array(payload["typecode"], payload["codes"]), payload["table"])
+    return PackedItem(name, payload["data"], array(payload["typecode"], payload["offsets"]))
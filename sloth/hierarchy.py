@@ -0,0 +1,283 @@
+"""
+SLOTH Structure Hierarchy
+
+Model → chain → residue → atom navigation over an _atom_site category::
+
+    h = block.hierarchy()
+    ca = h["A"][42]["CA"]                 # Row of the CA atom of residue 42, chain A (first model)
+    for residue in h.model("2")["B"]:
+        b_factors = residue.atoms.column("B_iso_or_equiv", float)
+
+The hierarchy is built in one vectorised pass that finds where consecutive
+rows start a new residue. A residue is a range of row indices, and chains
+and models are lists of residues, so no per-atom objects are created.
+Model, Chain and Residue objects are small handles made on access; their
+``atoms`` are CategoryViews sharing the _atom_site columns.
+
+Residues are keyed by label_seq_id, or by auth_seq_id (plus any insertion
+code) where label_seq_id is unknown or inapplicable, as for waters and
+other non-polymer entities. Chains are keyed by label_asym_id and models by
+pdbx_PDB_model_num; files without a model number form a single model "1".
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from .models import HIERARCHY_ITEMS, Category, CategoryView, Row, _require_numpy
+from .selection import _encoded_column
+
+_NULL_VALUES = ("?", ".")
+
+
+class Hierarchy:
+    """
+    Models, chains and residues of an _atom_site category.
+
+    Build one with :meth:`DataBlock.hierarchy` or :meth:`Category.hierarchy`,
+    which cache it until a key item changes.
+    """
+
+    def __init__(self, atom_site: Category):
+        """
+        Build the hierarchy in one pass over the key items.
+
+        :param atom_site: The _atom_site category (or a view of it)
+        :raises KeyError: If label_asym_id, label_seq_id or label_atom_id is missing
+        """
+        for item_name in ("label_asym_id", "label_seq_id", "label_atom_id"):
+            if item_name not in atom_site.items:
+                raise KeyError(f"Item '{item_name}' not found in category '{atom_site.name}'")
+        np = _require_numpy()
+        self._atom_site = atom_site
+
+        row_count = atom_site.row_count
+        starts = np.zeros(0, dtype=np.int64)
+        if row_count:
+            new_residue = np.zeros(row_count, dtype=bool)
+            new_residue[0] = True
+            for item_name in HIERARCHY_ITEMS:
+                if item_name in atom_site.items:
+                    new_residue[1:] |= _changes(atom_site, item_name)
+            starts = np.flatnonzero(new_residue)
+        self._starts: List[int] = starts.tolist()
+        self._ends: List[int] = self._starts[1:] + [row_count]
+
+        # Models and chains: residue numbers grouped in order of first appearance
+        model_column = atom_site.get_item("pdbx_PDB_model_num") if "pdbx_PDB_model_num" in atom_site.items else None
+        chain_column = atom_site.get_item("label_asym_id")
+        self._models: Dict[str, Dict[str, List[int]]] = {}
+        # Residue key -> residue number per (model, chain), built on first lookup
+        self._residue_keys: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for residue, start in enumerate(self._starts):
+            model_id = model_column[start] if model_column is not None else "1"
+            chains = self._models.get(model_id)
+            if chains is None:
+                chains = self._models[model_id] = {}
+            residues = chains.get(chain_column[start])
+            if residues is None:
+                chains[chain_column[start]] = [residue]
+            else:
+                residues.append(residue)
+
+    @property
+    def atom_site(self) -> Category:
+        """The category the hierarchy indexes."""
+        return self._atom_site
+
+    @property
+    def models(self) -> List[str]:
+        """Model numbers, in file order."""
+        return list(self._models)
+
+    def model(self, model_id: Union[str, int]) -> "Model":
+        """
+        Return a model by its pdbx_PDB_model_num.
+
+        :raises KeyError: If there is no such model
+        """
+        model_id = str(model_id)
+        if model_id not in self._models:
+            raise KeyError(f"Model '{model_id}' not found")
+        return Model(self, model_id)
+
+    def __getitem__(self, chain_id: str) -> "Chain":
+        """Return a chain of the first model by its label_asym_id."""
+        if not self._models:
+            raise KeyError(chain_id)
+        return self.model(next(iter(self._models)))[chain_id]
+
+    def __iter__(self) -> Iterator["Model"]:
+        return (Model(self, model_id) for model_id in self._models)
+
+    def __len__(self) -> int:
+        """Number of models."""
+        return len(self._models)
+
+    @property
+    def residue_count(self) -> int:
+        """Number of residues over all models and chains."""
+        return len(self._starts)
+
+    def _rows(self, residues: List[int]):
+        """A slice or index array covering the rows of the given residues."""
+        first, last = residues[0], residues[-1]
+        if last - first + 1 == len(residues):
+            return slice(self._starts[first], self._ends[last])
+        np = _require_numpy()
+        return np.concatenate([np.arange(self._starts[r], self._ends[r]) for r in residues])
+
+    def __repr__(self):
+        return f"Hierarchy({len(self)} models, {self.residue_count} residues)"
+
+
+class Model:
+    """The chains of one model."""
+
+    def __init__(self, hierarchy: Hierarchy, model_id: str):
+        self._hierarchy = hierarchy
+        self._chains = hierarchy._models[model_id]
+        self.id = model_id
+
+    @property
+    def chains(self) -> List[str]:
+        """Chain ids (label_asym_id), in file order."""
+        return list(self._chains)
+
+    def __getitem__(self, chain_id: str) -> "Chain":
+        return Chain(self._hierarchy, self.id, chain_id)
+
+    def __contains__(self, chain_id: str) -> bool:
+        return chain_id in self._chains
+
+    def __iter__(self) -> Iterator["Chain"]:
+        return (Chain(self._hierarchy, self.id, chain_id) for chain_id in self._chains)
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+    @property
+    def atoms(self) -> CategoryView:
+        """The model's atoms as a view of _atom_site."""
+        residues = [residue for residues in self._chains.values() for residue in residues]
+        return self._hierarchy._atom_site.view(self._hierarchy._rows(residues))
+
+    def __repr__(self):
+        return f"Model({self.id}, {len(self)} chains)"
+
+
+class Chain:
+    """The residues of one chain in one model."""
+
+    def __init__(self, hierarchy: Hierarchy, model_id: str, chain_id: str):
+        self._hierarchy = hierarchy
+        self._residues = hierarchy._models[model_id][chain_id]
+        self.model_id = model_id
+        self.id = chain_id
+
+    def _residue_keys(self) -> Dict[str, int]:
+        """Map residue keys to residue numbers (built on first lookup, cached by the hierarchy)."""
+        hierarchy = self._hierarchy
+        keys = hierarchy._residue_keys.get((self.model_id, self.id))
+        if keys is None:
+            keys = hierarchy._residue_keys[(self.model_id, self.id)] = {}
+            for residue in self._residues:
+                keys.setdefault(_residue_key(hierarchy._atom_site, hierarchy._starts[residue]), residue)
+        return keys
+
+    @property
+    def residue_ids(self) -> List[str]:
+        """Residue keys (label_seq_id, or auth_seq_id for non-polymers), in file order."""
+        return list(self._residue_keys())
+
+    def __getitem__(self, residue_id: Union[str, int]) -> "Residue":
+        """Return a residue by label_seq_id (or auth_seq_id for non-polymers)."""
+        return Residue(self._hierarchy, self._residue_keys()[str(residue_id)])
+
+    def __contains__(self, residue_id: Union[str, int]) -> bool:
+        return str(residue_id) in self._residue_keys()
+
+    def __iter__(self) -> Iterator["Residue"]:
+        return (Residue(self._hierarchy, residue) for residue in self._residues)
+
+    def __len__(self) -> int:
+        return len(self._residues)
+
+    @property
+    def atoms(self) -> CategoryView:
+        """The chain's atoms as a view of _atom_site."""
+        return self._hierarchy._atom_site.view(self._hierarchy._rows(self._residues))
+
+    def __repr__(self):
+        return f"Chain({self.id}, {len(self)} residues)"
+
+
+class Residue:
+    """The atoms of one residue: a contiguous range of _atom_site rows."""
+
+    def __init__(self, hierarchy: Hierarchy, residue: int):
+        self._hierarchy = hierarchy
+        self.start = hierarchy._starts[residue]
+        self.end = hierarchy._ends[residue]
+
+    @property
+    def id(self) -> str:
+        """The residue key (label_seq_id, or auth_seq_id for non-polymers)."""
+        return _residue_key(self._hierarchy._atom_site, self.start)
+
+    @property
+    def name(self) -> Optional[str]:
+        """The residue name (label_comp_id), if present."""
+        atom_site = self._hierarchy._atom_site
+        if "label_comp_id" not in atom_site.items:
+            return None
+        return atom_site.get_item("label_comp_id")[self.start]
+
+    @property
+    def atom_names(self) -> List[str]:
+        """label_atom_id of each atom, in file order."""
+        names = self._hierarchy._atom_site.get_item("label_atom_id")
+        return [names[row] for row in range(self.start, self.end)]
+
+    def __getitem__(self, atom_name: str) -> Row:
+        """Return the (first) atom with this label_atom_id."""
+        names = self._hierarchy._atom_site.get_item("label_atom_id")
+        for row in range(self.start, self.end):
+            if names[row] == atom_name:
+                return self._hierarchy._atom_site[row]
+        raise KeyError(atom_name)
+
+    def __contains__(self, atom_name: str) -> bool:
+        return atom_name in self.atom_names
+
+    def __iter__(self) -> Iterator[Row]:
+        atom_site = self._hierarchy._atom_site
+        return (atom_site[row] for row in range(self.start, self.end))
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @property
+    def atoms(self) -> CategoryView:
+        """The residue's atoms as a view of _atom_site."""
+        return self._hierarchy._atom_site.view(slice(self.start, self.end))
+
+    def __repr__(self):
+        return f"Residue({self.name} {self.id}, {len(self)} atoms)"
+
+
+def _changes(category: Category, item_name: str):
+    """Boolean array: whether each row after the first differs from the previous one."""
+    table, codes = _encoded_column(category, item_name)
+    values = codes if table is not None else category.column(item_name, dtype=str).data
+    return values[1:] != values[:-1]
+
+
+def _residue_key(atom_site: Category, row: int) -> str:
+    """label_seq_id of a row, or auth_seq_id (with insertion code) if it is null."""
+    seq_id = atom_site.get_item("label_seq_id")[row]
+    if seq_id not in _NULL_VALUES or "auth_seq_id" not in atom_site.items:
+        return seq_id
+    seq_id = atom_site.get_item("auth_seq_id")[row]
+    if "pdbx_PDB_ins_code" in atom_site.items:
+        ins_code = atom_site.get_item("pdbx_PDB_ins_code")[row]
+        if ins_code not in _NULL_VALUES:
+            seq_id += ins_code
+    return seq_id
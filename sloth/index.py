@@ -0,0 +1,118 @@
+"""
+SLOTH Sidecar Index
+
+A persistent byte-offset index stored next to an mmCIF file (``1abc.cif`` ->
+``1abc.cif.slothidx``). It records where every category of every data block
+starts and ends, so selective parses can read just those bytes instead of
+tokenizing the whole file.
+
+An index is only used while it matches its file: the file size, modification
+time and a hash of sampled file regions are stored with it and checked on
+load. A stale or unreadable index is ignored.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Container, Dict, Optional, Union
+from .common import open_binary
+from .streaming import scan_catalogue
+
+INDEX_SUFFIX = ".slothidx"
+INDEX_VERSION = 1
+
+# The hash covers the file's start, end and evenly spaced regions in between
+_SAMPLE_SIZE = 64 * 1024
+_SAMPLE_COUNT = 16
+
+
+def index_path_for(file_path: Union[str, Path]) -> str:
+    """Return the sidecar index path for a file."""
+    return f"{file_path}{INDEX_SUFFIX}"
+
+
+def build_index(file_path: Union[str, Path], index_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Catalogue a file and write its sidecar index.
+
+    :param file_path: Path to the mmCIF file (may be compressed)
+    :param index_path: Where to write the index (default: next to the file)
+    :return: The index
+    """
+    index = dict(_file_signature(file_path), version=INDEX_VERSION)
+    index["blocks"] = scan_catalogue(file_path)
+    with open(index_path or index_path_for(file_path), "w") as f:
+        json.dump(index, f)
+    return index
+
+
+def load_index(file_path: Union[str, Path], index_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load the sidecar index of a file if it exists and still matches the file.
+
+    :param file_path: Path to the mmCIF file
+    :param index_path: Where the index is stored (default: next to the file)
+    :return: The index, or None if there is no usable index
+    """
+    index_path = index_path or index_path_for(file_path)
+    if not os.path.exists(index_path):
+        return None
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+
+    stat = os.stat(file_path)
+    if index.get("size") != stat.st_size or index.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    if index.get("hash") != _file_signature(file_path)["hash"]:
+        return None
+    return index
+
+
+def read_indexed_categories(
+    file_path: Union[str, Path], index: Dict[str, Any], categories: Container[str]
+) -> str:
+    """
+    Read only the given categories of every data block, using the index offsets.
+
+    :param file_path: Path to the mmCIF file
+    :param index: Index of the file, as returned by load_index()
+    :param categories: Category names to read
+    :return: mmCIF text with one data_ line per block followed by the category slices
+    """
+    parts = []
+    with open_binary(file_path) as f:
+        for block_name, block in index["blocks"].items():
+            parts.append(f"data_{block_name}\n".encode())
+            # Read in file order so compressed files only ever seek forward
+            ranges = sorted(
+                (start, end)
+                for name, info in block.items()
+                if name in categories
+                for start, end in info["byte_ranges"]
+            )
+            for start, end in ranges:
+                f.seek(start)
+                parts.append(f.read(end - start))
+    return b"".join(parts).decode("utf-8")
+
+
+def _file_signature(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Size, modification time and a hash of sampled regions of a file."""
+    stat = os.stat(file_path)
+    size = stat.st_size
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(file_path, "rb") as f:
+        if size <= _SAMPLE_SIZE * _SAMPLE_COUNT:
+            digest.update(f.read())
+        else:
+            step = (size - _SAMPLE_SIZE) // (_SAMPLE_COUNT - 1)
+            for i in range(_SAMPLE_COUNT):
+                f.seek(i * step)
+                digest.update(f.read(_SAMPLE_SIZE))
+    return {"size": size, "mtime_ns": stat.st_mtime_ns, "hash": digest.hexdigest()}
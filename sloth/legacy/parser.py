@@ -38,6 +38,50 @@ def fast_mmcif_split(line: str) -> List[str]:
         return line.split()
 
 
+def fast_tokenize_loop_line(line: str) -> List[str]:
+    """Ultra-fast tokenization optimized for loop value lines.
+
+    Follows the CIF rules: a quoted value ends at a matching quote followed
+    by whitespace (so it may be empty or contain the other quote), and a
+    '#' at the start of a token begins a comment running to the end of the line.
+    """
+    # Fast path: no quotes or comments means simple split works
+    if '"' not in line and "'" not in line and "#" not in line:
+        return line.split()
+
+    # Complex path: manual tokenization with quote handling
+    tokens = []
+    i = 0
+    line_len = len(line)
+
+    while i < line_len:
+        # Skip whitespace
+        while i < line_len and line[i].isspace():
+            i += 1
+        if i >= line_len or line[i] == "#":
+            break
+
+        start = i
+        if line[i] in ['"', "'"]:
+            # Quoted token: closed by the quote when whitespace (or the end) follows
+            quote = line[i]
+            i += 1
+            while i < line_len and not (
+                line[i] == quote and (i + 1 == line_len or line[i + 1].isspace())
+            ):
+                i += 1
+            # Extract without quotes
+            tokens.append(line[start + 1:i])
+            i += 1  # Skip closing quote
+        else:
+            # Unquoted token
+            while i < line_len and not line[i].isspace():
+                i += 1
+            tokens.append(line[start:i])
+
+    return tokens
+
+
 class MMCIFParser(BaseParser):
     """mmCIF parser with lazy loading for optimal performance."""
 
@@ -256,41 +300,4 @@ class MMCIFParser(BaseParser):
 
     def _fast_tokenize_loop_line(self, line: str) -> List[str]:
         """Ultra-fast tokenization optimized for loop value lines."""
-        # Fast path: no quotes means simple split works
-        if '"' not in line and "'" not in line:
-            return line.split()
-
-        # Complex path: manual tokenization with quote handling
-        tokens = []
-        i = 0
-        line_len = len(line)
-
-        while i < line_len:
-            # Skip whitespace
-            while i < line_len and line[i].isspace():
-                i += 1
-            if i >= line_len:
-                break
-
-            start = i
-            if line[i] in ['"', "'"]:
-                # Quoted token
-                quote = line[i]
-                i += 1
-                while i < line_len and line[i] != quote:
-                    if line[i] == "\\":
-                        i += 2  # Skip escaped char
-                    else:
-                        i += 1
-                if i < line_len:
-                    i += 1  # Skip closing quote
-                # Extract without quotes
-                if i > start + 1:
-                    tokens.append(line[start + 1:i - 1])
-            else:
-                # Unquoted token
-                while i < line_len and not line[i].isspace():
-                    i += 1
-                tokens.append(line[start:i])
-
-        return tokens
+        return fast_tokenize_loop_line(line)
@@ -1,14 +1,22 @@
 from typing import (
+    Any,
+    Callable,
     Dict,
+    Iterator,
     List,
+    Tuple,
     Union,
     Optional,
 )
+from collections import OrderedDict
 from functools import cached_property
+import weakref
 from enum import Enum, auto
 from abc import ABC, abstractmethod
+from array import array
+from itertools import accumulate
+from operator import itemgetter
 from .plugins import ValidatorFactory, CategoryValidator
-import sys
 
 
 class DataSourceFormat(Enum):
@@ -27,6 +35,9 @@ class DataSourceFormat(Enum):
 class DataNode(ABC):
     """Abstract base class for all data nodes in the hierarchy."""
 
+    # Lets slotted subclasses (Row) avoid a per-instance __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,17 +65,32 @@ class DataContainer(DataNode):
 
 
 class Item(DataNode):
-    """Represents a column/item in a category. Always uses eager loading."""
+    """
+    Represents a column/item in a category.
+
+    Values are either supplied up front or produced by a loader the first
+    time they are accessed (e.g. a column of a live gemmi document).
+    """
 
-    def __init__(self, name: str, values: Optional[List[str]] = None):
+    def __init__(
+        self,
+        name: str,
+        values: Optional[List[str]] = None,
+        loader: Optional[Callable[[], List[str]]] = None,
+        length: Optional[int] = None,
+    ):
         """
-        Initialize an Item with pre-loaded values.
+        Initialize an Item with pre-loaded values or a deferred loader.
 
         :param name: The name of the item
         :param values: Pre-loaded values
+        :param loader: Callable returning the values on first access
+        :param length: Number of values the loader will produce (avoids loading for len())
         """
         self._name = name
         self._values = values
+        self._loader = loader
+        self._length = length
 
     @property
     def name(self) -> str:
@@ -74,11 +100,22 @@ class Item(DataNode):
     @cached_property
     def values(self) -> List[str]:
         """Values with automatic caching via @cached_property."""
+        if self._values is None and self._loader is not None:
+            self._values = self._loader()
+            # Drop the loader so the source can be released once converted
+            self._loader = None
         if self._values is not None:
             return self._values
 
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the values have been materialised as Python strings."""
+        return self._loader is None
+
     def add_value(self, value: str) -> None:
         """Add a value directly (for small datasets or immediate loading)."""
+        if not self.is_loaded:
+            self.values
         if self._values is None:
             self._values = []
         self._values.append(value)
@@ -94,6 +131,8 @@ class Item(DataNode):
         """Get the number of values."""
         if self._values is not None:
             return len(self._values)
+        if self._length is not None:
+            return self._length
         return 0
 
     def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
@@ -101,17 +140,285 @@ class Item(DataNode):
         return self.values[index]
 
     def __repr__(self):
-        values_loaded = (
-            hasattr(self.__class__.__dict__["values"], "func")
-            and hasattr(self, "__dict__")
-            and "values" in self.__dict__
-        )
-        return f"Item(name='{self.name}', length={len(self)}, loaded={values_loaded})"
+        return f"Item(name='{self.name}', length={len(self)}, loaded={self.is_loaded})"
+
+
+class EncodedItem(Item):
+    """
+    An item stored as integer codes into a table of its distinct values.
+
+    Used for low-cardinality columns (element symbols, residue names, chain
+    ids, ...), see :func:`encode_values`. The codes are decoded to a list of
+    strings on first access to ``values``; the list shares the table's string
+    objects and replaces the codes from then on.
+    """
+
+    def __init__(self, name: str, codes: array, table: List[str]):
+        """
+        Initialize an EncodedItem.
+
+        :param name: The name of the item
+        :param codes: Unsigned integer codes, one per row
+        :param table: Distinct values, indexed by code
+        """
+        super().__init__(name, length=len(codes))
+        self._codes = codes
+        self._table = table
+
+    @cached_property
+    def values(self) -> List[str]:
+        """Values decoded from the codes on first access (and cached)."""
+        if self._codes is not None:
+            self._values = ItemValues(map(self._table.__getitem__, self._codes))
+            # The list may be edited in place, so it is the only copy kept
+            self._codes = None
+            self._table = None
+        return self._values
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the values have been decoded to Python strings."""
+        return self._codes is None
+
+    @property
+    def codes(self) -> Optional[array]:
+        """The integer codes, or None once the values have been decoded."""
+        return self._codes
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get value(s) by index; single values are read without decoding the column."""
+        if self._codes is not None and isinstance(index, int):
+            return self._table[self._codes[index]]
+        return self.values[index]
+
+    def __iter__(self):
+        """Iterate over values without decoding the column."""
+        if self._codes is not None:
+            return map(self._table.__getitem__, self._codes)
+        return iter(self._values)
+
+    @property
+    def table(self) -> Optional[List[str]]:
+        """The distinct values indexed by the codes, or None once decoded."""
+        return self._table
+
+    def __repr__(self):
+        table_size = len(self._table) if self._table is not None else None
+        return f"EncodedItem(name='{self.name}', length={len(self)}, distinct={table_size}, loaded={self.is_loaded})"
+
+
+class PackedItem(Item):
+    """
+    An item stored as one contiguous UTF-8 buffer plus an offsets array.
+
+    Values are NUL-separated in the buffer, so the whole column decodes with
+    a single ``split`` and a single value is one slice of the buffer; no
+    per-value string objects exist until ``values`` is first accessed. The
+    decoded list then replaces the buffer, as for :class:`EncodedItem`.
+    """
+
+    def __init__(self, name: str, data: bytes, offsets: array):
+        """
+        Initialize a PackedItem.
+
+        :param name: The name of the item
+        :param data: The values encoded as UTF-8 and joined by NUL bytes
+        :param offsets: Start offset of every value, plus the buffer length + 1
+        """
+        super().__init__(name, length=len(offsets) - 1)
+        self._data = data
+        self._offsets = offsets
+
+    @cached_property
+    def values(self) -> List[str]:
+        """Values decoded from the buffer on first access (and cached)."""
+        if self._data is not None:
+            self._values = ItemValues(self.decode())
+            # The list may be edited in place, so it is the only copy kept
+            self._data = None
+            self._offsets = None
+        return self._values
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the values have been decoded to Python strings."""
+        return self._data is None
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the buffer and offsets (0 once decoded)."""
+        if self._data is None:
+            return 0
+        return len(self._data) + len(self._offsets) * self._offsets.itemsize
+
+    def decode(self) -> List[str]:
+        """Decode all values into a new list, without caching it."""
+        if self._data is None:
+            return list(self._values)
+        if not self._data:
+            return [""] if len(self) else []
+        return self._data.decode("utf-8").split("\0")
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get value(s) by index; single values are read without decoding the column."""
+        if self._data is not None and isinstance(index, int):
+            length = len(self)
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                raise IndexError(f"Item index {index} is out of range")
+            start, end = self._offsets[index], self._offsets[index + 1] - 1
+            return self._data[start:end].decode("utf-8")
+        return self.values[index]
+
+    def __iter__(self):
+        """Iterate over values without caching the decoded column."""
+        return iter(self.decode() if self._data is not None else self._values)
+
+    def __repr__(self):
+        return f"PackedItem(name='{self.name}', length={len(self)}, nbytes={self.nbytes}, loaded={self.is_loaded})"
+
+
+class ViewItem(Item):
+    """
+    An item of a :class:`CategoryView`: another category's stored column read
+    through an array of row indices.
+
+    Single values and iteration go straight to the source column; ``values``
+    builds (and caches) a list of just the selected values.
+    """
+
+    def __init__(self, name: str, source: Union[List[str], Item], indices: array):
+        """
+        Initialize a ViewItem.
+
+        :param name: The name of the item
+        :param source: The parent category's stored column (list or Item)
+        :param indices: Row indices into the source, one per view row
+        """
+        super().__init__(name, length=len(indices))
+        self._source = source
+        self._indices = indices
+
+    @cached_property
+    def values(self) -> List[str]:
+        """The selected values as a list, built on first access (and cached)."""
+        if self._values is None:
+            self._values = ItemValues(map(self._source.__getitem__, self._indices))
+        return self._values
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the selected values have been copied into a list."""
+        return self._values is not None
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get value(s) by index; single values are read from the source column."""
+        if isinstance(index, int):
+            return self._source[self._indices[index]]
+        return self.values[index]
+
+    def __iter__(self):
+        """Iterate over the selected values without copying them."""
+        return map(self._source.__getitem__, self._indices)
+
+    def __repr__(self):
+        return f"ViewItem(name='{self.name}', length={len(self)}, loaded={self.is_loaded})"
+
+
+class ItemValues(list):
+    """
+    A value list produced by sloth itself (parsed, loaded or decoded values).
+
+    A plain list that tells the category storing it when it is edited in
+    place (``atom_site.Cartn_x[0] = "9.9"``, ``append``, ...), so typed
+    columns, coordinates, indexes and the dirty flag follow the edit. Lists
+    you assign to a category are stored as they are, see
+    :meth:`Category.__setitem__`.
+    """
+
+    __slots__ = ("_category", "_item_name")
+
+    def __init__(self, values=()):
+        super().__init__(values)
+        self._category = None
+        self._item_name = None
+
+    def _bind(self, category: "Category", item_name: str) -> bool:
+        """Report edits to ``category``; False if already bound to another one."""
+        owner = self._category() if self._category is not None else None
+        if owner is None:
+            self._category = weakref.ref(category)
+            self._item_name = item_name
+            return True
+        return owner is category and self._item_name == item_name
+
+    def _edited(self) -> None:
+        category = self._category() if self._category is not None else None
+        if category is not None:
+            category._item_edited(self._item_name)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._edited()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._edited()
+
+    def __iadd__(self, values):
+        super().__iadd__(values)
+        self._edited()
+        return self
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._edited()
+        return self
+
+    def append(self, value) -> None:
+        super().append(value)
+        self._edited()
+
+    def extend(self, values) -> None:
+        super().extend(values)
+        self._edited()
+
+    def insert(self, index, value) -> None:
+        super().insert(index, value)
+        self._edited()
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self._edited()
+        return value
+
+    def remove(self, value) -> None:
+        super().remove(value)
+        self._edited()
+
+    def clear(self) -> None:
+        super().clear()
+        self._edited()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._edited()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._edited()
+
+    def __reduce__(self):
+        # Pickles and copies are plain lists, detached from the category
+        return list, (list(self),)
 
 
 class Row(DataNode):
     """Represents a single row of data in a Category."""
 
+    __slots__ = ("_category", "_row_index")
+
     def __init__(self, category: "Category", row_index: int):
         self._category = category
         self._row_index = row_index
@@ -122,26 +429,29 @@ class Row(DataNode):
         if len(self._category.items) > 0:
             first_item = self._category.items[0]
             try:
-                return self._category[first_item][self._row_index]
+                return self._category.get_item(first_item)[self._row_index]
             except (IndexError, KeyError):
                 pass
         return str(self._row_index)
 
     def __getattr__(self, item_name: str) -> str:
         """Allow dot notation access to item values in this row."""
-        if item_name in self._category._items:
-            values = self._category[item_name]
-            if self._row_index < len(values):
-                return values[self._row_index]
-            raise IndexError(f"Row index {self._row_index} is out of range")
-        raise AttributeError(
-            f"'{self.__class__.__name__}' object has no attribute '{item_name}'"
-        )
+        try:
+            # Index the stored column directly so packed/encoded items stay undecoded
+            values = self._category._items[item_name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{item_name}'"
+            ) from None
+        try:
+            return values[self._row_index]
+        except IndexError:
+            raise IndexError(f"Row index {self._row_index} is out of range") from None
 
     def __getitem__(self, item_name: str) -> str:
         """Allow dictionary-style access to item values in this row."""
         if item_name in self._category._items:
-            values = self._category[item_name]
+            values = self._category._items[item_name]
             if self._row_index < len(values):
                 return values[self._row_index]
             raise KeyError(f"Item '{item_name}' at index {self._row_index} not found")
@@ -151,8 +461,7 @@ class Row(DataNode):
     def data(self) -> Dict[str, str]:
         """Return all item values for this row as a dictionary."""
         result = {}
-        for item_name in self._category.items:
-            values = self._category[item_name]
+        for item_name, values in self._category._items.items():
             if self._row_index < len(values):
                 result[item_name] = values[self._row_index]
         return result
@@ -162,12 +471,15 @@ class Row(DataNode):
 
 
 class LazyRowList:
-    """A list-like object that creates Row objects only when accessed."""
+    """A list-like object that creates Row objects only when accessed.
+
+    Indexed rows come from the category's bounded row cache; iteration
+    creates a fresh Row per index and keeps none of them.
+    """
 
     def __init__(self, category: "Category", row_count: int):
         self._category = category
         self._row_count = row_count
-        self._cached_rows: Dict[int, "Row"] = {}  # Cache created rows
 
     def __len__(self) -> int:
         return self._row_count
@@ -181,11 +493,7 @@ class LazyRowList:
                 raise IndexError(
                     f"Row index {index} is out of range (0-{self._row_count-1})"
                 )
-
-            # Return cached row or create new one
-            if index not in self._cached_rows:
-                self._cached_rows[index] = Row(self._category, index)
-            return self._cached_rows[index]
+            return self._category[index]
         elif isinstance(index, slice):
             # Handle slice access
             indices = range(*index.indices(self._row_count))
@@ -196,11 +504,12 @@ class LazyRowList:
             )
 
     def __iter__(self):
+        category = self._category
         for i in range(self._row_count):
-            yield self[i]
+            yield Row(category, i)
 
     def __repr__(self):
-        return f"LazyRowList({self._row_count} rows, {len(self._cached_rows)} cached)"
+        return f"LazyRowList({self._row_count} rows, {len(self._category._row_cache)} cached)"
 
 
 class LazyItemDict:
@@ -331,6 +640,14 @@ class Category(DataContainer):
         "_validator_factory",
         "_batch_buffer",
         "_row_cache",
+        "_column_cache",
+        "_indexes",
+        "_coords",
+        "_snapshots",
+        "_spatial_index",
+        "_hierarchy",
+        "_dirty",
+        "_source_block",
         "name",
         "validator_factory",
         "items",
@@ -348,7 +665,17 @@ class Category(DataContainer):
         self._items: Dict[str, Union[List[str], Item]] = {}
         self._validator_factory = validator_factory
         self._batch_buffer: Dict[str, List] = {}  # For batching value additions
-        self._row_cache: Dict[int, "Row"] = {}  # Cache for Row objects
+        self._row_cache: "OrderedDict[int, Row]" = OrderedDict()  # LRU cache of indexed rows
+        self._column_cache: Dict[Tuple[str, Any], Any] = {}  # Typed column arrays
+        # Hash indexes by item names; None until built by the first lookup
+        self._indexes: Dict[Tuple[str, ...], Optional[Dict[Any, Any]]] = {}
+        self._coords: Dict[str, Any] = {}  # N×3 coordinate arrays by dtype, see coords()
+        # Copies of untracked lists (see _check_untracked) taken when caches were built
+        self._snapshots: Dict[str, List[str]] = {}
+        self._spatial_index = None  # Cell list over the coordinates, see spatial_index()
+        self._hierarchy = None  # Model/chain/residue ranges, see hierarchy()
+        self._dirty = True  # Modified since parsing (always true for new categories)
+        self._source_block = None  # gemmi block the category was parsed from verbatim
 
     @property
     def name(self) -> str:
@@ -366,11 +693,7 @@ class Category(DataContainer):
 
     def __getattr__(self, item_name: str) -> Union[List[str], Item, CategoryValidator]:
         if item_name in self._items:
-            item = self._items[item_name]
-            # Return values for Item objects, the Item itself for direct access
-            if isinstance(item, Item):
-                return item.values
-            return item
+            return self._item_values(item_name)
         elif item_name == "validate":
             if self._validator_factory is None:
                 raise ValueError("No validator factory provided to this category")
@@ -407,14 +730,11 @@ class Category(DataContainer):
             )
 
         # Set as mmCIF item (equivalent to self[name] = value)
-        self._items[name] = value
-        # Invalidate cached properties when items change
-        if hasattr(self, "items"):
-            delattr(self, "items")
-        if hasattr(self, "data"):
-            delattr(self, "data")
-        if hasattr(self, "rows"):
-            delattr(self, "rows")
+        self._store(name, value)
+        # Invalidate cached properties when items change (without computing them)
+        for cached in ("items", "data", "rows"):
+            self.__dict__.pop(cached, None)
+        self._invalidate_column(name)
 
     def __getitem__(
         self, key: Union[str, int, slice]
@@ -427,8 +747,7 @@ class Category(DataContainer):
         """
         if isinstance(key, str):
             # Column access by item name
-            item = self._items[key]
-            return item.values if isinstance(item, Item) else item
+            return self._item_values(key)
         elif isinstance(key, int):
             # Row access by index - use caching to avoid recreating Row objects
             row_count = self.row_count
@@ -441,10 +760,16 @@ class Category(DataContainer):
             if key < 0 or key >= row_count:
                 raise IndexError(f"Row index {key} is out of range (0-{row_count-1})")
 
-            # OPTIMIZATION: Cache Row objects to avoid repeated creation
-            if key not in self._row_cache:
-                self._row_cache[key] = Row(self, key)
-            return self._row_cache[key]
+            # Recently indexed rows are reused; the cache is bounded so random
+            # access over a large category does not keep every Row alive
+            row = self._row_cache.get(key)
+            if row is None:
+                row = self._row_cache[key] = Row(self, key)
+                if len(self._row_cache) > _ROW_CACHE_SIZE:
+                    self._row_cache.popitem(last=False)
+            else:
+                self._row_cache.move_to_end(key)
+            return row
         elif isinstance(key, slice):
             # Multiple rows access by slice - use lazy approach
             row_count = self.row_count
@@ -460,14 +785,20 @@ class Category(DataContainer):
             )
 
     def __setitem__(self, item_name: str, value: Union[List[str], Item]) -> None:
-        self._items[item_name] = value
-        # Invalidate cached properties when items change
-        if hasattr(self, "items"):
-            delattr(self, "items")
-        if hasattr(self, "data"):
-            delattr(self, "data")
-        if hasattr(self, "rows"):
-            delattr(self, "rows")
+        """
+        Set an item's values.
+
+        The list (or Item) is stored as it is, so ``category[item_name]``
+        returns the same object and edits made through it are seen.
+
+        :param item_name: Name of the item
+        :param value: The values, a list of strings or an Item
+        """
+        self._store(item_name, value)
+        # Invalidate cached properties when items change (without computing them)
+        for cached in ("items", "data", "rows"):
+            self.__dict__.pop(cached, None)
+        self._invalidate_column(item_name)
 
     def __iter__(self):
         # Iterate over rows, not items, for user-facing API consistency
@@ -500,6 +831,383 @@ class Category(DataContainer):
         # Always use LazyRowList for consistent O(1) behavior and memory efficiency
         return LazyRowList(self, self.row_count)
 
+    def view(self, rows: Union[slice, List[int], Any]) -> "CategoryView":
+        """
+        Select rows without copying any values.
+
+        Unlike slicing (which returns a list of Row objects), the result is a
+        :class:`CategoryView` sharing this category's column storage; views
+        of views map straight onto the original columns.
+
+        :param rows: A slice, or row indices (a NumPy integer or boolean
+                     array, or a sequence of ints)
+        :return: A view of the selected rows
+        :raises IndexError: If a row index is out of range
+        """
+        return CategoryView(self, rows)
+
+    def create_index(self, items: Union[str, List[str], Tuple[str, ...]]) -> None:
+        """
+        Declare a hash index on one item or a combination of items.
+
+        The index is built on the first :meth:`lookup` that uses it and is
+        dropped (to be rebuilt on demand) when one of its items is replaced or
+        edited in place.
+
+        :param items: An item name (e.g. 'id') or a list of item names for a
+                      composite index (e.g. ['label_asym_id', 'label_seq_id', 'label_atom_id'])
+        :raises KeyError: If an item is not in the category
+        """
+        key_items = (items,) if isinstance(items, str) else tuple(items)
+        for item_name in key_items:
+            if item_name not in self._items:
+                raise KeyError(f"Item '{item_name}' not found in category '{self.name}'")
+        self._indexes.setdefault(key_items, None)
+
+    @property
+    def indexes(self) -> List[Tuple[str, ...]]:
+        """Item names of the declared hash indexes."""
+        return list(self._indexes)
+
+    def lookup(self, **values: str) -> List[Row]:
+        """
+        Find rows by item values through a hash index.
+
+        Uses the declared index on exactly these items (in any order),
+        creating one if there is none. Lookups after the first are O(1).
+
+        :param values: Item values to match, e.g. ``lookup(id="42")`` or
+                       ``lookup(label_asym_id="A", label_seq_id="10", label_atom_id="CA")``
+        :return: The matching rows (empty if none)
+        """
+        if not values:
+            raise ValueError("lookup() needs at least one item=value pair")
+        key_items = next(
+            (declared for declared in self._indexes if set(declared) == set(values)),
+            None,
+        )
+        if key_items is None:
+            key_items = tuple(values)
+            self.create_index(key_items)
+
+        self._check_untracked(key_items)
+        index = self._indexes[key_items]
+        if index is None:
+            index = self._indexes[key_items] = self._build_index(key_items)
+
+        if len(key_items) == 1:
+            rows = index.get(values[key_items[0]])
+        else:
+            rows = index.get(tuple(values[item_name] for item_name in key_items))
+        if rows is None:
+            return []
+        if isinstance(rows, int):
+            return [self[rows]]
+        return [self[row] for row in rows]
+
+    def _build_index(self, key_items: Tuple[str, ...]) -> Dict[Any, Any]:
+        """Map key values (a tuple for composite keys) to a row index, or a list of them."""
+        columns = [self._items[item_name] for item_name in key_items]
+        row_count = min(len(column) for column in columns)
+        keys = columns[0] if len(columns) == 1 else zip(*columns)
+
+        # Unique keys (the usual case for dictionary keys) map to a single row
+        index = dict(zip(keys, range(row_count)))
+        if len(index) == row_count:
+            return index
+
+        index = {}
+        keys = columns[0] if len(columns) == 1 else zip(*columns)
+        for row, key in zip(range(row_count), keys):
+            rows = index.get(key)
+            if rows is None:
+                index[key] = [row]
+            else:
+                rows.append(row)
+        return index
+
+    def cursor(self) -> Iterator[Row]:
+        """
+        Iterate over rows with a single reusable Row.
+
+        The same Row object is yielded at every step, moved to the next row
+        index, so a scan allocates nothing per row. Read what you need inside
+        the loop; keep ``row.data`` (not the Row) if a row must outlive it.
+
+        :return: Iterator yielding one Row, advanced in place
+        """
+        row = Row(self, 0)
+        for index in range(self.row_count):
+            row._row_index = index
+            yield row
+
+    def itertuples(self, items: Optional[List[str]] = None) -> Iterator[Tuple[str, ...]]:
+        """
+        Iterate over rows as plain tuples of values.
+
+        :param items: Item names giving the tuple fields, in order (default: all items)
+        :return: Iterator of tuples, one per row
+        """
+        columns = [self._items[item_name] for item_name in (items or list(self._items))]
+        return zip(*columns)
+
+    def select(self, expression: str) -> "CategoryView":
+        """
+        Select rows with an expression evaluated as bulk column operations.
+
+        The expression is compiled once and cached (see :mod:`sloth.selection`
+        for the syntax), e.g.
+        ``"label_asym_id == 'A' and label_atom_id in ('CA', 'CB') and B_iso_or_equiv > 30"``.
+
+        :param expression: The selection expression
+        :return: A view of the matching rows sharing this category's columns
+        :raises ValueError: If the expression is invalid or an item cannot be
+                            decoded as a number for a numeric comparison
+        :raises KeyError: If the expression names an item not in the category
+        """
+        _require_numpy()
+        from .selection import select_indices
+
+        return CategoryView(self, select_indices(self, expression))
+
+    def group_by(self, *items: str) -> "GroupBy":
+        """
+        Group rows by the values of one or more items for vectorised aggregation.
+
+        e.g. ``atom_site.group_by("label_asym_id", "label_seq_id").agg(B_iso_or_equiv="mean", id="count")``;
+        see :class:`sloth.grouping.GroupBy`.
+
+        :param items: Names of the key items
+        :return: A GroupBy over this category
+        :raises KeyError: If a key item is not in the category
+        """
+        from .grouping import GroupBy
+
+        return GroupBy(self, items)
+
+    def column(self, item_name: str, dtype=None, dictionary=None):
+        """
+        Return an item as a typed NumPy masked array decoded in bulk.
+
+        Unknown ('?') and inapplicable ('.') values are masked. The array is
+        read-only and cached until the item is replaced or the category's
+        data changes; edit values through the category, not the array.
+
+        :param item_name: Name of the item (e.g. 'Cartn_x')
+        :param dtype: Target type (float, int, str or a NumPy dtype). If None,
+                      the type is taken from the dictionary's _item_type code
+                      when a dictionary is given, and falls back to str.
+        :param dictionary: Optional object with ``get_item_type_code(item_name)``
+                           such as XMLMappingGenerator
+        :return: numpy.ma.MaskedArray of the decoded values
+        """
+        np = _require_numpy()
+
+        if dtype is None:
+            type_code = ""
+            if dictionary is not None:
+                type_code = dictionary.get_item_type_code(f"{self.name}.{item_name}")
+            dtype = _ITEM_TYPE_DTYPES.get(type_code, str)
+
+        cache_key = (item_name, np.dtype(dtype).str)
+        self._check_untracked((item_name,))
+        cached = self._column_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        item = self._items[item_name]
+        if np.dtype(dtype).kind in "iuf" and not isinstance(item, (EncodedItem, PackedItem)):
+            # Fast path: numbers without nulls convert straight from the values
+            try:
+                data = np.array(self[item_name], dtype=dtype)
+            except ValueError:
+                pass  # Nulls (or bad values): take the masked path below
+            else:
+                return self._cache_column(cache_key, data, np.zeros(len(data), dtype=bool))
+
+        if isinstance(item, EncodedItem) and not item.is_loaded:
+            # Decode the (small) table once and expand it through the codes
+            raw = np.asarray(item.table, dtype=str)
+            codes = np.frombuffer(item.codes, dtype=f"u{item.codes.itemsize}")
+        elif isinstance(item, PackedItem):
+            raw = np.asarray(item.decode(), dtype=str)
+            codes = None
+        else:
+            raw = np.asarray(self[item_name], dtype=str)
+            codes = None
+        mask = (raw == "?") | (raw == ".")
+        if np.dtype(dtype).kind in "iuf":
+            raw[mask] = "0"
+            try:
+                data = raw.astype(dtype)
+            except ValueError as e:
+                raise ValueError(
+                    f"Item '{self.name}.{item_name}' cannot be decoded as {np.dtype(dtype)}: {e}"
+                ) from e
+        else:
+            data = raw
+
+        if codes is not None:
+            data = data[codes]
+            mask = mask[codes]
+        return self._cache_column(cache_key, data, mask)
+
+    def _cache_column(self, cache_key: Tuple[str, str], data, mask):
+        """Freeze a decoded column and its null mask into a cached masked array."""
+        np = _require_numpy()
+        data.flags.writeable = False
+        mask.flags.writeable = False
+        array = np.ma.MaskedArray(data, mask=mask, copy=False)
+        self._column_cache[cache_key] = array
+        return array
+
+    def coords(self, dtype=float):
+        """
+        Return Cartn_x/Cartn_y/Cartn_z as one contiguous N×3 array.
+
+        The array is decoded in bulk, read-only, and cached until a coordinate
+        item is replaced (e.g. by :meth:`set_coords`) or edited in place, or
+        the category's data changes. Unknown ('?') and inapplicable ('.') coordinates are NaN.
+
+        :param dtype: Floating point type, float (float64) or numpy.float32
+        :return: C-contiguous numpy.ndarray of shape (row_count, 3)
+        :raises KeyError: If a coordinate item is missing
+        """
+        np = _require_numpy()
+        dtype = np.dtype(dtype)
+        if dtype.kind != "f":
+            raise ValueError(f"coords() needs a floating point dtype, not {dtype}")
+        self._check_untracked(COORDINATE_ITEMS)
+        cached = self._coords.get(dtype.str)
+        if cached is not None:
+            return cached
+
+        coordinates = np.empty((self.row_count, 3), dtype=dtype)
+        for axis, item_name in enumerate(COORDINATE_ITEMS):
+            column = self.column(item_name, dtype=dtype)
+            coordinates[:, axis] = column.data
+            coordinates[np.ma.getmaskarray(column), axis] = np.nan
+        coordinates.flags.writeable = False
+        self._coords[dtype.str] = coordinates
+        return coordinates
+
+    def set_coords(self, coordinates, decimals: int = 3) -> None:
+        """
+        Write an N×3 array back to Cartn_x/Cartn_y/Cartn_z in bulk.
+
+        Values are formatted with a fixed number of decimals (as in PDB
+        entries); NaN becomes unknown ('?'). Cached coordinate arrays and the
+        spatial index are invalidated.
+
+        :param coordinates: Array-like of shape (row_count, 3)
+        :param decimals: Digits after the decimal point
+        :raises ValueError: If the shape does not match the category
+        """
+        np = _require_numpy()
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.shape != (self.row_count, 3):
+            raise ValueError(
+                f"Coordinates of shape {coordinates.shape} do not match "
+                f"{self.row_count} rows of '{self.name}'; expected ({self.row_count}, 3)"
+            )
+        format_value = f"{{:.{decimals}f}}".format
+        for axis, item_name in enumerate(COORDINATE_ITEMS):
+            column = coordinates[:, axis]
+            values = list(map(format_value, column.tolist()))
+            for row in np.flatnonzero(np.isnan(column)).tolist():
+                values[row] = "?"
+            self[item_name] = values
+
+    def spatial_index(self, cell_size: Optional[float] = None) -> "SpatialIndex":
+        """
+        Return a cell list over the Cartn_x/Cartn_y/Cartn_z coordinates.
+
+        The index is cached until a coordinate item is replaced or edited in
+        place, or the category's data changes; see :class:`sloth.spatial.SpatialIndex` for
+        ``neighbors()`` and ``pairs_within()`` queries.
+
+        :param cell_size: Cell edge in Ångström (default: the cached index's,
+                          or sloth.spatial.DEFAULT_CELL_SIZE)
+        :return: The spatial index; rows with null coordinates are not indexed
+        """
+        _require_numpy()
+        from .spatial import DEFAULT_CELL_SIZE, SpatialIndex
+
+        self._check_untracked(COORDINATE_ITEMS)
+        index = self._spatial_index
+        if index is None or (cell_size is not None and cell_size != index.cell_size):
+            index = SpatialIndex.from_category(self, cell_size or DEFAULT_CELL_SIZE)
+            self._spatial_index = index
+        return index
+
+    def hierarchy(self) -> "Hierarchy":
+        """
+        Return the model → chain → residue → atom hierarchy of this _atom_site.
+
+        Residues are ranges of row indices found in one pass; the hierarchy is
+        cached until a key item (model number, chain or residue id) is
+        replaced or the category's data changes. See :mod:`sloth.hierarchy`.
+
+        :return: The hierarchy, e.g. ``hierarchy()["A"][42]["CA"]``
+        :raises KeyError: If label_asym_id, label_seq_id or label_atom_id is missing
+        """
+        self._check_untracked(HIERARCHY_ITEMS)
+        if self._hierarchy is None:
+            from .hierarchy import Hierarchy
+
+            self._hierarchy = Hierarchy(self)
+        return self._hierarchy
+
+    def _store(self, item_name: str, value: Union[List[str], Item]) -> None:
+        """Store an item as it is, binding sloth-produced value lists to this category."""
+        if type(value) is ItemValues:
+            value._bind(self, item_name)
+        self._items[item_name] = value
+        self._dirty = True
+
+    def _item_values(self, item_name: str) -> List[str]:
+        """An item's values (loading them), bound to this category if sloth produced them."""
+        item = self._items[item_name]
+        if not isinstance(item, Item):
+            return item
+        values = item.values
+        if type(values) is ItemValues:
+            values._bind(self, item_name)
+        return values
+
+    def _check_untracked(self, item_names) -> None:
+        """
+        Drop the caches of items whose edits this category cannot see.
+
+        Lists assigned by the caller (and lists shared with another category)
+        are stored as they are, so in-place edits to them are not reported.
+        Their values are compared with a copy taken when caches were last
+        built from them; a difference is treated like a reported edit.
+        """
+        for item_name in item_names:
+            values = self._items.get(item_name)
+            if isinstance(values, Item):
+                if not values.is_loaded or isinstance(values, ViewItem):
+                    continue  # Only reachable through the Item, which loads it
+                values = values.values
+            if values is None:
+                continue
+            if type(values) is ItemValues and values._bind(self, item_name):
+                continue
+            snapshot = self._snapshots.get(item_name)
+            if snapshot is not None and snapshot != values:
+                self._item_edited(item_name)
+                snapshot = None
+            if snapshot is None:
+                self._snapshots[item_name] = list(values)
+
+    def _item_edited(self, item_name: str) -> None:
+        """Called after an item's values were edited in place (see ItemValues)."""
+        self._dirty = True
+        self.__dict__.pop("rows", None)
+        self._row_cache.clear()
+        self._invalidate_column(item_name)
+
     def get_item(self, item_name: str) -> Union[Item, List[str]]:
         """Get the raw item (Item object or list), without forcing lazy loading."""
         return self._items[item_name]
@@ -508,6 +1216,22 @@ class Category(DataContainer):
         """Check if an item is lazy-loaded."""
         return isinstance(self._items.get(item_name), Item)
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the category was modified since it was parsed.
+
+        Categories built in code are always dirty. Assigning an item, or
+        editing a parsed item's values in place, marks a parsed category
+        dirty. MMCIFWriter copies clean parsed categories from the source
+        document instead of re-serialising them.
+        """
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Mark the category as modified, so writers re-serialise its values."""
+        self._dirty = True
+
     def _add_item_value(self, item_name: str, value: str) -> None:
         """Fast value addition for small files without memory mapping overhead."""
         # Use batching for better performance with pre-allocation
@@ -542,25 +1266,23 @@ class Category(DataContainer):
         if not values:
             return
 
-        # OPTIMIZATION: Apply string interning to reduce memory usage
-        interned_values = [intern_common_value(v) for v in values]
-
         if item_name not in self._items:
-            self._items[item_name] = interned_values
+            self._items[item_name] = values
         else:
             if isinstance(self._items[item_name], list):
-                self._items[item_name].extend(interned_values)
+                self._items[item_name].extend(values)
             else:
                 # Convert Item to list and extend
                 if hasattr(self._items[item_name], "values"):
                     existing_values = self._items[item_name].values[:]
                 else:
                     existing_values = []
-                existing_values.extend(interned_values)
+                existing_values.extend(values)
                 self._items[item_name] = existing_values
 
         # Clear the batch
         self._batch_buffer[item_name] = []
+        self._dirty = True
 
         # Invalidate caches when batch is committed
         self._invalidate_caches()
@@ -569,6 +1291,11 @@ class Category(DataContainer):
         """Commit all remaining batches at end of parsing."""
         for item_name in list(self._batch_buffer.keys()):
             self._commit_batch(item_name)
+        # Parsing is done: store low-cardinality columns dictionary-encoded
+        for item_name, values in self._items.items():
+            if isinstance(values, list):
+                self._items[item_name] = encode_values(item_name, values)
+        self._invalidate_caches()
 
     def _invalidate_caches(self) -> None:
         """Invalidate all cached properties when data changes."""
@@ -578,6 +1305,153 @@ class Category(DataContainer):
                 delattr(self, attr)
         # Also clear row cache
         self._row_cache.clear()
+        self._column_cache.clear()
+        for key_items in self._indexes:
+            self._indexes[key_items] = None
+        self._coords.clear()
+        self._snapshots.clear()
+        self._spatial_index = None
+        self._hierarchy = None
+
+    def _invalidate_column(self, item_name: str) -> None:
+        """Drop cached typed arrays and built indexes of a single item."""
+        self._snapshots.pop(item_name, None)
+        for key in [key for key in self._column_cache if key[0] == item_name]:
+            del self._column_cache[key]
+        for key_items in self._indexes:
+            if item_name in key_items:
+                self._indexes[key_items] = None
+        if item_name in COORDINATE_ITEMS:
+            self._coords.clear()
+            self._spatial_index = None
+        if item_name in HIERARCHY_ITEMS:
+            self._hierarchy = None
+
+
+class CategoryView(Category):
+    """
+    A selection of rows of a category that shares the category's storage.
+
+    Items are :class:`ViewItem` objects over the source category's stored
+    columns, so a view copies no values: rows, ``itertuples()``,
+    ``column()`` and further ``select()``/``view()`` calls read the source
+    data through the row indices. A view of a view maps its indices straight
+    onto the source, so chains of views never stack. Views reflect the
+    source columns as they were when the view was made.
+
+    Writing an item, or editing a list it returns (``view.id[0] = "x"``),
+    materialises the view in place: every item is copied into a plain list
+    and the view becomes an ordinary, independent category.
+    :meth:`materialize` returns such a copy and leaves the view untouched.
+    """
+
+    def __init__(self, parent: Category, rows):
+        """
+        Initialize a view of the given rows of a category.
+
+        :param parent: The category (or view) whose rows are selected
+        :param rows: A slice, or row indices into ``parent`` (a NumPy integer
+                     or boolean array, or a sequence of ints)
+        :raises IndexError: If a row index is out of range
+        """
+        super().__init__(parent.name, parent.validator_factory)
+        if isinstance(rows, slice):
+            if isinstance(parent, CategoryView) and not parent.is_materialized:
+                indices = parent._indices[rows]
+            else:
+                indices = array("q", range(*rows.indices(parent.row_count)))
+        else:
+            indices = _index_array(rows, parent.row_count)
+            if isinstance(parent, CategoryView) and not parent.is_materialized:
+                indices = array("q", map(parent._indices.__getitem__, indices))
+
+        sources = parent._items
+        if isinstance(parent, CategoryView) and not parent.is_materialized:
+            # Read the source category directly rather than through the parent view
+            sources = {item_name: item._source for item_name, item in parent._items.items()}
+            parent = parent._parent
+
+        self._parent = parent
+        self._indices: Optional[array] = indices
+        for item_name, source in sources.items():
+            self._items[item_name] = ViewItem(item_name, source, indices)
+
+    @property
+    def parent(self) -> Category:
+        """The category this view selects rows from (never itself a view)."""
+        return self._parent
+
+    @property
+    def indices(self) -> Optional[array]:
+        """Row indices into the parent, one per view row (None once materialised)."""
+        return self._indices
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the view has been written to and now holds its own values."""
+        return self._indices is None
+
+    @property
+    def row_count(self) -> int:
+        """Returns the number of selected rows."""
+        if self._indices is None:
+            return super().row_count
+        return len(self._indices)
+
+    def column(self, item_name: str, dtype=None, dictionary=None):
+        """Typed column of the selected rows, taken from the parent's cached column."""
+        if self._indices is None:
+            return super().column(item_name, dtype, dictionary)
+        np = _require_numpy()
+        parent_column = self._parent.column(item_name, dtype, dictionary)
+        cache_key = (item_name, parent_column.dtype.str)
+        cached = self._column_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        positions = np.frombuffer(self._indices, dtype=np.int64)
+        data = parent_column.data[positions]
+        mask = np.ma.getmaskarray(parent_column)[positions]
+        data.flags.writeable = False
+        mask.flags.writeable = False
+        array = np.ma.MaskedArray(data, mask=mask, copy=False)
+        self._column_cache[cache_key] = array
+        return array
+
+    def materialize(self) -> Category:
+        """Copy the selected rows into a new, independent Category."""
+        category = Category(self.name, self.validator_factory)
+        for item_name, item in self._items.items():
+            category[item_name] = list(item)
+        return category
+
+    def _materialize_in_place(self) -> None:
+        """Replace the shared columns with copies of the selected values."""
+        if self._indices is None:
+            return
+        for item_name, item in list(self._items.items()):
+            self._store(item_name, item.values)
+        self._indices = None
+        self._invalidate_caches()
+
+    def __setitem__(self, item_name: str, value: Union[List[str], Item]) -> None:
+        self._materialize_in_place()
+        super().__setitem__(item_name, value)
+
+    def _item_edited(self, item_name: str) -> None:
+        # The edited list is the view's own copy of the item: make it (and
+        # every other item) the view's storage, so all readers see the edit
+        self._materialize_in_place()
+        super()._item_edited(item_name)
+
+    def __setattr__(self, name: str, value) -> None:
+        if not (name.startswith("_") or name in self._RESERVED_ATTRS):
+            self._materialize_in_place()
+        super().__setattr__(name, value)
+
+    def __repr__(self):
+        state = "materialized" if self._indices is None else f"rows={self.row_count}"
+        return f"CategoryView(name={self.name}, {state}, items={list(self._items.keys())})"
 
 
 class CategoryCollection(dict):
@@ -635,10 +1509,12 @@ class DataBlock(DataContainer):
     """A class to represent a data block in an mmCIF file."""
 
     # Define attributes that should be handled as normal Python attributes
-    _RESERVED_ATTRS = {"_name", "_categories", "name", "categories", "data"}
+    _RESERVED_ATTRS = {"_name", "_categories", "_frames", "_dirty", "name", "categories", "data", "frames"}
 
     def __init__(self, name: str, categories: Dict[str, Category] = None):
         self._name = name
+        self._frames = SaveFrameCollection()
+        self._dirty = True  # Categories added, replaced or created since parsing
         # Convert categories to use CategoryCollection with stripped names
         if categories is not None:
             # Strip _ prefix from category names for internal storage
@@ -666,6 +1542,11 @@ class DataBlock(DataContainer):
         """Provides read-only access to the category objects."""
         return self._categories
 
+    @property
+    def frames(self) -> "SaveFrameCollection":
+        """Save frames of this block (e.g. dictionary definitions), each a DataBlock."""
+        return self._frames
+
     def __getitem__(self, category_name: str) -> Category:
         # Handle both prefixed (_category) and unprefixed (category) names
         return self._categories[category_name]
@@ -673,9 +1554,9 @@ class DataBlock(DataContainer):
     def __setitem__(self, category_name: str, category: Category) -> None:
         # Handle both prefixed (_category) and unprefixed (category) names
         self._categories[category_name] = category
+        self._dirty = True
         # Invalidate cached properties when categories change
-        if hasattr(self, "categories"):
-            delattr(self, "categories")
+        self.__dict__.pop("categories", None)
 
     def __getattr__(self, category_name: str) -> Category:
         try:
@@ -689,9 +1570,9 @@ class DataBlock(DataContainer):
                 self._categories[
                     category_name
                 ] = new_category  # CategoryCollection handles _ stripping
+                self._dirty = True
                 # Invalidate cached properties when categories change
-                if hasattr(self, "categories"):
-                    delattr(self, "categories")
+                self.__dict__.pop("categories", None)
                 return new_category
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{category_name}'"
@@ -726,13 +1607,28 @@ class DataBlock(DataContainer):
             self._categories[
                 name
             ] = value  # CategoryCollection handles _ stripping/adding
+            self._dirty = True
             # Invalidate cached properties when categories change
-            if hasattr(self, "categories"):
-                delattr(self, "categories")
+            self.__dict__.pop("categories", None)
         else:
             # Non-category attributes are handled normally
             super().__setattr__(name, value)
 
+    @property
+    def is_dirty(self) -> bool:
+        """Whether categories were added or replaced, or any category modified, since parsing."""
+        return self._dirty or any(category.is_dirty for category in self._categories.values())
+
+    def hierarchy(self, category_name: str = "_atom_site") -> "Hierarchy":
+        """
+        Return the model → chain → residue → atom hierarchy of the block's atoms.
+
+        :param category_name: The atom category (default: _atom_site)
+        :return: The category's cached hierarchy, see :meth:`Category.hierarchy`
+        :raises KeyError: If the block has no such category
+        """
+        return self._categories[category_name].hierarchy()
+
     def __iter__(self):
         return iter(self._categories.values())
 
@@ -744,61 +1640,118 @@ class DataBlock(DataContainer):
 
 
 class DataBlockCollection(dict):
-    """A collection that supports both dict and list access for data blocks, with automatic data_ prefix handling."""
+    """A collection that supports both dict and list access for data blocks, with automatic data_ prefix handling.
+
+    Blocks may be registered with a loader instead of a DataBlock (see
+    :meth:`set_loader`); the loader runs once, when the block is first accessed.
+    Block names can be listed without running any loader.
+    """
+
+    # Name prefix accepted on lookup and stripped for internal storage
+    _PREFIX = "data_"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaders: Dict[str, Callable[[], "DataBlock"]] = {}
+
+    def _strip_prefix(self, key):
+        if isinstance(key, str) and key.startswith(self._PREFIX):
+            return key[len(self._PREFIX):]
+        return key
+
+    def set_loader(self, key: str, loader: Callable[[], "DataBlock"]) -> None:
+        """Register a block whose DataBlock is built by ``loader`` on first access."""
+        internal_key = self._strip_prefix(key)
+        super().__setitem__(internal_key, None)
+        self._loaders[internal_key] = loader
+
+    def is_loaded(self, key: str) -> bool:
+        """Check whether a block has been converted (without converting it)."""
+        return self._strip_prefix(key) not in self.__dict__.get("_loaders", {})
+
+    def _load(self, internal_key: str) -> "DataBlock":
+        loaders = self.__dict__.get("_loaders")
+        if loaders and internal_key in loaders:
+            super().__setitem__(internal_key, loaders.pop(internal_key)())
+        return super().__getitem__(internal_key)
 
     def __getitem__(self, key):
         if isinstance(key, int):
             # List-like access: data[0], data[1], etc.
-            values_list = list(self.values())
-            return values_list[key]
+            return self._load(self.keys()[key])
         elif isinstance(key, slice):
             # Slice access: data[0:2], data[1:], etc.
-            values_list = list(self.values())
-            return values_list[key]
+            return [self._load(internal_key) for internal_key in self.keys()[key]]
         else:
             # Dict-like access with automatic data_ prefix handling
             if isinstance(key, str):
-                # If key starts with data_, strip it for internal storage lookup
-                if key.startswith("data_"):
-                    internal_key = key[5:]  # Remove the 'data_' prefix
-                    return super().__getitem__(internal_key)
-                else:
-                    # Allow access without data_ prefix too
-                    return super().__getitem__(key)
+                # Names are accepted with or without the data_ prefix
+                return self._load(self._strip_prefix(key))
             return super().__getitem__(key)
 
     def __setitem__(self, key, value):
-        if isinstance(key, str) and key.startswith("data_"):
-            # Strip the data_ prefix for internal storage
-            internal_key = key[5:]
-            super().__setitem__(internal_key, value)
-        else:
-            super().__setitem__(key, value)
+        # Strip the data_ prefix for internal storage
+        key = self._strip_prefix(key)
+        # An explicitly assigned block replaces any pending loader
+        self.__dict__.get("_loaders", {}).pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        key = self._strip_prefix(key)
+        self.__dict__.get("_loaders", {}).pop(key, None)
+        super().__delitem__(key)
 
     def __contains__(self, key):
-        if isinstance(key, str) and key.startswith("data_"):
-            # Strip the data_ prefix for internal storage lookup
-            internal_key = key[5:]
-            return super().__contains__(internal_key)
-        return super().__contains__(key)
+        # Strip the data_ prefix for internal storage lookup
+        return super().__contains__(self._strip_prefix(key))
 
     def __iter__(self):
         # Iterate over values (DataBlock objects) for consistency with list behavior
-        return iter(self.values())
+        for internal_key in self.keys():
+            yield self._load(internal_key)
 
     def keys(self):
         # Return stripped keys for internal use
         return list(super().keys())
 
+    def values(self):
+        return [self._load(internal_key) for internal_key in self.keys()]
+
+    def items(self):
+        return [(internal_key, self._load(internal_key)) for internal_key in self.keys()]
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
     def __repr__(self):
         return f"DataBlockCollection({len(self)} blocks)"
 
 
+class SaveFrameCollection(DataBlockCollection):
+    """Save frames of a data block, keyed by frame name with an optional save_ prefix.
+
+    Each frame is a DataBlock of its own and, when parsed from a file, is only
+    converted when first accessed.
+    """
+
+    _PREFIX = "save_"
+
+    def __repr__(self):
+        return f"SaveFrameCollection({len(self)} frames)"
+
+
 class MMCIFDataContainer(DataContainer):
     """A class to represent an mmCIF data container."""
 
     # Define attributes that should be handled as normal Python attributes
-    _RESERVED_ATTRS = {"_data_blocks", "source_format", "name", "blocks", "data"}
+    _RESERVED_ATTRS = {
+        "_data_blocks",
+        "_source_document",
+        "source_format",
+        "name",
+        "blocks",
+        "data",
+    }
 
     def __init__(
         self,
@@ -809,6 +1762,8 @@ class MMCIFDataContainer(DataContainer):
             data_blocks if data_blocks is not None else {}
         )
         self.source_format = source_format
+        # Parsed source document kept alive for lazily loaded items
+        self._source_document = None
 
     @property
     def name(self) -> str:
@@ -822,8 +1777,7 @@ class MMCIFDataContainer(DataContainer):
         # Handle both prefixed (data_block) and unprefixed (block) names
         self._data_blocks[block_name] = block
         # Invalidate cached properties when blocks change
-        if hasattr(self, "blocks"):
-            delattr(self, "blocks")
+        self.__dict__.pop("blocks", None)
 
     def __getattr__(self, block_name: str) -> DataBlock:
         if block_name.startswith("data_"):
@@ -835,8 +1789,7 @@ class MMCIFDataContainer(DataContainer):
                 new_block = DataBlock(actual_block_name)
                 self._data_blocks[actual_block_name] = new_block
                 # Invalidate cached properties when blocks change
-                if hasattr(self, "blocks"):
-                    delattr(self, "blocks")
+                self.__dict__.pop("blocks", None)
                 return new_block
         raise AttributeError(
             f"'{self.__class__.__name__}' object has no attribute '{block_name}'"
@@ -868,14 +1821,13 @@ class MMCIFDataContainer(DataContainer):
                 )
             self._data_blocks[block_name] = value
             # Invalidate cached properties when blocks change
-            if hasattr(self, "blocks"):
-                delattr(self, "blocks")
+            self.__dict__.pop("blocks", None)
         else:
             # Non-block attributes are handled normally
             super().__setattr__(name, value)
 
     def __iter__(self):
-        return iter(self._data_blocks.values())
+        return iter(self._data_blocks)
 
     def __len__(self):
         return len(self._data_blocks)
@@ -894,46 +1846,128 @@ class MMCIFDataContainer(DataContainer):
         return self._data_blocks
 
 
-# Common mmCIF value interning for memory efficiency
-_COMMON_VALUES = {
-    "ATOM",
-    "HETATM",
-    "C",
-    "N",
-    "O",
-    "P",
-    "S",
-    "CA",
-    "CB",
-    "CG",
-    "CD",
-    "CE",
-    "CF",
-    "A",
-    "B",
-    "X",
-    "Y",
-    "Z",
-    "1",
-    "2",
-    "3",
-    "4",
-    "5",
-    "6",
-    "7",
-    "8",
-    "9",
-    "0",
-    ".",
-    "?",
-    "yes",
-    "no",
-    "true",
-    "false",
+# Coordinate items of _atom_site (see Category.spatial_index)
+COORDINATE_ITEMS = ("Cartn_x", "Cartn_y", "Cartn_z")
+
+# Items of _atom_site whose change between rows starts a new residue (see Category.hierarchy)
+HIERARCHY_ITEMS = (
+    "pdbx_PDB_model_num",
+    "label_asym_id",
+    "label_seq_id",
+    "auth_seq_id",
+    "pdbx_PDB_ins_code",
+)
+
+# Number of indexed Row objects a Category keeps alive (least recently used are dropped)
+_ROW_CACHE_SIZE = 1024
+
+# Dictionary _item_type codes decoded as numbers by Category.column
+_ITEM_TYPE_DTYPES = {
+    "int": int,
+    "positive_int": int,
+    "float": float,
 }
-_INTERNED_VALUES = {val: sys.intern(val) for val in _COMMON_VALUES}
 
 
-def intern_common_value(value: str) -> str:
-    """Intern common mmCIF values to save memory."""
-    return _INTERNED_VALUES.get(value, value)
+def _require_numpy():
+    """Import NumPy, which typed column access needs."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for typed column access. Install it using 'pip install numpy'."
+        )
+    return numpy
+
+
+def _index_array(indices, row_count: int) -> array:
+    """
+    Convert row indices to an int64 array, checking them against ``row_count``.
+
+    :param indices: A NumPy integer or boolean array, or a sequence of ints
+    :param row_count: Number of rows the indices refer to
+    :return: The indices as ``array("q")``
+    :raises IndexError: If an index is out of range
+    """
+    if hasattr(indices, "astype"):
+        # NumPy arrays are checked and converted in bulk
+        if indices.dtype.kind == "b":
+            indices = indices.nonzero()[0]
+        low, high = (indices.min(), indices.max()) if len(indices) else (0, -1)
+        result = array("q", indices.astype("=i8", copy=False).tobytes())
+    else:
+        result = indices if isinstance(indices, array) and indices.typecode == "q" else array("q", indices)
+        low, high = (min(result), max(result)) if result else (0, -1)
+    if low < -row_count or high >= row_count:
+        raise IndexError(f"Row indices must be in range -{row_count}..{row_count - 1}")
+    return result
+
+
+# Dictionary encoding of low-cardinality columns (see encode_values)
+_ENCODE_MIN_ROWS = 1024  # shorter columns are kept as plain lists
+_ENCODE_SAMPLE_SIZE = 1024  # rows sampled to reject (nearly) unique columns
+_ENCODE_MAX_DISTINCT = 65536  # codes are stored as uint8 or uint16
+_ENCODE_MIN_REPEATS = 16  # each distinct value must occur this often on average
+
+
+def encode_values(name: str, values: List[str], pack: bool = False) -> Union[List[str], EncodedItem, PackedItem]:
+    """
+    Dictionary-encode a column if it has few distinct values.
+
+    The choice is made from the observed cardinality: columns that are
+    short, or whose distinct values are not repeated often enough to pay
+    for a table, are returned unchanged (or packed, see ``pack``).
+
+    :param name: The name of the item
+    :param values: The column values
+    :param pack: Store long columns that are not dictionary-encoded as a
+                 PackedItem instead of a list
+    :return: An EncodedItem, a PackedItem or ``values`` itself
+    """
+    row_count = len(values)
+    if row_count < _ENCODE_MIN_ROWS:
+        return values
+
+    # A strided sample rejects id-like columns without hashing every value,
+    # and usually already contains every distinct value
+    step = max(1, row_count // _ENCODE_SAMPLE_SIZE)
+    sample = dict.fromkeys(values[::step])
+    if len(sample) * 2 > row_count // step:
+        return pack_values(name, values) if pack else values
+    index = {value: code for code, value in enumerate(sample)}
+    try:
+        code_list = itemgetter(*values)(index)
+    except KeyError:
+        index = {value: code for code, value in enumerate(dict.fromkeys(values))}
+        code_list = itemgetter(*values)(index)
+
+    if len(index) > _ENCODE_MAX_DISTINCT or len(index) * _ENCODE_MIN_REPEATS > row_count:
+        return pack_values(name, values) if pack else values
+    if len(index) <= 256:
+        codes = array("B", bytes(code_list))  # bytes() converts ints in C
+    else:
+        codes = array("H", code_list)
+    return EncodedItem(name, codes, list(index))
+
+
+def pack_values(name: str, values: List[str]) -> Union[List[str], PackedItem]:
+    """
+    Pack a column into one UTF-8 buffer with an offsets array.
+
+    :param name: The name of the item
+    :param values: The column values
+    :return: A PackedItem, or ``values`` itself if a value contains a NUL character
+    """
+    text = "\0".join(values)
+    if text.count("\0") != len(values) - 1:
+        return values
+    data = text.encode("utf-8")
+    if len(data) == len(text):
+        lengths = map(len, values)
+    else:
+        lengths = map(len, map(str.encode, values))
+    offsets = array(
+        "I" if len(data) < 2**32 - 1 else "Q",
+        accumulate(map((1).__add__, lengths), initial=0),
+    )
+    return PackedItem(name, data, offsets)
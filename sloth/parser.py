@@ -8,10 +8,15 @@ The original pure Python implementation has been moved to sloth.legacy.parser
 for compatibility and reference purposes.
 """
 
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Set, Tuple, Callable, Any, IO, Iterable, Iterator
 from pathlib import Path
-from .models import MMCIFDataContainer, DataBlock, Category
-from .common import BaseParser
+import copy
+import operator
+from functools import partial
+from itertools import groupby
+from .models import MMCIFDataContainer, DataBlock, Category, Item, ItemValues, encode_values
+from .common import BaseParser, decompress_bytes, split_compression_suffix
+from .index import load_index, read_indexed_categories
 from .plugins import ValidatorFactory
 
 
@@ -27,57 +32,297 @@ class MMCIFParser(BaseParser):
         self,
         validator_factory: Optional[ValidatorFactory] = None,
         categories: Optional[List[str]] = None,
+        lazy: bool = False,
+        items: Optional[List[str]] = None,
+        row_filters: Optional[Dict[str, Any]] = None,
+        use_index: bool = True,
+        columnar: bool = False,
+        models: Optional[Iterable[Union[int, str]]] = None,
     ):
         """
         Initialize the MMCIFParser with gemmi backend.
         
         :param validator_factory: Optional validator factory for data validation
         :param categories: Optional list of categories to parse (for performance)
+        :param lazy: Keep the gemmi document alive and convert loop columns to
+                     Python strings only when they are first accessed
+        :param items: Optional list of full item names (e.g. '_atom_site.Cartn_x');
+                      only these columns are converted for the categories they name
+        :param row_filters: Optional mapping of full item name to a predicate
+                            (callable taking the raw value), a literal value
+                            (equality) or a list/tuple/set of values (membership).
+                            Rows failing any filter of their category are dropped
+                            during conversion.
+        :param use_index: When only some categories are parsed, read just their
+                          bytes if the file has an up-to-date sidecar index
+                          (see sloth.index)
+        :param columnar: Store every long loop column in a contiguous buffer
+                         (a dictionary-encoded table or packed UTF-8 with
+                         offsets) instead of a list of strings
+        :param models: Optional model numbers (pdbx_PDB_model_num) to keep; rows
+                       of other models are dropped while converting every loop
+                       that has a pdbx_PDB_model_num item
         """
         super().__init__(validator_factory, categories)
+        self.lazy = lazy
+        self.items = items
+        self.row_filters = row_filters
+        self.use_index = use_index
+        self.columnar = columnar
+        self.models = models
+        self._models = frozenset(str(model) for model in models) if models is not None else None
+        # Rows of the selected model per category, when already known (see iter_models)
+        self._model_rows: Optional[Dict[str, Union[range, List[int]]]] = None
+        self._item_projection = self._build_item_projection(items)
+        self._row_filters = self._build_row_filters(row_filters)
         
     def parse_file(self, file_path: Union[str, Path]) -> MMCIFDataContainer:
         """
         Parse mmCIF file using gemmi backend but return SLOTH data structures
         with the same elegant API.
         
+        Files ending in .gz, .bz2 or .xz are decompressed in memory. When only
+        some categories are requested and the file has a valid sidecar index,
+        only the bytes of those categories are read.
+        
         :param file_path: Path to mmCIF file
         :type file_path: Union[str, Path]
         :return: MMCIFDataContainer with same API as legacy SLOTH parser
         :rtype: MMCIFDataContainer
         """
-        # Use categories from instance initialization
-        parse_categories = self.categories
+        document = self._read_indexed_document(file_path) if self.use_index else None
+        if document is None:
+            document = self._read_document(file_path)
+        return self._convert_document(document)
+    
+    def parse_string(self, content: str) -> MMCIFDataContainer:
+        """
+        Parse mmCIF content held in memory as text.
+        
+        :param content: mmCIF text
+        :type content: str
+        :return: MMCIFDataContainer with same API as legacy SLOTH parser
+        :rtype: MMCIFDataContainer
+        """
+        gemmi = _require_gemmi()
+        return self._convert_document(gemmi.cif.read_string(content))
+    
+    def parse_bytes(self, data: bytes) -> MMCIFDataContainer:
+        """
+        Parse mmCIF content held in memory as bytes.
+        
+        gzip, bzip2 and xz payloads are recognised by their magic number and
+        decompressed in memory before parsing.
+        
+        :param data: Raw or compressed mmCIF bytes
+        :type data: bytes
+        :return: MMCIFDataContainer with same API as legacy SLOTH parser
+        :rtype: MMCIFDataContainer
+        """
+        gemmi = _require_gemmi()
+        return self._convert_document(gemmi.cif.read_string(decompress_bytes(data)))
+    
+    def parse_stream(self, stream: IO) -> MMCIFDataContainer:
+        """
+        Parse mmCIF content from an open file object (text or binary).
         
-        try:
-            import gemmi
-        except ImportError:
-            raise ImportError(
-                "gemmi is required for MMCIFParser. Install with: pip install gemmi\n"
-                "Or use the legacy parser: from sloth.legacy import MMCIFParser"
+        :param stream: File-like object positioned at the start of the content
+        :type stream: IO
+        :return: MMCIFDataContainer with same API as legacy SLOTH parser
+        :rtype: MMCIFDataContainer
+        """
+        content = stream.read()
+        if isinstance(content, str):
+            return self.parse_string(content)
+        return self.parse_bytes(content)
+    
+    def iter_models(self, file_path: Union[str, Path]) -> Iterator[Tuple[str, MMCIFDataContainer]]:
+        """
+        Parse a multi-model file one model at a time.
+
+        The file is tokenized once. Categories without a pdbx_PDB_model_num
+        item are converted once and shared by every yielded container; loops
+        with one (e.g. _atom_site) are converted for one model at a time, so
+        only that model's columns exist as Python values. A block without
+        model numbers is yielded once, as model "1". If the parser was
+        created with ``models``, only those models are yielded.
+
+        :param file_path: Path to mmCIF file
+        :return: Iterator of (model number, container holding one data block)
+        """
+        document = self._read_indexed_document(file_path) if self.use_index else None
+        if document is None:
+            document = self._read_document(file_path)
+
+        for gemmi_block in document:
+            # Selected loops that have a model number are converted per model
+            model_categories = {
+                category_name
+                for category_name in (
+                    self._extract_category_name(item.loop.tags[0])
+                    for item in gemmi_block
+                    if item.loop is not None and any(tag.endswith(_MODEL_SUFFIX) for tag in item.loop.tags)
+                )
+                if self._should_include_category(category_name, self.categories)
+            }
+            # Rows of each model, per category, from one pass over each model column
+            model_rows = {
+                category_name: _group_rows(gemmi_block.find_values(f"{category_name}{_MODEL_SUFFIX}"))
+                for category_name in model_categories
+            }
+            models = dict.fromkeys(model_rows.get("_atom_site", ()))
+            for rows_by_model in model_rows.values():
+                models.update(dict.fromkeys(rows_by_model))
+            if not models:
+                container = MMCIFDataContainer()
+                container[gemmi_block.name] = self._convert_gemmi_block_to_sloth(gemmi_block, self.categories)
+                if self.lazy:
+                    container._source_document = document
+                yield "1", container
+                continue
+
+            shared = self._build_sloth_block(
+                gemmi_block.name,
+                self._collect_block_columns(gemmi_block, self.categories, exclude=model_categories),
             )
+            self._retain_sources(shared, gemmi_block)
+
+            for model in models:
+                if self._models is not None and model not in self._models:
+                    continue
+                model_parser = copy.copy(self)
+                model_parser._models = frozenset((model,))
+                model_parser._model_rows = {
+                    category_name: rows_by_model.get(model, range(0))
+                    for category_name, rows_by_model in model_rows.items()
+                }
+                block = model_parser._build_sloth_block(
+                    gemmi_block.name,
+                    model_parser._collect_block_columns(gemmi_block, self.categories, only=model_categories),
+                )
+                for category_name in shared.data:
+                    block[category_name] = shared.data[category_name]
+                container = MMCIFDataContainer()
+                container[gemmi_block.name] = block
+                if self.lazy:
+                    container._source_document = document
+                yield model, container
+
+    def _read_document(self, file_path: Union[str, Path]):
+        """Read a (possibly compressed) mmCIF file into a gemmi Document"""
+        gemmi = _require_gemmi()
         
         # Convert Path to string if needed
         file_path_str = str(file_path)
         
-        # Use gemmi to parse the file
-        doc = gemmi.cif.read_file(file_path_str)
+        _, compression = split_compression_suffix(file_path_str)
+        if compression in (".bz2", ".xz"):
+            # gemmi only reads gzip natively; other codecs are unpacked in memory
+            with open(file_path_str, "rb") as f:
+                return gemmi.cif.read_string(decompress_bytes(f.read()))
+        
+        # Use gemmi to parse the file (gemmi handles .gz itself)
+        return gemmi.cif.read_file(file_path_str)
+    
+    def _read_indexed_document(self, file_path: Union[str, Path]):
+        """Read only the selected categories through the sidecar index, if there is one."""
+        selected = set(self.categories or ()) | set(self._item_projection)
+        if not selected:
+            return None
+        index = load_index(file_path)
+        if index is None:
+            return None
+        gemmi = _require_gemmi()
+        return gemmi.cif.read_string(read_indexed_categories(file_path, index, selected))
+    
+    def _convert_document(self, doc) -> MMCIFDataContainer:
+        """Convert a gemmi Document to an MMCIFDataContainer"""
+        # Use categories from instance initialization
+        parse_categories = self.categories
         
         # Convert gemmi structure to SLOTH format
         container = MMCIFDataContainer()
         
+        # Blocks are converted when first accessed; listing their names costs nothing
         for block in doc:
-            sloth_block = self._convert_gemmi_block_to_sloth(block, parse_categories)
-            container[block.name] = sloth_block
+            container.data.set_loader(
+                block.name,
+                partial(self._convert_gemmi_block_to_sloth, block, parse_categories),
+            )
+
+        if self.lazy:
+            # Lazy items read their columns from the document on first access
+            container._source_document = doc
             
         return container
     
     def _convert_gemmi_block_to_sloth(self, gemmi_block, categories: Optional[List[str]] = None) -> DataBlock:
         """Convert gemmi block to SLOTH DataBlock with same API"""
-        sloth_block = DataBlock(gemmi_block.name)
+        sloth_block = self._build_sloth_block(
+            gemmi_block.name, self._collect_block_columns(gemmi_block, categories)
+        )
+        self._retain_sources(sloth_block, gemmi_block)
+        
+        # Save frames are blocks of their own, converted when first accessed
+        for item in gemmi_block:
+            if item.frame is not None:
+                sloth_block.frames.set_loader(
+                    item.frame.name,
+                    partial(self._convert_gemmi_block_to_sloth, item.frame, categories),
+                )
+        
+        return sloth_block
+    
+    def _build_sloth_block(self, block_name: str, category_items: Dict[str, Dict[str, Union[List[str], Item]]]) -> DataBlock:
+        """Create a SLOTH DataBlock from {category name: {field name: values}}"""
+        sloth_block = DataBlock(block_name)
+        
+        for category_name, items in category_items.items():
+            sloth_category = Category(category_name, self.validator_factory)
+            
+            # Add all items to the category; parsed lists report in-place edits
+            for field_name, values in items.items():
+                if type(values) is list:
+                    values = ItemValues(values)
+                sloth_category[field_name] = values
+            
+            sloth_block[category_name] = sloth_category
         
+        return sloth_block
+    
+    def _retain_sources(self, sloth_block: DataBlock, gemmi_block) -> None:
+        """
+        Mark the block and its verbatim categories clean, keeping the gemmi block.
+
+        A category is verbatim when every item and row of it was converted (no
+        item projection, row filter or model selection applies to it); the
+        writer then copies it from the gemmi block until it is modified.
+        """
+        for category in sloth_block:
+            category_name = category.name
+            if category_name in self._item_projection or category_name in self._row_filters:
+                continue
+            if self._models is not None and len(gemmi_block.find_values(f"{category_name}{_MODEL_SUFFIX}")):
+                continue
+            category._source_block = gemmi_block
+            category._dirty = False
+        sloth_block._dirty = False
+
+    def _collect_block_columns(
+        self,
+        gemmi_block,
+        categories: Optional[List[str]] = None,
+        only: Optional[Set[str]] = None,
+        exclude: Set[str] = frozenset(),
+    ) -> Dict[str, Dict[str, Union[List[str], Item]]]:
+        """Convert a gemmi block to {category name: {field name: values}}
+
+        ``only`` and ``exclude`` further restrict the converted categories
+        (used to convert per-model loops separately from the rest).
+        """
         # Collect all category names and their items
         category_items = {}
+        pair_categories = set()
         
         for item in gemmi_block:
             if item.pair:
@@ -86,14 +331,21 @@ class MMCIFParser(BaseParser):
                 category_name = self._extract_category_name(tag)
                 
                 # Apply category filtering if specified
-                if categories and category_name not in categories:
+                if not self._should_include_category(category_name, categories):
+                    continue
+                if category_name in exclude or (only is not None and category_name not in only):
+                    continue
+                
+                field_name = self._extract_field_name(tag)
+                fields = self._item_projection.get(category_name)
+                if fields is not None and field_name not in fields:
                     continue
                 
                 if category_name not in category_items:
                     category_items[category_name] = {}
                 
-                field_name = self._extract_field_name(tag)
                 category_items[category_name][field_name] = [str(value)]
+                pair_categories.add(category_name)
                 
             elif item.loop:
                 # This is a loop/table
@@ -107,35 +359,163 @@ class MMCIFParser(BaseParser):
                 category_name = self._extract_category_name(tags[0])
                 
                 # Apply category filtering if specified
-                if categories and category_name not in categories:
+                if not self._should_include_category(category_name, categories):
+                    continue
+                if category_name in exclude or (only is not None and category_name not in only):
                     continue
                     
-                if category_name not in category_items:
-                    category_items[category_name] = {}
-                
-                # Process loop data
-                for i, tag in enumerate(tags):
-                    field_name = self._extract_field_name(tag)
-                    column_data = []
-                    
-                    # Extract column data
-                    for row_idx in range(loop.length()):
-                        value = loop[row_idx, i]
-                        column_data.append(str(value))
-                    
-                    category_items[category_name][field_name] = column_data
+                columns = self._convert_gemmi_loop(gemmi_block, loop, category_name)
+                if columns:
+                    category_items.setdefault(category_name, {}).update(columns)
         
-        # Create SLOTH categories
-        for category_name, items in category_items.items():
-            sloth_category = Category(category_name, self.validator_factory)
-            
-            # Add all items to the category
-            for field_name, values in items.items():
-                sloth_category[field_name] = values
-            
-            sloth_block[category_name] = sloth_category
+        # Single-row (pair) categories are filtered once all their values are known
+        for category_name in pair_categories & self._row_filters.keys():
+            if not self._pair_row_passes(gemmi_block, category_name):
+                category_items[category_name] = {
+                    field_name: [] for field_name in category_items[category_name]
+                }
         
-        return sloth_block
+        return category_items
+    
+    def _convert_gemmi_loop(self, gemmi_block, loop, category_name: str) -> Dict[str, Union[List[str], Item]]:
+        """Convert the (projected) columns of a gemmi loop to SLOTH item values"""
+        tags = loop.tags
+        width = loop.width()
+        fields = self._item_projection.get(category_name)
+        selected = [
+            (i, tag, self._extract_field_name(tag))
+            for i, tag in enumerate(tags)
+            if fields is None or self._extract_field_name(tag) in fields
+        ]
+        
+        columns = {}
+        length = loop.length()
+        filters = self._row_filters.get(category_name)
+        by_model = self._models is not None and any(tag.endswith(_MODEL_SUFFIX) for tag in tags)
+        rows = None
+        if by_model:
+            if self._model_rows is not None and category_name in self._model_rows:
+                rows = self._model_rows[category_name]
+            else:
+                # Model selection is a row filter on the loop's model number
+                filters = (filters or []) + [("pdbx_PDB_model_num", self._models.__contains__)]
+        if filters:
+            rows = self._filter_loop_rows(gemmi_block, loop, filters, rows)
+        if rows is not None:
+            if self.lazy:
+                for _, tag, field_name in selected:
+                    columns[field_name] = Item(
+                        field_name,
+                        loader=partial(_read_gemmi_column, gemmi_block, tag, rows),
+                        length=len(rows),
+                    )
+            elif by_model or len(rows) * 4 < length:
+                # Few survivors (or one model): fetch only the cells of the kept rows
+                for _, tag, field_name in selected:
+                    columns[field_name] = _read_gemmi_column(gemmi_block, tag, rows)
+            else:
+                values = loop.values
+                for i, _, field_name in selected:
+                    column = values[i::width]
+                    columns[field_name] = [column[row] for row in rows]
+        elif self.lazy:
+            # Defer conversion: each item reads its own gemmi column
+            for _, tag, field_name in selected:
+                columns[field_name] = Item(
+                    field_name,
+                    loader=partial(_read_gemmi_column, gemmi_block, tag),
+                    length=length,
+                )
+        elif len(selected) * 2 <= width:
+            # Narrow projection: read only the requested gemmi columns
+            for _, tag, field_name in selected:
+                columns[field_name] = _read_gemmi_column(gemmi_block, tag)
+        else:
+            # Pull the whole value buffer out of gemmi in one call and
+            # slice it into columns (values are stored row-major)
+            values = loop.values
+            for i, _, field_name in selected:
+                columns[field_name] = values[i::width]
+        if not self.lazy:
+            # Low-cardinality columns are kept as codes into a value table
+            for field_name, values in columns.items():
+                columns[field_name] = encode_values(field_name, values, pack=self.columnar)
+        return columns
+    
+    def _filter_loop_rows(
+        self,
+        gemmi_block,
+        loop,
+        filters: List[Tuple[str, Callable[[str], bool]]],
+        rows: Optional[Union[range, List[int]]] = None,
+    ) -> List[int]:
+        """Return indices of loop rows (of ``rows``, default all) passing all filters, reading only the filtered columns"""
+        category_name = self._extract_category_name(loop.tags[0])
+        present = {self._extract_field_name(tag) for tag in loop.tags}
+        if rows is None:
+            rows = range(loop.length())
+        for field_name, predicate in filters:
+            if field_name in present:
+                column = _read_gemmi_column(gemmi_block, f"{category_name}.{field_name}")
+                rows = [row for row in rows if predicate(column[row])]
+            elif not predicate("?"):
+                # A missing item is treated as unknown ('?') for every row
+                return []
+        return list(rows)
+    
+    def _pair_row_passes(self, gemmi_block, category_name: str) -> bool:
+        """Check the single row of a key-value category against its filters"""
+        for field_name, predicate in self._row_filters[category_name]:
+            value = gemmi_block.find_value(f"{category_name}.{field_name}")
+            if not predicate("?" if value is None else str(value)):
+                return False
+        return True
+    
+    def _build_row_filters(self, row_filters: Optional[Dict[str, Any]]) -> Dict[str, List[Tuple[str, Callable[[str], bool]]]]:
+        """Group row filters into {category name: [(field name, predicate)]}"""
+        filters: Dict[str, List[Tuple[str, Callable[[str], bool]]]] = {}
+        for item_name, condition in (row_filters or {}).items():
+            if not item_name.startswith('_'):
+                item_name = f"_{item_name}"
+            if '.' not in item_name:
+                raise ValueError(
+                    f"Row filter '{item_name}' must use a full item name like '_atom_site.label_atom_id'"
+                )
+            if callable(condition):
+                predicate = condition
+            elif isinstance(condition, (list, tuple, set, frozenset)):
+                predicate = frozenset(condition).__contains__
+            else:
+                predicate = partial(operator.eq, condition)
+            filters.setdefault(self._extract_category_name(item_name), []).append(
+                (self._extract_field_name(item_name), predicate)
+            )
+        return filters
+    
+    def _should_include_category(self, category_name: str, categories: Optional[List[str]]) -> bool:
+        """Check a category against the category filter and item projection"""
+        if not categories and not self._item_projection:
+            return True
+        return bool(
+            (categories and category_name in categories)
+            or category_name in self._item_projection
+        )
+    
+    def _build_item_projection(self, items: Optional[List[str]]) -> Dict[str, Set[str]]:
+        """Group full item names into {category name: {field names}}"""
+        projection: Dict[str, Set[str]] = {}
+        for item_name in items or []:
+            if not item_name.startswith('_'):
+                item_name = f"_{item_name}"
+            if '.' not in item_name:
+                raise ValueError(
+                    f"Item '{item_name}' must be a full item name like '_atom_site.Cartn_x'"
+                )
+            category_name = self._extract_category_name(item_name)
+            projection.setdefault(category_name, set()).add(
+                self._extract_field_name(item_name)
+            )
+        return projection
     
     def _extract_category_name(self, tag: str) -> str:
         """Extract category name from mmCIF tag (e.g., '_atom_site.id' -> '_atom_site')"""
@@ -148,3 +528,50 @@ class MMCIFParser(BaseParser):
         if '.' in tag:
             return tag.split('.', 1)[1]
         return tag
+
+
+# Tag suffix of the model number item (as in _atom_site.pdbx_PDB_model_num)
+_MODEL_SUFFIX = ".pdbx_PDB_model_num"
+
+
+def _group_rows(column) -> Dict[str, Union[range, List[int]]]:
+    """
+    Group row indices by value in one pass over a column.
+
+    Models are normally stored one after the other, so each value's rows are
+    usually a single run and are returned as a range; values spread over
+    several runs get a list.
+    """
+    groups: Dict[str, Union[range, List[int]]] = {}
+    start = 0
+    for value, run in groupby(column):
+        end = start + len(list(run))
+        rows = groups.get(value)
+        if rows is None:
+            groups[value] = range(start, end)
+        elif isinstance(rows, range):
+            groups[value] = [*rows, *range(start, end)]
+        else:
+            rows.extend(range(start, end))
+        start = end
+    return groups
+
+
+def _require_gemmi():
+    """Import gemmi, pointing at the legacy parser if it is unavailable."""
+    try:
+        import gemmi
+    except ImportError:
+        raise ImportError(
+            "gemmi is required for MMCIFParser. Install with: pip install gemmi\n"
+            "Or use the legacy parser: from sloth.legacy import MMCIFParser"
+        )
+    return gemmi
+
+
+def _read_gemmi_column(gemmi_block, tag: str, rows: Optional[List[int]] = None) -> List[str]:
+    """Materialise a gemmi loop column (optionally only some rows) as Python strings."""
+    column = gemmi_block.find_values(tag)
+    if rows is None:
+        return ItemValues(column)
+    return ItemValues(map(column.__getitem__, rows))
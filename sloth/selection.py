@@ -0,0 +1,217 @@
+"""
+SLOTH Selection Expressions
+
+A small, Python-like language for selecting rows of a category, e.g.::
+
+    atom_site.select("label_asym_id == 'A' and label_atom_id in ('CA', 'CB') and B_iso_or_equiv > 30")
+
+An expression is parsed once into a tree of NumPy column operations and
+cached by its text. Evaluating it produces a boolean mask over all rows of a
+category with bulk column comparisons; no Python code runs per row.
+
+Supported syntax: item names compared with literals (``==``, ``!=``, ``<``,
+``<=``, ``>``, ``>=``, chained as in ``10 < B_iso_or_equiv <= 30``), ``in``
+and ``not in`` with a tuple or list of literals, ``and``, ``or``, ``not`` and
+parentheses. Numeric literals compare the item as numbers and never match
+unknown ('?') or inapplicable ('.') values; string literals compare the raw
+values.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Tuple
+
+# A compiled expression: category -> boolean NumPy array, one value per row
+Selector = Callable[[Any], Any]
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+# The comparison to apply when the literal is on the left (5 < x  ->  x > 5)
+_MIRRORED = {
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+
+@lru_cache(maxsize=256)
+def compile_selection(expression: str) -> Selector:
+    """
+    Compile a selection expression (cached by its text).
+
+    :param expression: The expression, e.g. "label_atom_id == 'CA' and occupancy < 1"
+    :return: A function mapping a category to a boolean NumPy array
+    :raises ValueError: If the expression is not valid selection syntax
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid selection expression '{expression}': {e.msg}") from None
+    return _compile_node(tree.body, expression)
+
+
+def select_indices(category, expression: str):
+    """
+    Evaluate a selection expression on a category.
+
+    :param category: The category (or view) to select rows from
+    :param expression: The selection expression
+    :return: Sorted NumPy array of the selected row indices
+    """
+    import numpy as np
+
+    return np.flatnonzero(compile_selection(expression)(category))
+
+
+def _compile_node(node: ast.AST, expression: str) -> Selector:
+    """Translate one expression node into a mask-producing function."""
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value, expression) for value in node.values]
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+
+        def evaluate_bool(category):
+            mask = operands[0](category)
+            for operand in operands[1:]:
+                mask = combine(mask, operand(category))
+            return mask
+
+        return evaluate_bool
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_node(node.operand, expression)
+        return lambda category: ~operand(category)
+
+    if isinstance(node, ast.Compare):
+        # a < b < c is (a < b) and (b < c)
+        operands = [node.left] + node.comparators
+        tests = [
+            _compile_comparison(left, op, right, expression)
+            for left, op, right in zip(operands, node.ops, operands[1:])
+        ]
+        if len(tests) == 1:
+            return tests[0]
+
+        def evaluate_chain(category):
+            mask = tests[0](category)
+            for test in tests[1:]:
+                mask = mask & test(category)
+            return mask
+
+        return evaluate_chain
+
+    raise ValueError(
+        f"Unsupported syntax in selection expression '{expression}': "
+        f"{ast.get_source_segment(expression.strip(), node) or type(node).__name__}"
+    )
+
+
+def _compile_comparison(left: ast.AST, op: ast.cmpop, right: ast.AST, expression: str) -> Selector:
+    """Compile ``item <op> literal`` (or ``literal <op> item``)."""
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if not isinstance(left, ast.Name):
+            raise ValueError(f"'in' needs an item name on the left in '{expression}'")
+        literals = _literal_sequence(right, expression)
+        return _membership(left.id, literals, isinstance(op, ast.NotIn))
+
+    if type(op) not in _COMPARISONS:
+        raise ValueError(f"Unsupported comparison in selection expression '{expression}'")
+    if isinstance(left, ast.Name):
+        item_name, literal = left.id, _literal(right, expression)
+    elif isinstance(right, ast.Name):
+        item_name, literal = right.id, _literal(left, expression)
+        op = _MIRRORED[type(op)]()
+    else:
+        raise ValueError(f"Each comparison must involve an item name in '{expression}'")
+
+    compare = _COMPARISONS[type(op)]
+    if isinstance(literal, str):
+        return _string_comparison(item_name, compare, literal)
+
+    def evaluate_number(category):
+        column = category.column(item_name, dtype=float)
+        # Masked (null) values never satisfy a numeric comparison
+        return compare(column.data, literal) & ~column.mask
+
+    return evaluate_number
+
+
+def _string_comparison(item_name: str, compare: Callable, literal: str) -> Selector:
+    """Compare the raw values of an item with a string literal."""
+
+    def evaluate_string(category):
+        table, codes = _encoded_column(category, item_name)
+        if table is not None:
+            # Compare each distinct value once and expand through the codes
+            return compare(table, literal)[codes]
+        return compare(category.column(item_name, dtype=str).data, literal)
+
+    return evaluate_string
+
+
+def _membership(item_name: str, literals: Tuple[Any, ...], negate: bool) -> Selector:
+    """Test an item against a set of literals."""
+    numeric = not any(isinstance(literal, str) for literal in literals)
+
+    def evaluate_membership(category):
+        import numpy as np
+
+        if numeric:
+            column = category.column(item_name, dtype=float)
+            found = np.isin(column.data, literals)
+            return (~found if negate else found) & ~column.mask
+        values = [str(literal) for literal in literals]
+        table, codes = _encoded_column(category, item_name)
+        if table is not None:
+            mask = np.isin(table, values)[codes]
+        else:
+            mask = np.isin(category.column(item_name, dtype=str).data, values)
+        return ~mask if negate else mask
+
+    return evaluate_membership
+
+
+def _encoded_column(category, item_name: str):
+    """Return (distinct values, codes) for an undecoded EncodedItem, else (None, None)."""
+    from .models import CategoryView, EncodedItem
+
+    if isinstance(category, CategoryView):
+        return None, None
+    item = category.get_item(item_name)
+    if not isinstance(item, EncodedItem) or item.is_loaded:
+        return None, None
+
+    import numpy as np
+
+    table = np.asarray(item.table, dtype=str)
+    codes = np.frombuffer(item.codes, dtype=f"u{item.codes.itemsize}")
+    return table, codes
+
+
+def _literal(node: ast.AST, expression: str):
+    """Return the value of a constant (or negated numeric constant) node."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _literal(node.operand, expression)
+        if isinstance(value, (int, float)):
+            return -value if isinstance(node.op, ast.USub) else value
+    elif isinstance(node, ast.Constant) and isinstance(node.value, (str, int, float)) \
+            and not isinstance(node.value, bool):
+        return node.value
+    raise ValueError(f"Expected a string or number literal in selection expression '{expression}'")
+
+
+def _literal_sequence(node: ast.AST, expression: str) -> Tuple[Any, ...]:
+    """Return the literals of a tuple, list or set node."""
+    if not isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        raise ValueError(f"'in' needs a tuple or list of literals in '{expression}'")
+    return tuple(_literal(element, expression) for element in node.elts)
@@ -18,7 +18,7 @@ from xml.etree import ElementTree as ET
 from functools import lru_cache, wraps
 
 from .models import MMCIFDataContainer, DataBlock, Category
-from .parser import MMCIFParser
+from .parser import MMCIFParser, _require_gemmi
 from .validators import XMLSchemaValidator
 from .schemas import (
     XMLLocation, XMLElementType, XMLGroupingType, XMLContainerType,
@@ -800,7 +800,7 @@ class XMLMappingGenerator:
         return result
         
     def _parse_dictionary_structure(self):
-        """Parse dictionary structure with schema-driven optimization"""
+        """Parse dictionary save frames through MMCIFParser with schema-driven selection"""
         if not self.dict_file:
             if not self.quiet:
                 print("⚠️ No dictionary file provided")
@@ -820,67 +820,29 @@ class XMLMappingGenerator:
         else:
             use_permissive_parsing = False
         
-        current_save = None
-        current_block = []
-        in_save_frame = False
         save_count = 0
-        category_count = 0
         processed_categories = set()
         
         try:
-            with open(self.dict_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    if not line or line.startswith('#'):
+            # gemmi tokenizes the whole dictionary; each save frame is converted
+            # to a DataBlock only when it is visited below
+            container = MMCIFParser(categories=_DICTIONARY_FRAME_CATEGORIES).parse_file(self.dict_file)
+            for block in container:
+                for save_name in block.frames.keys():
+                    frame = _frame_tags(block.frames[save_name])
+                    should_process = self._should_process_save_frame_schema_driven(
+                        save_name, frame, high_priority, medium_priority, processed_categories, use_permissive_parsing
+                    )
+                    if not should_process:
                         continue
                         
-                    if line.startswith('save_'):
-                        if in_save_frame and current_save:
-                            # Use schema-driven decision making
-                            should_process = self._should_process_save_frame_schema_driven(
-                                current_save, current_block, high_priority, medium_priority, processed_categories, use_permissive_parsing
-                            )
-                            
-                            if should_process:
-                                self._process_save_frame(current_save, current_block)
-                                save_count += 1
-                                
-                                # Track processed categories
-                                block_text = '\n'.join(current_block)
-                                if '_category.id' in block_text:
-                                    cat_match = re.search(r'_category\.id\s+(\S+)', block_text)
-                                    if cat_match:
-                                        processed_categories.add(cat_match.group(1).strip())
-                                        category_count += 1
-                                        
-                        current_save = line[5:]
-                        current_block = []
-                        in_save_frame = True
-                        
-                    elif line == 'save_':
-                        if in_save_frame and current_save:
-                            should_process = self._should_process_save_frame_schema_driven(
-                                current_save, current_block, high_priority, medium_priority, processed_categories, use_permissive_parsing
-                            )
-                            
-                            if should_process:
-                                self._process_save_frame(current_save, current_block)
-                                save_count += 1
-                                
-                                block_text = '\n'.join(current_block)
-                                if '_category.id' in block_text:
-                                    cat_match = re.search(r'_category\.id\s+(\S+)', block_text)
-                                    if cat_match:
-                                        processed_categories.add(cat_match.group(1).strip())
-                                        category_count += 1
-                                        
-                        current_save = None
-                        current_block = []
-                        in_save_frame = False
-                        
-                    elif in_save_frame:
-                        current_block.append(line)
+                    self._process_save_frame(save_name, frame)
+                    save_count += 1
+                    
+                    # Track processed categories
+                    cat_id = _tag_value(frame, "_category.id")
+                    if cat_id:
+                        processed_categories.add(cat_id)
                         
             if not self.quiet:
                 print(f"✓ Schema-driven parsing: processed {save_count} save frames")
@@ -892,7 +854,7 @@ class XMLMappingGenerator:
                 print(f"⚠️ Warning: Error parsing dictionary: {e}")
                 traceback.print_exc()
                 
-    def _should_process_save_frame_schema_driven(self, _save_name: str, block: List[str], 
+    def _should_process_save_frame_schema_driven(self, _save_name: str, frame: Dict[str, List[str]], 
                                                 high_priority: set, medium_priority: set, 
                                                 processed_categories: set, use_permissive_parsing: bool = False) -> bool:
         """Pure schema-driven decision on whether to process a save frame.
@@ -903,331 +865,156 @@ class XMLMappingGenerator:
         3. Actual data presence
         4. Dynamic dependency analysis
         """
-        block_text = '\n'.join(block)
-        
         # Always process categories if they're in our calculated priority sets
-        if '_category.id' in block_text:
-            cat_match = re.search(r'_category\.id\s+(\S+)', block_text)
-            if cat_match:
-                cat_id = cat_match.group(1).strip()
+        cat_id = _tag_value(frame, "_category.id")
+        if cat_id:
+            # Process if in high priority (schema-required or data-present)
+            if cat_id in high_priority:
+                return True
                 
-                # Process if in high priority (schema-required or data-present)
-                if cat_id in high_priority:
-                    return True
-                    
-                # Process if in medium priority (dependencies)
-                if cat_id in medium_priority:
-                    return True
-                    
-                # In permissive mode (when no data available), include ALL categories
-                # Let the schema and dictionary drive the decision completely
-                if use_permissive_parsing:
-                    if not self.quiet:
-                        print(f"📋 Including category in permissive mode: {cat_id}")
-                    return True
+            # Process if in medium priority (dependencies)
+            if cat_id in medium_priority:
+                return True
                 
-                # Otherwise, reject categories not found through proper analysis
-                return False
+            # In permissive mode (when no data available), include ALL categories
+            # Let the schema and dictionary drive the decision completely
+            if use_permissive_parsing:
+                if not self.quiet:
+                    print(f"📋 Including category in permissive mode: {cat_id}")
+                return True
+            
+            # Otherwise, reject categories not found through proper analysis
+            return False
                 
         # Process items only for categories we've decided to include
-        if '_item.name' in block_text:
-            item_match = re.search(r'_item\.name\s+[\'"]([^\'"]+)[\'"]', block_text)
-            if item_match:
-                item_name = item_match.group(1).strip()
-                
-                # Check if this item belongs to a priority category
-                for cat in high_priority | medium_priority:
-                    if item_name.startswith(f'_{cat}.'):
-                        return True
-                        
-                # Also process if the category is already processed
-                category_part = item_name.split('.')[0].lstrip('_')
-                if category_part in processed_categories:
+        item_name = _tag_value(frame, "_item.name")
+        if item_name:
+            # Check if this item belongs to a priority category
+            for cat in high_priority | medium_priority:
+                if item_name.startswith(f'_{cat}.'):
                     return True
                     
-                return False
+            # Also process if the category is already processed
+            category_part = item_name.split('.')[0].lstrip('_')
+            if category_part in processed_categories:
+                return True
+                
+            return False
                     
         # Always process metadata that's essential for understanding structure
         # These are small and critical for proper mapping generation
-        if ('_item_enumeration.value' in block_text or 
-            '_item_type.code' in block_text or
-            '_item_linked.parent_name' in block_text):
-            return True
-            
-        return False
+        return any(
+            tag.startswith(("_item_enumeration.", "_item_type.", "_item_linked."))
+            for tag in frame
+        )
                         
-    def _process_save_frame(self, save_name: str, block: List[str]):
+    def _process_save_frame(self, save_name: str, frame: Dict[str, List[str]]):
         """Process individual save frame to extract metadata"""
-        block_text = '\n'.join(block)
-        
         # Extract category definitions
-        if '_category.id' in block_text:
-            self._extract_category_info(save_name, block_text)
+        if "_category.id" in frame:
+            self._extract_category_info(save_name, frame)
             
         # Extract item definitions  
-        if '_item.name' in block_text:
-            self._extract_item_info(save_name, block_text)
+        if "_item.name" in frame:
+            self._extract_item_info(save_name, frame)
             
         # Extract item type definitions
-        if '_item_type.code' in block_text:
-            self._extract_item_type_info(save_name, block_text)
+        if "_item_type.code" in frame:
+            self._extract_item_type_info(save_name, frame)
             
         # Extract enumeration definitions
-        if '_item_enumeration.value' in block_text:
-            self._extract_enumeration_info(save_name, block_text)
+        if "_item_enumeration.value" in frame:
+            self._extract_enumeration_info(save_name, frame)
             
         # Extract relationship definitions
-        if '_item_linked.parent_name' in block_text:
-            self._extract_relationship_info(save_name, block_text)
-            
-    def _extract_category_info(self, save_name: str, block_text: str):
-        """Extract category information including keys - FIXED: proper key extraction"""
-        # Extract category ID
-        cat_match = re.search(r'_category\.id\s+(\S+)', block_text)
-        if not cat_match:
+        if "_pdbx_item_linked_group_list.child_category_id" in frame:
+            self._extract_relationship_info(save_name, frame)
+            
+    def _extract_category_info(self, save_name: str, frame: Dict[str, List[str]]):
+        """Extract category information including keys from _category_key"""
+        cat_id = _tag_value(frame, "_category.id")
+        if not cat_id:
             return
             
-        cat_id = cat_match.group(1).strip()
+        # Category keys are the PRIMARY KEYS for the category; only items of
+        # this category count
+        prefix = f"_{cat_id}."
+        keys = []
+        for key_item in frame.get("_category_key.name", []):
+            if key_item.startswith(prefix) and key_item[len(prefix):] not in keys:
+                keys.append(key_item[len(prefix):])
         
-        # Initialize category data
         self._categories[cat_id] = {
             'id': cat_id,
             'save_name': save_name,
-            'description': '',
-            'mandatory': 'no',
-            'keys': []
+            'description': _tag_text(frame, "_category.description"),
+            'mandatory': _tag_value(frame, "_category.mandatory_code", "no"),
+            'keys': keys
         }
         
-        # Extract description
-        desc_match = re.search(r'_category\.description\s*\n\s*;([^;]*);', block_text, re.DOTALL)
-        if desc_match:
-            self._categories[cat_id]['description'] = desc_match.group(1).strip()
-            
-        # Extract mandatory status
-        mandatory_match = re.search(r'_category\.mandatory_code\s+(\S+)', block_text)
-        if mandatory_match:
-            self._categories[cat_id]['mandatory'] = mandatory_match.group(1).strip()
-            
-        # FIXED: Extract category keys only from _category_key section (not from all items)
-        keys_set = set()  # Use set to avoid duplicates
-        
-        if '_category_key.name' in block_text:
-            # Extract category keys specifically from _category_key definitions
-            # This defines which items are the PRIMARY KEYS for the category
-            
-            # Method 1: Single line format
-            single_key_pattern = r'_category_key\.name\s+[\'"]?([^\s\'"]+)[\'"]?'
-            single_key_matches = re.findall(single_key_pattern, block_text)
-            
-            for key_item in single_key_matches:
-                key_item = key_item.strip('\'"').strip()
-                if key_item.startswith('_' + cat_id + '.'):
-                    item_name = key_item[len('_' + cat_id + '.'):]
-                    keys_set.add(item_name)
-            
-            # Method 2: Loop format (more common)
-            if 'loop_' in block_text:
-                # Look for the specific loop block with _category_key.name
-                loop_sections = re.split(r'loop_', block_text)
-                for section in loop_sections:
-                    if '_category_key.name' in section:
-                        # This is the _category_key loop section
-                        lines = section.strip().split('\n')
-                        in_data = False
-                        
-                        for line in lines:
-                            line = line.strip()
-                            
-                            # Skip empty lines and comments
-                            if not line or line.startswith('#'):
-                                continue
-                                
-                            # Start of data section after header
-                            if line.startswith('_category_key.name'):
-                                in_data = True
-                                continue
-                            
-                            # End of this loop (next section starts)
-                            if in_data and (line.startswith('_') and not line.startswith('_' + cat_id + '.')):
-                                break
-                                
-                            # Process data lines
-                            if in_data and not line.startswith('_'):
-                                key_item = line.strip('\'"').strip()
-                                if key_item.startswith('_' + cat_id + '.'):
-                                    item_name = key_item[len('_' + cat_id + '.'):]
-                                    keys_set.add(item_name)
-                        break
-        
-        # Convert set back to list to maintain order
-        self._categories[cat_id]['keys'] = list(keys_set)
-        
         # Debug validation for key categories
         if not self.quiet and cat_id in ['chem_comp_angle', 'atom_site', 'entity']:
             print(f"🔑 Category {cat_id}: extracted keys = {self._categories[cat_id]['keys']}")
                                         
-    def _extract_item_info(self, save_name: str, block_text: str):
+    def _extract_item_info(self, save_name: str, frame: Dict[str, List[str]]):
         """Extract item information including data types and constraints"""
-        # Extract item name
-        item_match = re.search(r'_item\.name\s+[\'"]([^\'"]+)[\'"]', block_text)
-        if not item_match:
+        names = frame.get("_item.name", [])
+        if not names:
             return
             
-        item_name = item_match.group(1).strip()
+        # Looped _item rows also list child items; the frame defines the one it is named after
+        row = names.index(save_name) if save_name in names else 0
+        item_name = names[row]
+        category_ids = frame.get("_item.category_id", [])
+        mandatory_codes = frame.get("_item.mandatory_code", [])
         
-        # Initialize item data
         self._items[item_name] = {
             'name': item_name,
             'save_name': save_name,
-            'category_id': '',
-            'description': '',
-            'mandatory': 'no',
-            'data_type': '',
+            'category_id': category_ids[row] if row < len(category_ids) else '',
+            'description': _tag_text(frame, "_item.description"),
+            'mandatory': mandatory_codes[row] if row < len(mandatory_codes) else 'no',
+            'data_type': _tag_value(frame, "_item_type.code"),
             'constraints': []
         }
-        
-        # Extract category ID
-        cat_match = re.search(r'_item\.category_id\s+(\S+)', block_text)
-        if cat_match:
-            self._items[item_name]['category_id'] = cat_match.group(1).strip()
-            
-        # Extract description
-        desc_match = re.search(r'_item\.description\s*\n\s*;([^;]*);', block_text, re.DOTALL)
-        if desc_match:
-            self._items[item_name]['description'] = desc_match.group(1).strip()
-            
-        # Extract mandatory status
-        mandatory_match = re.search(r'_item\.mandatory_code\s+(\S+)', block_text)
-        if mandatory_match:
-            self._items[item_name]['mandatory'] = mandatory_match.group(1).strip()
             
-    def _extract_item_type_info(self, save_name: str, block_text: str):
+    def _extract_item_type_info(self, save_name: str, frame: Dict[str, List[str]]):
         """Extract item type information for data validation"""
-        # Extract type code
-        type_match = re.search(r'_item_type\.code\s+[\'"]([^\'"]+)[\'"]', block_text)
-        if not type_match:
+        type_code = _tag_value(frame, "_item_type.code")
+        if not type_code:
             return
             
-        type_code = type_match.group(1).strip()
-        
-        # Initialize type data
         self._item_types[type_code] = {
             'code': type_code,
             'save_name': save_name,
-            'primitive_code': '',
-            'construct': '',
+            'primitive_code': _tag_value(frame, "_item_type.primitive_code"),
+            'construct': _tag_text(frame, "_item_type.construct"),
             'detail': ''
         }
-        
-        # Extract primitive code
-        prim_match = re.search(r'_item_type\.primitive_code\s+(\S+)', block_text)
-        if prim_match:
-            self._item_types[type_code]['primitive_code'] = prim_match.group(1).strip()
             
-        # Extract construct
-        construct_match = re.search(r'_item_type\.construct\s*\n\s*;([^;]*);', block_text, re.DOTALL)
-        if construct_match:
-            self._item_types[type_code]['construct'] = construct_match.group(1).strip()
-            
-    def _extract_enumeration_info(self, save_name: str, block_text: str):
+    def _extract_enumeration_info(self, save_name: str, frame: Dict[str, List[str]]):
         """Extract enumeration values for validation"""
         # The save_name already contains the item name (e.g., "_atom_site.group_PDB")
         # So we use that as the enumeration key
-        
-        if save_name not in self._enumerations:
-            self._enumerations[save_name] = []
-            
-        # Extract enumeration values from loop
-        if 'loop_' in block_text and '_item_enumeration.value' in block_text:
-            # Look for the pattern where enumeration values are listed
-            # Find the start of the loop values
-            loop_start = block_text.find('_item_enumeration.value')
-            if loop_start != -1:
-                # Get the text after the loop header
-                after_loop = block_text[loop_start:]
-                lines = after_loop.split('\n')
-                
-                # Skip header lines and find actual values
-                in_values = False
-                for line in lines:
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                        
-                    # If we see an underscore line, we're done with this loop
-                    if line.startswith('_') and not line.startswith('_item_enumeration'):
-                        break
-                        
-                    # If we see the next save block, we're done
-                    if line.startswith('save_'):
-                        break
-                        
-                    # If this is a header line, skip it
-                    if line.startswith('_item_enumeration'):
-                        in_values = True
-                        continue
-                        
-                    # If we're in the values section and this doesn't start with underscore
-                    if in_values and not line.startswith('_'):
-                        # Remove quotes and whitespace
-                        value = line.strip('\'"').strip()
-                        if value and value not in self._enumerations[save_name]:
-                            self._enumerations[save_name].append(value)
+        values = self._enumerations.setdefault(save_name, [])
+        for value in frame.get("_item_enumeration.value", []):
+            if value and value not in values:
+                values.append(value)
                             
-    def _extract_relationship_info(self, save_name: str, block_text: str):
-        """Extract parent-child relationships"""
-        # Extract parent-child relationships from loops
-        if 'loop_' in block_text and '_pdbx_item_linked_group_list' in block_text:
-            # Parse the PDBX relationship format
-            lines = block_text.split('\n')
-            in_loop = False
-            header_found = False
-            col_indices = {}
-            
-            for line in lines:
-                line = line.strip()
-                
-                if line.startswith('loop_'):
-                    in_loop = True
-                    continue
-                    
-                if in_loop and line.startswith('_pdbx_item_linked_group_list.'):
-                    # Map column headers to indices
-                    field_name = line.split('.')[-1]
-                    col_indices[field_name] = len(col_indices)
-                    header_found = True
-                    continue
-                    
-                if in_loop and header_found and line and not line.startswith('_') and not line.startswith('#'):
-                    # This is a data row
-                    columns = line.split()
-                    if len(columns) >= len(col_indices):
-                        try:
-                            # Extract relationship data
-                            child_cat_idx = col_indices.get('child_category_id', -1)
-                            parent_name_idx = col_indices.get('parent_name', -1)
-                            child_name_idx = col_indices.get('child_name', -1)
-                            
-                            if child_cat_idx >= 0 and parent_name_idx >= 0 and child_name_idx >= 0:
-                                child_category = columns[child_cat_idx].strip('\'"')
-                                parent_name = columns[parent_name_idx].strip('\'"')
-                                child_name = columns[child_name_idx].strip('\'"')
-                                
-                                if child_category and parent_name and child_name:
-                                    self._relationships.append({
-                                        'parent_name': parent_name,
-                                        'child_name': child_name,
-                                        'child_category': child_category,
-                                        'save_name': save_name
-                                    })
-                        except IndexError:
-                            continue
-                            
-                if line.startswith('#') or (in_loop and line.startswith('_') and 'pdbx_item_linked_group_list' not in line):
-                    # End of this loop
-                    break
+    def _extract_relationship_info(self, save_name: str, frame: Dict[str, List[str]]):
+        """Extract parent-child relationships from _pdbx_item_linked_group_list"""
+        child_categories = frame.get("_pdbx_item_linked_group_list.child_category_id", [])
+        parent_names = frame.get("_pdbx_item_linked_group_list.parent_name", [])
+        child_names = frame.get("_pdbx_item_linked_group_list.child_name", [])
+        
+        for child_category, parent_name, child_name in zip(child_categories, parent_names, child_names):
+            if child_category and parent_name and child_name:
+                self._relationships.append({
+                    'parent_name': parent_name,
+                    'child_name': child_name,
+                    'child_category': child_category,
+                    'save_name': save_name
+                })
                         
     def _parse_xsd_schema(self):
         """Parse XSD schema to extract element/attribute requirements"""
@@ -1515,6 +1302,10 @@ class XMLMappingGenerator:
                 
         return validation_rules
         
+    def get_item_type_code(self, item_name: str) -> str:
+        """Get the dictionary _item_type.code of an item (e.g. 'float'), or '' if unknown"""
+        return self.items.get(item_name, {}).get('data_type', '')
+        
     def _get_item_data_type(self, item_name: str) -> str:
         """Get data type for item"""
         if item_name in self.item_types:
@@ -1538,6 +1329,58 @@ class XMLMappingGenerator:
             return ''
 
 
+# Save-frame categories read by XMLMappingGenerator; everything else in a
+# frame (examples, aliases, units, ...) is never converted
+_DICTIONARY_FRAME_CATEGORIES = [
+    "_category",
+    "_category_key",
+    "_item",
+    "_item_type",
+    "_item_enumeration",
+    "_item_linked",
+    "_pdbx_item_linked_group_list",
+]
+
+
+def _frame_tags(frame: DataBlock) -> Dict[str, List[str]]:
+    """Flatten a dictionary save frame to {'_category.item': values}.
+
+    Values are unquoted, except text fields, which keep their ';' delimiters
+    for _tag_text (_tag_value unquotes them).
+    """
+    as_string = _require_gemmi().cif.as_string
+    tags = {}
+    for category in frame.data.values():
+        for item_name, values in category.data.items():
+            tags[f"{category.name}.{item_name}"] = [
+                value if value.startswith(";") else as_string(value) for value in values
+            ]
+    return tags
+
+
+def _tag_value(tags: Dict[str, List[str]], tag: str, default: str = "") -> str:
+    """First value of a tag in a flattened save frame."""
+    values = tags.get(tag)
+    if not values:
+        return default
+    value = values[0]
+    return _require_gemmi().cif.as_string(value) if value.startswith(";") else value
+
+
+def _tag_text(tags: Dict[str, List[str]], tag: str) -> str:
+    """A text-field value formatted as the line-based dictionary reader did.
+
+    Lines are stripped, blank and '#' lines dropped, and the text ends at
+    its first ';'. Values that are not text fields give ''.
+    """
+    values = tags.get(tag)
+    if not values or not values[0].startswith(";"):
+        return ""
+    lines = (line.strip() for line in values[0][1:].split("\n"))
+    text = "\n".join(line for line in lines if line and not line.startswith("#"))
+    return text.split(";", 1)[0].strip()
+
+
 class DictionaryParser:
     """Parser for mmCIF dictionary files to extract category and item metadata."""
     
@@ -1557,31 +1400,39 @@ class DictionaryParser:
             
         dict_block = container.data[0]
         
+        # Definitions live in save frames (DDL2); a few dictionaries loop them
+        # in the block itself
+        self._parse_definitions(dict_block)
+        for frame_name in dict_block.frames.keys():
+            self._parse_definitions(dict_block.frames[frame_name], frame_name)
+    
+    def _parse_definitions(self, block: DataBlock, frame_name: Optional[str] = None) -> None:
+        """Parse the definition categories of a dictionary block or save frame."""
         # Parse category definitions
-        if "_category" in dict_block.categories:
-            self._parse_categories(dict_block["_category"])
+        if "_category" in block.categories:
+            self._parse_categories(block["_category"])
             
         # Parse category key definitions (most important for key extraction)
-        if "_category_key" in dict_block.categories:
-            self._parse_category_keys(dict_block["_category_key"])
+        if "_category_key" in block.categories:
+            self._parse_category_keys(block["_category_key"])
             
         # Parse item definitions  
-        if "_item" in dict_block.categories:
-            self._parse_items(dict_block["_item"])
+        if "_item" in block.categories:
+            self._parse_items(block["_item"])
             
         # Parse item type definitions
-        if "_item_type" in dict_block.categories:
-            self._parse_item_types(dict_block["_item_type"])
+        if "_item_type" in block.categories:
+            self._parse_item_types(block["_item_type"])
             
-        # Parse enumeration definitions
-        if "_item_enumeration" in dict_block.categories:
-            self._parse_enumerations(dict_block["_item_enumeration"])
+        # Parse enumeration definitions (in an item frame, the frame names the item)
+        if "_item_enumeration" in block.categories:
+            self._parse_enumerations(block["_item_enumeration"], frame_name)
             
         # Parse relationships/links
-        if "_pdbx_item_linked_group_list" in dict_block.categories:
-            self._parse_relationships(dict_block["_pdbx_item_linked_group_list"])
-        elif "_item_linked" in dict_block.categories:
-            self._parse_relationships(dict_block["_item_linked"])
+        if "_pdbx_item_linked_group_list" in block.categories:
+            self._parse_relationships(block["_pdbx_item_linked_group_list"])
+        elif "_item_linked" in block.categories:
+            self._parse_relationships(block["_item_linked"])
     
     def _parse_categories(self, category: Category) -> None:
         """Parse category definitions."""
@@ -1619,10 +1470,12 @@ class DictionaryParser:
                         "detail": data.get("detail", [None] * len(data["code"]))[i] or ""
                     })
     
-    def _parse_enumerations(self, category: Category) -> None:
+    def _parse_enumerations(self, category: Category, item_name: Optional[str] = None) -> None:
         """Parse enumeration definitions."""
         data = category.data
-        if "name" in data and "value" in data:
+        if "value" in data and "name" not in data and item_name:
+            self.enumerations.setdefault(item_name, []).extend(data["value"])
+        elif "name" in data and "value" in data:
             for i, item_name in enumerate(data["name"]):
                 if item_name not in self.enumerations:
                     self.enumerations[item_name] = []
@@ -1634,8 +1487,8 @@ class DictionaryParser:
         if "child_name" in data and "parent_name" in data:
             for i, child_name in enumerate(data["child_name"]):
                 # Strip quotes from names
-                clean_child_name = child_name.strip('"')
-                clean_parent_name = data["parent_name"][i].strip('"')
+                clean_child_name = child_name.strip("'\"")
+                clean_parent_name = data["parent_name"][i].strip("'\"")
                 
                 if clean_child_name not in self.relationships:
                     self.relationships[clean_child_name] = []
@@ -1649,7 +1502,8 @@ class DictionaryParser:
         data = category.data
         if "name" in data:
             for full_item_name in data["name"]:
-                # Parse category.item format (e.g., "_citation.id")
+                # Parse category.item format (e.g., "_citation.id"), quoted in most dictionaries
+                full_item_name = full_item_name.strip("'\"")
                 if "." in full_item_name:
                     cat_name, item_name = full_item_name.lstrip("_").split(".", 1)
                     if cat_name not in self.categories:
@@ -1669,7 +1523,19 @@ class DictionaryParser:
         
         # Fallback: No keys found in dictionary
         return []
-    
+
+    def create_key_indexes(self, container: MMCIFDataContainer) -> None:
+        """Declare a hash index on the dictionary key of every category in the container.
+
+        Indexes are built on the first Category.lookup() that uses them.
+        """
+        for block in container.data:
+            for category_name in block.categories:
+                key_items = self.get_category_key_items(category_name)
+                category = block[category_name]
+                if key_items and all(item_name in category.items for item_name in key_items):
+                    category.create_index(key_items)
+
     def get_parent_relationships(self, child_category: str) -> List[Dict[str, str]]:
         """Get parent relationships for a child category."""
         relationships = []
@@ -2781,6 +2647,8 @@ class MMCIFToPDBMLPipeline:
             # Step 1: Parse mmCIF
             parser = MMCIFParser(validator_factory=None)
             mmcif_container = parser.parse_file(mmcif_path)
+            if self.dictionary_path.exists():
+                self.dictionary.create_key_indexes(mmcif_container)
             
             # Step 2: Convert to PDBML XML
             pdbml_xml = self.converter.convert_to_pdbml(mmcif_container)
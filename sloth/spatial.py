@@ -0,0 +1,212 @@
+"""
+SLOTH Spatial Index
+
+A cell list over atom coordinates for neighbour, contact and clash queries::
+
+    index = atom_site.spatial_index()
+    close = index.neighbors((10.0, 4.5, -2.0), radius=5.0)
+    contacts = index.pairs_within(4.0)
+    interface = index.pairs_within(4.0, ligand_atoms)
+
+Atoms are binned into cubic cells and sorted by cell, so the atoms of a cell
+are one contiguous range. A query visits only the cells within reach of its
+points and filters the candidates by exact distance, all as NumPy array
+operations over chunks of query points. Atoms without coordinates ('?' or
+'.') are not indexed. Every result refers to row indices of the indexed
+category.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+# Default cell edge in Ångström; queries with a larger radius visit more cells
+DEFAULT_CELL_SIZE = 4.0
+
+# Query points processed together (bounds the size of the candidate arrays)
+_QUERY_CHUNK = 8192
+
+
+class SpatialIndex:
+    """
+    A cell list over the coordinates of one category.
+
+    Build one with :meth:`Category.spatial_index`, which caches it until a
+    coordinate item changes.
+    """
+
+    def __init__(self, coordinates, rows=None, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Index a set of points.
+
+        :param coordinates: N×3 float array of the points to index
+        :param rows: Row index of each point in its category (default: 0..N-1)
+        :param cell_size: Cell edge length, in the coordinates' unit
+        """
+        import numpy as np
+
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._np = np
+        self.cell_size = float(cell_size)
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 3)
+        rows = np.arange(len(coordinates)) if rows is None else np.asarray(rows, dtype=np.int64)
+
+        self._origin = coordinates.min(axis=0) if len(coordinates) else np.zeros(3)
+        cells = self._cells(coordinates)
+        self._dims = cells.max(axis=0) + 1 if len(coordinates) else np.ones(3, dtype=np.int64)
+        keys = self._linear(cells)
+
+        # Atoms sorted by cell: each occupied cell is one range [start, end)
+        order = np.argsort(keys, kind="stable")
+        self._coordinates = coordinates[order]
+        self._columns = tuple(np.ascontiguousarray(self._coordinates.T))
+        self._rows = rows[order]
+        self._cell_keys, self._cell_starts = np.unique(keys[order], return_index=True)
+        self._cell_ends = np.append(self._cell_starts[1:], len(order))
+
+    @classmethod
+    def from_category(cls, category, cell_size: float = DEFAULT_CELL_SIZE) -> "SpatialIndex":
+        """
+        Index the Cartn_x/Cartn_y/Cartn_z coordinates of a category.
+
+        :param category: The category (or view), usually _atom_site
+        :param cell_size: Cell edge length in Ångström
+        :return: The index; rows with null coordinates are left out
+        """
+        import numpy as np
+
+        coordinates = category.coords()
+        present = ~np.isnan(coordinates).any(axis=1)
+        if present.all():
+            return cls(coordinates, cell_size=cell_size)
+        return cls(coordinates[present], np.flatnonzero(present), cell_size=cell_size)
+
+    def __len__(self) -> int:
+        """Number of indexed atoms."""
+        return len(self._rows)
+
+    def neighbors(self, point: Sequence[float], radius: float, return_distances: bool = False):
+        """
+        Find the atoms within ``radius`` of a point.
+
+        :param point: x, y, z of the query point
+        :param radius: Search radius
+        :param return_distances: Also return the distance of each atom
+        :return: Sorted row indices, or (row indices, distances)
+        """
+        np = self._np
+        point = np.asarray(point, dtype=np.float64).reshape(1, 3)
+        _, positions, distances = self._query(point, radius)
+        order = np.argsort(self._rows[positions], kind="stable")
+        rows = self._rows[positions][order]
+        return (rows, distances[order]) if return_distances else rows
+
+    def pairs_within(
+        self,
+        radius: float,
+        other: Optional[Union["SpatialIndex", object]] = None,
+        return_distances: bool = False,
+    ):
+        """
+        Find all pairs of atoms closer than ``radius``.
+
+        Without ``other``, pairs are taken within this index and each pair is
+        reported once as (i, j) with i < j. With ``other`` (another index, or
+        a category such as ligand atoms), pairs are (row in this index's
+        category, row in the other's category).
+
+        :param radius: Distance cut-off
+        :param other: Optional SpatialIndex or category to pair against
+        :param return_distances: Also return the distance of each pair
+        :return: K×2 array of row index pairs, or (pairs, distances)
+        """
+        np = self._np
+        if other is not None and not isinstance(other, SpatialIndex):
+            other = other.spatial_index(self.cell_size)
+        queries = self if other is None else other
+
+        found_pairs, found_distances = [], []
+        for start in range(0, len(queries), _QUERY_CHUNK):
+            points = queries._coordinates[start:start + _QUERY_CHUNK]
+            if other is None:
+                positions = np.arange(start, start + len(points))
+                query, atoms, distances = self._query(points, radius, self_positions=positions)
+                query_rows, atom_rows = self._rows[start + query], self._rows[atoms]
+                pair = np.column_stack([np.minimum(query_rows, atom_rows), np.maximum(query_rows, atom_rows)])
+            else:
+                query, atoms, distances = self._query(points, radius)
+                pair = np.column_stack([self._rows[atoms], queries._rows[start + query]])
+            found_pairs.append(pair)
+            found_distances.append(distances)
+
+        pairs = np.concatenate(found_pairs) if found_pairs else np.zeros((0, 2), dtype=np.int64)
+        distances = np.concatenate(found_distances) if found_distances else np.zeros(0)
+        # Sort by (first, second) through one int64 key
+        order = np.argsort(pairs[:, 0] * (int(pairs[:, 1].max(initial=0)) + 1) + pairs[:, 1])
+        pairs, distances = pairs[order], distances[order]
+        return (pairs, distances) if return_distances else pairs
+
+    def _query(self, points, radius: float, self_positions=None) -> Tuple:
+        """
+        Find indexed atoms within ``radius`` of each point.
+
+        :param points: M×3 query points
+        :param radius: Search radius
+        :param self_positions: For pairs within this index: the sorted position
+                               of each query point. Only half of the neighbouring
+                               cells and the later atoms of the point's own cell
+                               are then visited, so each pair is found once.
+        :return: (query point index, sorted atom position, distance) arrays
+        """
+        np = self._np
+        empty = np.zeros(0, dtype=np.int64)
+        if not len(self._rows) or not len(points) or radius < 0:
+            return empty, empty, np.zeros(0)
+
+        cells = self._cells(points)
+        reach = int(np.ceil(radius / self.cell_size))
+        span = np.arange(-reach, reach + 1)
+        offsets = np.stack(np.meshgrid(span, span, span, indexing="ij"), axis=-1).reshape(-1, 3)
+        if self_positions is not None:
+            # Lexicographically non-negative offsets cover each pair of cells once
+            offsets = offsets[(offsets[:, 0] > 0) | ((offsets[:, 0] == 0) & (
+                (offsets[:, 1] > 0) | ((offsets[:, 1] == 0) & (offsets[:, 2] >= 0))))]
+
+        # Candidate (point, cell) combinations whose cell exists and is occupied
+        neighbour_cells = cells[:, None, :] + offsets[None, :, :]
+        inside = ((neighbour_cells >= 0) & (neighbour_cells < self._dims)).all(axis=2)
+        point_ids, offset_ids = np.nonzero(inside)
+        keys = self._linear(neighbour_cells[point_ids, offset_ids])
+        slots = np.searchsorted(self._cell_keys, keys)
+        slots = np.minimum(slots, len(self._cell_keys) - 1)
+        occupied = self._cell_keys[slots] == keys
+        point_ids, offset_ids, slots = point_ids[occupied], offset_ids[occupied], slots[occupied]
+
+        starts, ends = self._cell_starts[slots], self._cell_ends[slots]
+        if self_positions is not None:
+            # In its own cell (offset 0, sorted first), a point pairs only with the atoms after it
+            own_cell = offset_ids == 0
+            starts[own_cell] = self_positions[point_ids[own_cell]] + 1
+
+        # Expand each (point, cell) into (point, atom) candidates
+        counts = ends - starts
+        query = np.repeat(point_ids, counts)
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+        x, y, z = self._columns
+        squared = (x[positions] - points[query, 0]) ** 2
+        squared += (y[positions] - points[query, 1]) ** 2
+        squared += (z[positions] - points[query, 2]) ** 2
+        within = np.flatnonzero(squared <= radius * radius)
+        return query[within], positions[within], np.sqrt(squared[within])
+
+    def _cells(self, coordinates):
+        """Integer cell coordinates of points."""
+        np = self._np
+        return np.floor((coordinates - self._origin) / self.cell_size).astype(np.int64)
+
+    def _linear(self, cells):
+        """Linear key of in-range cell coordinates."""
+        return (cells[:, 0] * self._dims[1] + cells[:, 1]) * self._dims[2] + cells[:, 2]
+
+    def __repr__(self):
+        return f"SpatialIndex({len(self)} atoms, {len(self._cell_keys)} cells, cell_size={self.cell_size})"
@@ -0,0 +1,626 @@
+"""
+SLOTH Streaming Readers
+
+Line-level scanners over mmCIF files that avoid building an MMCIFDataContainer
+for the whole file:
+
+* ``iter_category_rows`` yields the rows of one category in chunks. Only the
+  lines of the requested category are buffered, so peak memory is bounded by
+  the chunk size rather than the file size.
+* ``scan_header_text`` keeps key-value items and small loops and skips large
+  loops without tokenizing them.
+* ``scan_catalogue`` lists the categories of each data block with their row
+  counts, item names and byte ranges.
+
+Two tokenizers are available for the rows buffered by ``iter_category_rows``:
+
+* ``"gemmi"`` feeds each buffered chunk to gemmi's C++ tokenizer and returns
+  values exactly as ``MMCIFParser`` does.
+* ``"legacy"`` uses the pure-Python tokenizer from ``sloth.legacy.parser`` and
+  returns values as the legacy parser does (quotes stripped).
+"""
+
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+from pathlib import Path
+from .common import open_text
+from .legacy.parser import fast_tokenize_loop_line
+
+STREAM_BACKENDS = ("gemmi", "legacy")
+
+# Line kinds that end a loop body or a run of key-value pairs
+_SECTION_KINDS = ("tag", "loop", "data", "save")
+_SECTION_FIRST_CHARS = frozenset("_dDlLsS \t")
+
+# Characters that mark loop body lines plain whitespace splitting would
+# miscount or that may end the body: quotes, comments, text fields and tags,
+# loop_, data_ and save_ lines
+_LOOP_BODY_MARKS = ("'", '"', "#", ";", "_")
+
+# A quoted value ends at a matching quote followed by whitespace; '#' at the
+# start of a token begins a comment
+_VALUE_TOKEN = re.compile(r"""'.*?'(?=\s|$)|".*?"(?=\s|$)|#|\S+""")
+
+RowChunk = Union[List[Tuple[str, ...]], Dict[str, List[str]]]
+
+
+def iter_category_rows(
+    file_path: Union[str, Path],
+    category: str,
+    items: Optional[List[str]] = None,
+    chunk_size: int = 100_000,
+    backend: Optional[str] = None,
+    as_columns: bool = False,
+) -> Iterator[RowChunk]:
+    """
+    Stream the rows of one category in chunks.
+
+    :param file_path: Path to the mmCIF file (.gz, .bz2 and .xz are read on the fly)
+    :param category: Category name, e.g. '_atom_site'
+    :param items: Item names to return, in this order (default: all, in file order)
+    :param chunk_size: Maximum number of rows per chunk
+    :param backend: 'gemmi' or 'legacy' (default: gemmi when installed)
+    :param as_columns: Yield {item name: values} batches instead of lists of tuples
+    :return: Iterator over row chunks
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    tokenizer = _get_tokenizer(backend)
+
+    category = category if category.startswith("_") else f"_{category}"
+    prefix = f"{category.lower()}."
+    wanted = [_strip_category(item, prefix) for item in items] if items else None
+
+    with open_text(file_path) as f:
+        reader = _LineReader(f)
+        pair_lines: List[str] = []
+        collecting = False
+        for line, in_text in reader:
+            kind = None if in_text else _line_kind(line)
+            if kind is None:
+                # Values of a key-value item may continue on the following lines
+                if collecting:
+                    pair_lines.append(line)
+                continue
+
+            collecting = kind == "tag" and line.lstrip().lower().startswith(prefix)
+            if collecting:
+                pair_lines.append(line)
+            elif kind == "loop":
+                tags = _read_loop_tags(reader)
+                if tags and tags[0].lower().startswith(prefix):
+                    yield from _stream_loop(
+                        reader, tags, prefix, wanted, tokenizer, chunk_size, as_columns
+                    )
+                else:
+                    reader.skip_to_section()
+            elif kind == "data" and pair_lines:
+                # Key-value categories become a single row per data block
+                yield _pair_chunk(pair_lines, prefix, wanted, tokenizer, as_columns)
+                pair_lines = []
+
+        if pair_lines:
+            yield _pair_chunk(pair_lines, prefix, wanted, tokenizer, as_columns)
+
+
+def scan_header_text(
+    file_path: Union[str, Path],
+    categories: Optional[List[str]] = None,
+    max_loop_lines: int = 1000,
+) -> str:
+    """
+    Collect the header part of an mmCIF file as text, skipping large loops.
+
+    Key-value items and loops of up to ``max_loop_lines`` value lines are kept
+    verbatim; longer loops (``_atom_site`` and friends) are skipped line by line
+    without being tokenized. Loops of categories not in ``categories`` are
+    skipped the same way.
+
+    :param file_path: Path to the mmCIF file (.gz, .bz2 and .xz are read on the fly)
+    :param categories: Categories whose loops are kept (default: all small loops)
+    :param max_loop_lines: Loops with more value lines than this are skipped
+    :return: mmCIF text holding the data block headers, pairs and small loops
+    """
+    wanted = {name.lower() for name in categories} if categories else None
+    kept: List[str] = []
+
+    with open_text(file_path) as f:
+        reader = _LineReader(f)
+        for line, in_text in reader:
+            if in_text or _line_kind(line) != "loop":
+                kept.append(line)
+                continue
+
+            tags = _read_loop_tags(reader)
+            if not tags or (wanted is not None and tags[0].split(".")[0].lower() not in wanted):
+                reader.skip_to_section()
+                continue
+
+            body: Optional[List[str]] = []
+            for body_line, body_in_text in reader:
+                if not body_in_text and _line_kind(body_line) in _SECTION_KINDS:
+                    reader.push_back((body_line, body_in_text))
+                    break
+                body.append(body_line)
+                if len(body) > max_loop_lines:
+                    body = None
+                    reader.skip_to_section()
+                    break
+
+            if body is not None:
+                kept.append("loop_\n")
+                kept.extend(f"{tag}\n" for tag in tags)
+                kept.extend(body)
+
+    return "".join(kept)
+
+
+def scan_catalogue(file_path: Union[str, Path]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    List the categories of each data block without converting any values.
+
+    Loop rows are counted from the number of values in the loop body; values
+    are only counted, never stored. Byte ranges are ``(start, end)`` offsets
+    into the (decompressed) file and cover the category's tag and value lines,
+    so ``data[start:end]`` can be parsed on its own below a ``data_`` line.
+    The contents of save frames are not catalogued.
+
+    :param file_path: Path to the mmCIF file (.gz, .bz2 and .xz are read on the fly)
+    :return: {block name: {category: {"row_count", "items", "byte_ranges"}}}
+    """
+    catalogue: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    block: Dict[str, Dict[str, Any]] = {}
+    entry: Optional[Dict[str, Any]] = None  # category whose byte range is open
+    loop_entry: Optional[Dict[str, Any]] = None
+    in_loop_header = False
+    in_text = False
+    in_frame = False
+    range_start = 0
+
+    # latin-1 maps every byte to one character, so string lengths are byte offsets
+    with open_text(file_path, encoding="latin-1", newline="") as f:
+        text = _TextBuffer(f)
+        while True:
+            start = text.offset
+            line = text.readline()
+            if not line:
+                break
+
+            if in_loop_header:
+                kind = None if line.startswith(";") else _line_kind(line)
+                if kind == "tag":
+                    # One or more tags per line
+                    for tag in line.split():
+                        category, _, item = tag.partition(".")
+                        if loop_entry is None and not in_frame:
+                            entry = loop_entry = _catalogue_entry(block, category)
+                        if loop_entry is not None:
+                            loop_entry["items"].append(item)
+                    continue
+                stripped = line.strip()
+                if kind is None and (not stripped or stripped.startswith("#")):
+                    continue
+                in_loop_header = False
+                if kind is None:
+                    # Rewind to the first value line and count the whole body in bulk
+                    text.seek(start)
+                    value_count = _count_loop_values(text)
+                    if loop_entry is not None and loop_entry["items"]:
+                        loop_entry["row_count"] = value_count // len(loop_entry["items"])
+                    continue
+
+            if line.startswith(";"):
+                in_text = not in_text
+                continue
+            if in_text:
+                continue
+
+            kind = _line_kind(line)
+            if kind is None:
+                continue
+
+            if kind == "tag":
+                if in_frame:
+                    continue
+                category, _, item = line.split(None, 1)[0].partition(".")
+                if entry is None or entry["name"] != category:
+                    _close_byte_range(entry, range_start, start)
+                    entry = _catalogue_entry(block, category)
+                    entry["row_count"] = 1
+                    range_start = start
+                entry["items"].append(item)
+                continue
+
+            _close_byte_range(entry, range_start, start)
+            entry = loop_entry = None
+            if kind == "loop":
+                in_loop_header = True
+                range_start = start
+            elif kind == "data":
+                block = catalogue.setdefault(line.strip()[5:], {})
+                in_frame = False
+            else:
+                in_frame = line.strip().lower() != "save_"
+
+        _close_byte_range(entry, range_start, text.offset)
+
+    for categories in catalogue.values():
+        for info in categories.values():
+            del info["name"]
+    return catalogue
+
+
+class _TextBuffer:
+    """Block-buffered reader that serves both lines and bulk scans, tracking offsets."""
+
+    def __init__(self, file_obj: IO, block_size: int = 1 << 20):
+        self._file_obj = file_obj
+        self._block_size = block_size
+        self.buffer = ""
+        self.pos = 0
+        self._base = 0  # offset of buffer[0] in the file
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        return self._base + self.pos
+
+    def fill(self) -> bool:
+        """Drop consumed text and read another block; False at end of file."""
+        if self.eof:
+            return False
+        block = self._file_obj.read(self._block_size)
+        # Keep the character before pos so line starts can be found by searching for "\n"
+        keep = max(self.pos - 1, 0)
+        self._base += keep
+        self.buffer = self.buffer[keep:] + block
+        self.pos -= keep
+        self.eof = not block
+        return bool(block)
+
+    def readline(self) -> str:
+        while True:
+            end = self.buffer.find("\n", self.pos)
+            if end >= 0:
+                line = self.buffer[self.pos:end + 1]
+                self.pos = end + 1
+                return line
+            if not self.fill():
+                line = self.buffer[self.pos:]
+                self.pos = len(self.buffer)
+                return line
+
+    def seek(self, offset: int) -> None:
+        """Move back to an offset inside the current buffer."""
+        self.pos = offset - self._base
+
+
+def _count_loop_values(text: _TextBuffer) -> int:
+    """
+    Count the values of a loop body, starting at its first value line and
+    stopping before the next section line.
+
+    Runs of plain lines are counted in bulk; lines with quotes or comments go
+    through the tokenizer and each text field counts as one value.
+    """
+    count = 0
+    next_marks: Dict[str, int] = {}
+    while True:
+        buffer, pos = text.buffer, text.pos
+        # Only complete lines are scanned; a partial last line waits for the next block
+        limit = len(buffer) if text.eof else buffer.rfind("\n", pos) + 1
+        if limit <= pos:
+            if not text.fill():
+                return count
+            next_marks.clear()
+            continue
+
+        line_start = _next_special_line(buffer, pos, limit, next_marks)
+        count += _count_tokens(buffer[pos:line_start])
+        text.pos = line_start
+        if line_start >= limit:
+            if not text.fill():
+                return count
+            next_marks.clear()
+            continue
+
+        line_end = buffer.find("\n", line_start) + 1 or len(buffer)
+        line = buffer[line_start:line_end]
+        if line.startswith(";"):
+            # Text field: one value, closed by the next line that starts with ';'
+            close = buffer.find("\n;", line_end - 1)
+            close_end = buffer.find("\n", close + 1) + 1 if close >= 0 else 0
+            if not close_end and not text.eof:
+                text.fill()
+                next_marks.clear()
+                continue
+            count += 1
+            text.pos = close_end or len(buffer)
+        elif _line_kind(line) is not None:
+            return count
+        else:
+            count += _count_line_values(line)
+            text.pos = line_end
+
+
+def _next_special_line(buffer: str, pos: int, limit: int, next_marks: Dict[str, int]) -> int:
+    """Return the start of the first line in buffer[pos:limit] that needs a closer look."""
+    while True:
+        for mark in _LOOP_BODY_MARKS:
+            if next_marks.get(mark, -1) < pos:
+                hit = buffer.find(mark, pos, limit)
+                next_marks[mark] = limit if hit < 0 else hit
+        mark = min(next_marks, key=next_marks.__getitem__)
+        hit = next_marks[mark]
+        if hit >= limit:
+            return limit
+        line_start = max(buffer.rfind("\n", pos, hit) + 1, pos)
+        prefix = buffer[line_start:hit]
+        if mark in "'\"#":
+            return line_start
+        if mark == ";" and not prefix:
+            return line_start
+        if mark == "_" and prefix.strip().lower() in ("", "loop", "data", "save"):
+            return line_start
+        # A ';' or '_' inside a value: keep looking
+        hit = buffer.find(mark, hit + 1, limit)
+        next_marks[mark] = limit if hit < 0 else hit
+
+
+def _count_line_values(line: str) -> int:
+    """Count the values on one line, honouring quotes and trailing comments."""
+    count = 0
+    for match in _VALUE_TOKEN.finditer(line):
+        if match.group() == "#":
+            break
+        count += 1
+    return count
+
+
+def _count_tokens(text: str) -> int:
+    """Count whitespace-separated tokens without building them."""
+    try:
+        import numpy as np
+    except ImportError:
+        return len(text.split())
+    chars = np.frombuffer(text.encode("latin-1"), dtype=np.uint8)
+    if not len(chars):
+        return 0
+    space = chars <= 32
+    return int(np.count_nonzero(space[:-1] & ~space[1:])) + int(not space[0])
+
+
+def _catalogue_entry(block: Dict[str, Dict[str, Any]], category: str) -> Dict[str, Any]:
+    return block.setdefault(
+        category, {"name": category, "row_count": 0, "items": [], "byte_ranges": []}
+    )
+
+
+def _close_byte_range(entry: Optional[Dict[str, Any]], start: int, end: int) -> None:
+    """Record [start, end) for a category, merging with its previous range when adjacent."""
+    if entry is None:
+        return
+    ranges = entry["byte_ranges"]
+    if ranges and ranges[-1][1] == start:
+        ranges[-1] = (ranges[-1][0], end)
+    else:
+        ranges.append((start, end))
+
+
+class _LineReader:
+    """Line iterator that tracks ';' text fields and allows one line of push-back."""
+
+    def __init__(self, file_obj):
+        self._file_obj = file_obj
+        self._pushed: Optional[Tuple[str, bool]] = None
+        self.in_text = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Tuple[str, bool]:
+        if self._pushed is not None:
+            entry, self._pushed = self._pushed, None
+            return entry
+        line = next(self._file_obj)
+        if line.startswith(";"):
+            self.in_text = not self.in_text
+            return line, True
+        return line, self.in_text
+
+    def push_back(self, entry: Tuple[str, bool]) -> None:
+        self._pushed = entry
+
+    def skip_to_section(self) -> None:
+        """Skip lines up to (and push back) the next tag, loop_, data_ or save_ line."""
+        if self._pushed is not None:
+            entry, self._pushed = self._pushed, None
+            if not entry[1] and _line_kind(entry[0]) in _SECTION_KINDS:
+                self._pushed = entry
+                return
+        # Tight loop over the raw file: most value lines are rejected on their first character
+        in_text = self.in_text
+        for line in self._file_obj:
+            first = line[:1]
+            if first == ";":
+                in_text = not in_text
+            elif not in_text and first in _SECTION_FIRST_CHARS and _line_kind(line) in _SECTION_KINDS:
+                self._pushed = (line, False)
+                break
+        self.in_text = in_text
+
+
+def _line_kind(line: str) -> Optional[str]:
+    """Classify a line outside text fields by its leading keyword."""
+    stripped = line.lstrip()
+    first = stripped[:1]
+    if first == "_":
+        return "tag"
+    if first in ("d", "D", "l", "L", "s", "S"):
+        keyword = stripped[:5].lower()
+        if keyword == "data_":
+            return "data"
+        if keyword == "loop_":
+            return "loop"
+        if keyword == "save_":
+            return "save"
+    return None
+
+
+def _read_loop_tags(reader: _LineReader) -> List[str]:
+    """Read the tag lines that follow loop_."""
+    tags = []
+    for line, in_text in reader:
+        if not in_text and _line_kind(line) == "tag":
+            tags.extend(line.split())
+            continue
+        stripped = line.strip()
+        if not in_text and (not stripped or stripped.startswith("#")):
+            continue
+        reader.push_back((line, in_text))
+        break
+    return tags
+
+
+def _stream_loop(
+    reader: _LineReader,
+    tags: List[str],
+    prefix: str,
+    wanted: Optional[List[str]],
+    tokenizer,
+    chunk_size: int,
+    as_columns: bool,
+) -> Iterator[RowChunk]:
+    """Tokenize a loop body in bounded batches of lines and emit row chunks."""
+    names = [_strip_category(tag, prefix) for tag in tags]
+    width = len(names)
+    if wanted is None:
+        wanted = names
+    lookup = {name.lower(): i for i, name in enumerate(names)}
+    missing = [name for name in wanted if name.lower() not in lookup]
+    if missing:
+        raise KeyError(f"Items not found in {prefix[:-1]}: {missing}")
+    indices = [lookup[name.lower()] for name in wanted]
+
+    tokens: List[str] = []
+    buffer: List[str] = []
+
+    def emit(final: bool) -> Iterator[RowChunk]:
+        nonlocal tokens
+        row_total = len(tokens) // width
+        start = 0
+        while row_total - start // width >= (1 if final else chunk_size):
+            rows = min(chunk_size, row_total - start // width)
+            stop = start + rows * width
+            columns = [tokens[start + i : stop : width] for i in indices]
+            yield _make_chunk(wanted, columns, as_columns)
+            start = stop
+        tokens = tokens[start:]
+
+    for line, in_text in reader:
+        if not in_text and _line_kind(line) in _SECTION_KINDS:
+            reader.push_back((line, in_text))
+            break
+        buffer.append(line)
+        if len(buffer) >= chunk_size and not reader.in_text:
+            tokens.extend(tokenizer.loop_values(buffer))
+            buffer = []
+            yield from emit(final=False)
+
+    tokens.extend(tokenizer.loop_values(buffer))
+    yield from emit(final=True)
+    if tokens:
+        raise ValueError(
+            f"Wrong number of values in loop {prefix[:-1]}: "
+            f"{len(tokens)} values left over for {width} items"
+        )
+
+
+def _pair_chunk(
+    pair_lines: List[str],
+    prefix: str,
+    wanted: Optional[List[str]],
+    tokenizer,
+    as_columns: bool,
+) -> RowChunk:
+    """Turn the key-value lines of a category into a one-row chunk."""
+    pairs = {
+        _strip_category(tag, prefix): value
+        for tag, value in tokenizer.pairs(pair_lines)
+    }
+    if wanted is None:
+        wanted = list(pairs)
+    missing = [name for name in wanted if name not in pairs]
+    if missing:
+        raise KeyError(f"Items not found in {prefix[:-1]}: {missing}")
+    return _make_chunk(wanted, [[pairs[name]] for name in wanted], as_columns)
+
+
+def _make_chunk(names: List[str], columns: List[List[str]], as_columns: bool) -> RowChunk:
+    if as_columns:
+        return dict(zip(names, columns))
+    return list(zip(*columns))
+
+
+def _strip_category(name: str, prefix: str) -> str:
+    """Turn '_atom_site.Cartn_x' (or 'Cartn_x') into 'Cartn_x'."""
+    if name.lower().startswith(prefix):
+        return name[len(prefix):]
+    return name
+
+
+class _GemmiTokenizer:
+    """Tokenizes buffered lines with gemmi's C++ reader (values as MMCIFParser returns them)."""
+
+    def __init__(self):
+        import gemmi
+
+        self._cif = gemmi.cif
+
+    def loop_values(self, lines: List[str]) -> List[str]:
+        # A one-column loop accepts any number of values, so row boundaries
+        # never need to line up with the chunk boundaries
+        doc = self._cif.read_string("data_stream\nloop_\n_stream.value\n" + "".join(lines))
+        return list(doc[0].find_values("_stream.value"))
+
+    def pairs(self, lines: List[str]) -> List[Tuple[str, str]]:
+        doc = self._cif.read_string("data_stream\n" + "".join(lines))
+        return [item.pair for item in doc[0] if item.pair]
+
+
+class _LegacyTokenizer:
+    """Tokenizes buffered lines with the pure-Python legacy tokenizer."""
+
+    def loop_values(self, lines: List[str]) -> List[str]:
+        tokens: List[str] = []
+        text_field: Optional[List[str]] = None
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if text_field is not None:
+                if line.startswith(";"):
+                    tokens.append("\n".join(text_field))
+                    text_field = None
+                else:
+                    text_field.append(line)
+            elif line.startswith(";"):
+                text_field = [line[1:]]
+            elif not line.lstrip().startswith("#"):
+                tokens.extend(fast_tokenize_loop_line(line))
+        return tokens
+
+    def pairs(self, lines: List[str]) -> List[Tuple[str, str]]:
+        tokens = self.loop_values(lines)
+        return list(zip(tokens[0::2], tokens[1::2]))
+
+
+def _get_tokenizer(backend: Optional[str]):
+    if backend is None:
+        try:
+            return _GemmiTokenizer()
+        except ImportError:
+            return _LegacyTokenizer()
+    if backend == "gemmi":
+        return _GemmiTokenizer()
+    if backend == "legacy":
+        return _LegacyTokenizer()
+    raise ValueError(f"Unknown backend '{backend}', expected one of {STREAM_BACKENDS}")
@@ -8,7 +8,7 @@ The original pure Python implementation has been moved to sloth.legacy.writer
 for compatibility and reference purposes.
 """
 
-from typing import IO
+from typing import IO, Dict, List
 from .models import MMCIFDataContainer, DataBlock
 from .common import BaseWriter
 
@@ -29,6 +29,10 @@ class MMCIFWriter(BaseWriter):
         """
         Write SLOTH data structure to file using gemmi backend
         
+        Categories parsed by MMCIFParser and not modified since (see
+        :attr:`Category.is_dirty`) are copied from the parsed gemmi document
+        as they were read; only the others are rebuilt from their values.
+        
         :param file_obj: The file object to write to
         :type file_obj: IO
         :param mmcif: SLOTH MMCIFDataContainer
@@ -65,6 +69,7 @@ class MMCIFWriter(BaseWriter):
             )
         
         gemmi_block = gemmi.cif.Block(sloth_block.name)
+        source_items = {}  # Items of each source gemmi block by category name
         
         # Iterate through categories properly
         for category_name in sloth_block.categories:
@@ -73,6 +78,18 @@ class MMCIFWriter(BaseWriter):
             # Skip if category has no items
             if not hasattr(sloth_category, 'items') or not sloth_category.items:
                 continue
+            
+            # Unmodified parsed categories are copied from the source document
+            source = sloth_category._source_block
+            if source is not None and not sloth_category.is_dirty:
+                by_category = source_items.get(id(source))
+                if by_category is None:
+                    by_category = source_items[id(source)] = self._index_source_items(source)
+                items = by_category.get(sloth_category.name)
+                if items:
+                    for item in items:
+                        gemmi_block.add_item(item)
+                    continue
                 
             # Get all values and determine max length
             item_values = []
@@ -109,3 +126,16 @@ class MMCIFWriter(BaseWriter):
                     gemmi_block.set_pair(tag, value)
         
         return gemmi_block
+    
+    def _index_source_items(self, source_block) -> Dict[str, List]:
+        """Group the loops and key-value pair items of a gemmi block by category name"""
+        items = {}
+        for item in source_block:
+            if item.loop is not None:
+                tag = item.loop.tags[0]
+            elif item.pair is not None:
+                tag = item.pair[0]
+            else:
+                continue
+            items.setdefault(tag.split(".")[0], []).append(item)
+        return items
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Test suite for column-oriented access to categories.
+
+Covers typed NumPy columns and the other bulk APIs that operate on whole
+item columns instead of individual Row objects.
+"""
+
+import unittest
+
+import numpy as np
+
+from sloth import Category, CategoryView, EncodedItem, MMCIFParser, PackedItem
+from sloth.models import encode_values, pack_values
+
+
+def make_atom_site() -> Category:
+    """Build a small _atom_site category with mixed types and null values."""
+    atom_site = Category("_atom_site")
+    atom_site["id"] = ["1", "2", "3", "4"]
+    atom_site["label_atom_id"] = ["N", "CA", "C", "O"]
+    atom_site["Cartn_x"] = ["1.5", "?", "3.25", "."]
+    atom_site["B_iso_or_equiv"] = ["20.0", "21.0", "22.0", "23.0"]
+    return atom_site
+
+
+class _TypeDictionary:
+    """Stand-in for XMLMappingGenerator's item type lookup."""
+
+    def get_item_type_code(self, item_name):
+        return {"_atom_site.id": "int", "_atom_site.Cartn_x": "float"}.get(item_name, "")
+
+
+class TestTypedColumns(unittest.TestCase):
+    def setUp(self):
+        self.atom_site = make_atom_site()
+
+    def test_float_column_with_null_mask(self):
+        x = self.atom_site.column("Cartn_x", dtype=float)
+        self.assertEqual(x.dtype, np.float64)
+        self.assertEqual(x.mask.tolist(), [False, True, False, True])
+        self.assertEqual(x.compressed().tolist(), [1.5, 3.25])
+        self.assertAlmostEqual(self.atom_site.column("B_iso_or_equiv", float).mean(), 21.5)
+
+    def test_dtype_from_dictionary(self):
+        ids = self.atom_site.column("id", dictionary=_TypeDictionary())
+        self.assertEqual(ids.dtype.kind, "i")
+        self.assertEqual(ids.tolist(), [1, 2, 3, 4])
+        names = self.atom_site.column("label_atom_id", dictionary=_TypeDictionary())
+        self.assertEqual(names.tolist(), ["N", "CA", "C", "O"])
+
+    def test_cache_and_invalidation(self):
+        x = self.atom_site.column("Cartn_x", dtype=float)
+        b = self.atom_site.column("B_iso_or_equiv", dtype=float)
+        self.assertIs(self.atom_site.column("Cartn_x", dtype=float), x)
+        with self.assertRaises(ValueError):
+            x[0] = 2.0
+
+        self.atom_site["Cartn_x"] = ["9.0", "8.0", "7.0", "6.0"]
+        self.assertEqual(self.atom_site.column("Cartn_x", float).tolist(), [9.0, 8.0, 7.0, 6.0])
+        self.assertIs(self.atom_site.column("B_iso_or_equiv", dtype=float), b)
+
+    def test_in_place_edits_invalidate(self):
+        self.atom_site["Cartn_x"] = ["1.0", "2.0", "3.0", "4.0"]
+        self.assertEqual(self.atom_site.column("Cartn_x", float)[0], 1.0)
+        self.atom_site.Cartn_x[0] = "5.0"
+        self.assertEqual(self.atom_site.column("Cartn_x", float)[0], 5.0)
+        self.atom_site["Cartn_x"][1] = "?"
+        self.assertTrue(self.atom_site.column("Cartn_x", float).mask[1])
+        self.atom_site.id.append("5")
+        self.assertEqual(self.atom_site.column("id", int).tolist(), [1, 2, 3, 4, 5])
+
+        # Encoded (parsed) columns are tracked once decoded for editing
+        encoded = Category("_atom_site")
+        encoded["type_symbol"] = encode_values("type_symbol", ["C", "N"] * 600)
+        self.assertEqual(encoded.column("type_symbol", str)[0], "C")
+        encoded.type_symbol[0] = "S"
+        self.assertEqual(encoded.column("type_symbol", str)[0], "S")
+        self.assertEqual(encoded[0].type_symbol, "S")
+        self.assertIs(encoded.type_symbol, encoded.get_item("type_symbol").values)
+
+    def test_assigned_lists_are_kept(self):
+        values = ["1.0", "2.0", "3.0", "4.0"]
+        self.atom_site["Cartn_x"] = values
+        self.assertIs(self.atom_site["Cartn_x"], values)
+        self.assertIs(self.atom_site.Cartn_x, values)
+        self.assertEqual(self.atom_site.column("Cartn_x", float)[0], 1.0)
+        self.assertEqual(self.atom_site.lookup(Cartn_x="1.0")[0].id, "1")
+
+        # Edits through the caller's own reference are seen, caches included
+        values[0] = "5.0"
+        self.assertEqual(self.atom_site["Cartn_x"][0], "5.0")
+        self.assertEqual(self.atom_site[0].Cartn_x, "5.0")
+        self.assertEqual(self.atom_site.column("Cartn_x", float)[0], 5.0)
+        self.assertEqual(self.atom_site.lookup(Cartn_x="1.0"), [])
+        self.assertEqual(self.atom_site.lookup(Cartn_x="5.0")[0].id, "1")
+
+    def test_undecodable_values(self):
+        with self.assertRaises(ValueError):
+            self.atom_site.column("label_atom_id", dtype=float)
+
+
+class TestCoordinates(unittest.TestCase):
+    def setUp(self):
+        self.atom_site = make_atom_site()
+        self.atom_site["Cartn_y"] = ["0.5", "1.0", "1.5", "2.0"]
+        self.atom_site["Cartn_z"] = ["-1.0", "-2.0", "-3.0", "-4.0"]
+
+    def test_coords_array(self):
+        xyz = self.atom_site.coords()
+        self.assertEqual(xyz.shape, (4, 3))
+        self.assertEqual(xyz.dtype, np.float64)
+        self.assertTrue(xyz.flags.c_contiguous)
+        self.assertEqual(xyz[0].tolist(), [1.5, 0.5, -1.0])
+        self.assertTrue(np.isnan(xyz[1, 0]) and np.isnan(xyz[3, 0]))
+        self.assertEqual(self.atom_site.coords(np.float32).dtype, np.float32)
+        with self.assertRaises(ValueError):
+            xyz[0, 0] = 2.0
+        with self.assertRaises(ValueError):
+            self.atom_site.coords(int)
+
+    def test_cache_and_invalidation(self):
+        xyz = self.atom_site.coords()
+        self.assertIs(self.atom_site.coords(), xyz)
+        self.atom_site["B_iso_or_equiv"] = ["1.0", "1.0", "1.0", "1.0"]
+        self.assertIs(self.atom_site.coords(), xyz)
+        self.atom_site["Cartn_y"] = ["9.0", "9.0", "9.0", "9.0"]
+        self.assertEqual(self.atom_site.coords()[:, 1].tolist(), [9.0] * 4)
+
+    def test_in_place_edits_invalidate(self):
+        self.atom_site["Cartn_x"] = ["1.0", "2.0", "3.0", "4.0"]
+        index = self.atom_site.spatial_index()
+        self.assertEqual(self.atom_site.coords()[0, 0], 1.0)
+        self.atom_site.Cartn_x[0] = "5.0"
+        self.assertEqual(self.atom_site.coords()[0, 0], 5.0)
+        self.assertEqual(self.atom_site.coords(np.float32)[0, 0], 5.0)
+        self.assertIsNot(self.atom_site.spatial_index(), index)
+        self.assertEqual(self.atom_site.spatial_index().neighbors((5.0, 0.5, -1.0), 0.1).tolist(), [0])
+
+    def test_set_coords(self):
+        xyz = np.array(self.atom_site.coords())
+        xyz[:, 0] = [1.23456, np.nan, -0.5, 10.0]
+        self.atom_site.set_coords(xyz)
+        self.assertEqual(self.atom_site.Cartn_x, ["1.235", "?", "-0.500", "10.000"])
+        self.assertEqual(self.atom_site.Cartn_z, ["-1.000", "-2.000", "-3.000", "-4.000"])
+        self.assertAlmostEqual(self.atom_site.coords()[0, 0], 1.235)
+
+        self.atom_site.set_coords(xyz + 1.0, decimals=1)
+        self.assertEqual(self.atom_site.Cartn_y, ["1.5", "2.0", "2.5", "3.0"])
+        with self.assertRaises(ValueError):
+            self.atom_site.set_coords(xyz[:2])
+
+    def test_view_coords(self):
+        view = self.atom_site.view([2, 0])
+        self.assertEqual(view.coords().tolist(), [[3.25, 1.5, -3.0], [1.5, 0.5, -1.0]])
+
+
+class TestDictionaryEncoding(unittest.TestCase):
+    def setUp(self):
+        rows = [f"{i} {'CNOS'[i % 4]} {i * 0.5:.3f}" for i in range(2000)]
+        content = "data_T\nloop_\n_atom_site.id\n_atom_site.type_symbol\n_atom_site.Cartn_x\n"
+        self.atom_site = MMCIFParser().parse_string(content + "\n".join(rows) + "\n").data[0]._atom_site
+
+    def test_encoding_follows_cardinality(self):
+        self.assertIsInstance(self.atom_site.get_item("type_symbol"), EncodedItem)
+        self.assertIsInstance(self.atom_site.get_item("id"), list)
+        self.assertIsInstance(self.atom_site.get_item("Cartn_x"), list)
+        self.assertEqual(encode_values("short", ["A", "A"]), ["A", "A"])
+
+    def test_encoded_column_decodes_on_access(self):
+        item = self.atom_site.get_item("type_symbol")
+        self.assertEqual(item.table, ["C", "N", "O", "S"])
+        self.assertEqual(len(item.codes), 2000)
+
+        symbols = self.atom_site.column("type_symbol")
+        self.assertEqual((symbols == "O").sum(), 500)
+        self.assertFalse(item.is_loaded)
+
+        self.assertEqual(self.atom_site[5].type_symbol, "N")
+        self.assertEqual(self.atom_site.type_symbol[:4], ["C", "N", "O", "S"])
+        self.assertTrue(item.is_loaded)
+        self.assertIsNone(item.codes)
+
+
+class TestColumnarStorage(unittest.TestCase):
+    def setUp(self):
+        rows = [f"{i} {'CNOS'[i % 4]} {i * 0.5:.3f} 'name {i}'" for i in range(2000)]
+        content = (
+            "data_T\nloop_\n_atom_site.id\n_atom_site.type_symbol\n"
+            "_atom_site.Cartn_x\n_atom_site.label\n"
+        )
+        parser = MMCIFParser(columnar=True)
+        self.atom_site = parser.parse_string(content + "\n".join(rows) + "\n").data[0]._atom_site
+
+    def test_columns_are_packed_or_encoded(self):
+        items = {name: type(self.atom_site.get_item(name)) for name in self.atom_site.items}
+        self.assertEqual(
+            items,
+            {"id": PackedItem, "type_symbol": EncodedItem, "Cartn_x": PackedItem, "label": PackedItem},
+        )
+        self.assertEqual(pack_values("short", ["a\0b", "c"]), ["a\0b", "c"])
+
+    def test_rows_and_columns_read_the_buffer(self):
+        x = self.atom_site.get_item("Cartn_x")
+        self.assertEqual(self.atom_site[3].Cartn_x, "1.500")
+        self.assertEqual(self.atom_site[-1]["id"], "1999")
+        self.assertEqual(self.atom_site[7].data["label"], "'name 7'")
+        self.assertAlmostEqual(self.atom_site.column("Cartn_x", float).sum(), 999500.0)
+        self.assertFalse(x.is_loaded)
+        self.assertGreater(x.nbytes, 0)
+
+        self.atom_site.Cartn_x[0] = "9.000"
+        self.assertTrue(x.is_loaded)
+        self.assertEqual(self.atom_site[0].Cartn_x, "9.000")
+
+    def test_unicode_values(self):
+        item = pack_values("name", ["Å", "", "αβ"] * 500)
+        self.assertEqual(item[2], "αβ")
+        self.assertEqual(item[1], "")
+        self.assertEqual(item.values[:3], ["Å", "", "αβ"])
+
+
+class TestSelection(unittest.TestCase):
+    def setUp(self):
+        rows = [
+            f"{i} {'AB'[i // 1000]} {('N', 'CA', 'C', 'CB')[i % 4]} {i % 50 if i % 7 else '?'}"
+            for i in range(2000)
+        ]
+        content = (
+            "data_T\nloop_\n_atom_site.id\n_atom_site.label_asym_id\n"
+            "_atom_site.label_atom_id\n_atom_site.B_iso_or_equiv\n"
+        )
+        self.atom_site = MMCIFParser().parse_string(content + "\n".join(rows) + "\n").data[0]._atom_site
+
+    def expected(self, predicate):
+        return [row.id for row in self.atom_site if predicate(row)]
+
+    def test_select_returns_view(self):
+        view = self.atom_site.select(
+            "label_asym_id == 'A' and label_atom_id in ('CA', 'CB') and B_iso_or_equiv > 30"
+        )
+        self.assertIsInstance(view, CategoryView)
+        self.assertEqual(
+            view.id,
+            self.expected(
+                lambda row: row.label_asym_id == "A"
+                and row.label_atom_id in ("CA", "CB")
+                and row.B_iso_or_equiv != "?"
+                and float(row.B_iso_or_equiv) > 30
+            ),
+        )
+        self.assertEqual(view[0].label_atom_id, view.parent[view.indices[0]].label_atom_id)
+        self.assertFalse(self.atom_site.get_item("label_atom_id").is_loaded)
+
+    def test_operators(self):
+        self.assertEqual(self.atom_site.select("B_iso_or_equiv == '?'").row_count, 286)
+        self.assertEqual(self.atom_site.select("not B_iso_or_equiv >= 0").row_count, 286)
+        self.assertEqual(
+            self.atom_site.select("10 < B_iso_or_equiv <= 12 or label_atom_id not in ('N', 'CA', 'C')").id,
+            self.expected(
+                lambda row: row.label_atom_id == "CB"
+                or (row.B_iso_or_equiv != "?" and 10 < float(row.B_iso_or_equiv) <= 12)
+            ),
+        )
+        self.assertEqual(self.atom_site.select("id in (1, 2, 1999)").id, ["1", "2", "1999"])
+
+    def test_chained_selection(self):
+        view = self.atom_site.select("label_asym_id == 'B'").select("B_iso_or_equiv < -1 or id == '1001'")
+        self.assertEqual(view.id, ["1001"])
+        self.assertEqual(view.column("id", int).tolist(), [1001])
+
+    def test_writing_materializes_view(self):
+        view = self.atom_site.select("label_atom_id == 'CA'")
+        copy = view.materialize()
+        view["id"] = ["x"] * view.row_count
+        self.assertTrue(view.is_materialized)
+        self.assertEqual(view[0].id, "x")
+        self.assertEqual(copy[0].id, "1")
+        self.assertEqual(self.atom_site[1].id, "1")
+
+        # Editing an attribute's list in place materialises the view as well
+        view = self.atom_site.select("label_atom_id == 'CA'")
+        view.id[0] = "zz"
+        self.assertTrue(view.is_materialized)
+        self.assertEqual(view[0].id, "zz")
+        self.assertEqual(view.get_item("id")[0], "zz")
+        self.assertEqual([row.id for row in view][0], "zz")
+        self.assertEqual(view.materialize().id[0], "zz")
+        self.assertEqual(self.atom_site[1].id, "1")
+
+    def test_invalid_expressions(self):
+        for expression in ("label_atom_id = 'CA'", "len(id) > 1", "id in id", "1 == 1"):
+            with self.assertRaises(ValueError):
+                self.atom_site.select(expression)
+        with self.assertRaises(KeyError):
+            self.atom_site.select("missing == 'x'")
+
+
+class TestGroupBy(unittest.TestCase):
+    def setUp(self):
+        rows = [
+            f"{i} {'AB'[i // 1000]} {i // 10 % 100} {('N', 'CA', 'C', 'CB')[i % 4]} {i % 50 if i % 7 else '?'}"
+            for i in range(2000)
+        ]
+        content = (
+            "data_T\nloop_\n_atom_site.id\n_atom_site.label_asym_id\n_atom_site.label_seq_id\n"
+            "_atom_site.label_atom_id\n_atom_site.B_iso_or_equiv\n"
+        )
+        self.atom_site = MMCIFParser().parse_string(content + "\n".join(rows) + "\n").data[0]._atom_site
+
+    def test_per_residue_statistics(self):
+        groups = self.atom_site.group_by("label_asym_id", "label_seq_id")
+        result = groups.agg(B_iso_or_equiv="mean", id="count", n_names=("label_atom_id", "nunique"))
+        self.assertEqual(len(groups), 200)
+        self.assertEqual(result.row_count, 200)
+        self.assertEqual(list(result.items), ["label_asym_id", "label_seq_id", "B_iso_or_equiv", "id", "n_names"])
+        self.assertEqual(result[0].data, {
+            "label_asym_id": "A", "label_seq_id": "0", "B_iso_or_equiv": "4.75", "id": "10", "n_names": "4",
+        })
+        self.assertEqual((result[100].label_asym_id, result[100].label_seq_id), ("B", "0"))
+
+        b_factors = [float(row.B_iso_or_equiv) for row in self.atom_site if row.label_seq_id == "1"
+                     and row.label_asym_id == "A" and row.B_iso_or_equiv != "?"]
+        self.assertAlmostEqual(float(result[1].B_iso_or_equiv), sum(b_factors) / len(b_factors), places=6)
+
+    def test_aggregates(self):
+        result = self.atom_site.group_by("label_atom_id").agg(
+            total=("B_iso_or_equiv", "sum"),
+            low=("B_iso_or_equiv", "min"),
+            high=("B_iso_or_equiv", "max"),
+            known=("B_iso_or_equiv", "count"),
+            rows=("id", "size"),
+            first=("id", "first"),
+            last=("id", "last"),
+        )
+        self.assertEqual(result.label_atom_id, ["N", "CA", "C", "CB"])
+        self.assertEqual(result[0].data["rows"], "500")
+        self.assertEqual((result[1].first, result[1].last), ("1", "1997"))
+        self.assertEqual((result[0].low, result[0].high), ("0.0", "48.0"))
+        known = [row for row in self.atom_site if row.label_atom_id == "CA" and row.B_iso_or_equiv != "?"]
+        self.assertEqual(result[1].known, str(len(known)))
+        self.assertEqual(float(result[1].total), sum(float(row.B_iso_or_equiv) for row in known))
+
+    def test_result_formatting_and_name(self):
+        category = Category("_atom_site")
+        category["label_asym_id"] = ["A", "A", "B"]
+        category["B_iso_or_equiv"] = ["0.1", "0.2", "18.5"]
+        groups = category.group_by("label_asym_id")
+        result = groups.agg(total=("B_iso_or_equiv", "sum"), mean=("B_iso_or_equiv", "mean"))
+        self.assertEqual(result.total, ["0.3", "18.5"])
+        self.assertEqual(result.mean, ["0.15", "18.5"])
+        self.assertNotEqual(result.name, category.name)
+
+        named = groups.agg("_chain_stats", name=("B_iso_or_equiv", "max"))
+        self.assertEqual(named.name, "_chain_stats")
+        self.assertEqual(named["name"], ["0.2", "18.5"])
+
+    def test_groups_are_views(self):
+        key, view = next(iter(self.atom_site.select("label_asym_id == 'B'").group_by("label_seq_id")))
+        self.assertEqual(key, ("0",))
+        self.assertIsInstance(view, CategoryView)
+        self.assertEqual(view.id, [str(i) for i in range(1000, 1010)])
+
+    def test_invalid_aggregates(self):
+        groups = self.atom_site.group_by("label_asym_id")
+        with self.assertRaises(ValueError):
+            groups.agg(id="median")
+        with self.assertRaises(ValueError):
+            groups.agg(label_asym_id="count")
+        with self.assertRaises(KeyError):
+            self.atom_site.group_by("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
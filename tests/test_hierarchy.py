@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test suite for the model/chain/residue/atom hierarchy (sloth.hierarchy).
+"""
+
+import unittest
+
+from sloth import CategoryView, MMCIFParser
+
+SAMPLE = """data_T
+loop_
+_atom_site.group_PDB
+_atom_site.id
+_atom_site.label_atom_id
+_atom_site.label_comp_id
+_atom_site.label_asym_id
+_atom_site.label_seq_id
+_atom_site.auth_seq_id
+_atom_site.pdbx_PDB_ins_code
+_atom_site.B_iso_or_equiv
+_atom_site.pdbx_PDB_model_num
+ATOM 1 N GLY A 1 1 ? 10.0 1
+ATOM 2 CA GLY A 1 1 ? 12.0 1
+ATOM 3 N ALA A 2 2 ? 20.0 1
+ATOM 4 CA ALA A 2 2 ? 22.0 1
+ATOM 5 CB ALA A 2 2 ? 24.0 1
+HETATM 6 O HOH B . 101 ? 30.0 1
+HETATM 7 O HOH B . 102 ? 31.0 1
+HETATM 8 O HOH B . 102 A 32.0 1
+ATOM 9 N GLY A 1 1 ? 40.0 2
+ATOM 10 CA GLY A 1 1 ? 42.0 2
+"""
+
+
+class TestHierarchy(unittest.TestCase):
+    def setUp(self):
+        self.block = MMCIFParser().parse_string(SAMPLE).data[0]
+        self.hierarchy = self.block.hierarchy()
+
+    def test_navigation(self):
+        self.assertEqual(self.hierarchy.models, ["1", "2"])
+        self.assertEqual(self.hierarchy.residue_count, 6)
+        self.assertEqual(self.hierarchy["A"][2]["CB"].id, "5")
+        self.assertEqual(self.hierarchy.model(2)["A"][1]["CA"].id, "10")
+        self.assertEqual(self.hierarchy.model("1").chains, ["A", "B"])
+        self.assertEqual([residue.name for residue in self.hierarchy["A"]], ["GLY", "ALA"])
+        self.assertEqual(self.hierarchy["A"][2].atom_names, ["N", "CA", "CB"])
+        with self.assertRaises(KeyError):
+            self.hierarchy["A"][2]["CG"]
+        with self.assertRaises(KeyError):
+            self.hierarchy.model(3)
+
+    def test_non_polymer_residues_use_author_numbering(self):
+        waters = self.hierarchy["B"]
+        self.assertEqual(waters.residue_ids, ["101", "102", "102A"])
+        self.assertEqual(waters["102A"]["O"].id, "8")
+        self.assertIn(101, waters)
+
+    def test_atoms_are_views(self):
+        residue = self.hierarchy["A"][2]
+        atoms = residue.atoms
+        self.assertIsInstance(atoms, CategoryView)
+        self.assertIs(atoms.parent, self.block._atom_site)
+        self.assertEqual(atoms.column("B_iso_or_equiv", float).mean(), 22.0)
+        self.assertEqual(self.hierarchy["A"].atoms.id, ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.hierarchy.model(2).atoms.id, ["9", "10"])
+
+    def test_cache_and_invalidation(self):
+        atom_site = self.block._atom_site
+        self.assertIs(self.block.hierarchy(), self.hierarchy)
+        atom_site["B_iso_or_equiv"] = list(atom_site.B_iso_or_equiv)
+        self.assertIs(self.block.hierarchy(), self.hierarchy)
+        atom_site["label_asym_id"] = ["A"] * 5 + ["C"] * 3 + ["A"] * 2
+        self.assertEqual(self.block.hierarchy().model(1).chains, ["A", "C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test suite for the sidecar byte-offset index (sloth.index).
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from sloth import MMCIFHandler
+from sloth.index import INDEX_SUFFIX, load_index, read_indexed_categories
+
+SAMPLE = """data_FIRST
+_entry.id FIRST
+loop_
+_pdbx_struct_assembly.id
+_pdbx_struct_assembly.details
+1 author_defined_assembly
+2 'software defined'
+#
+loop_
+_atom_site.id
+_atom_site.Cartn_x
+1 1.0
+2 2.0
+#
+data_SECOND
+_entry.id SECOND
+"""
+
+
+class TestSidecarIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "test.cif")
+        with open(self.path, "w") as f:
+            f.write(SAMPLE)
+        self.handler = MMCIFHandler()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_selective_parse_through_index(self):
+        index_path = self.handler.build_index(self.path)
+        self.assertEqual(index_path, self.path + INDEX_SUFFIX)
+        index = load_index(self.path)
+        self.assertIsNotNone(index)
+
+        text = read_indexed_categories(self.path, index, {"_pdbx_struct_assembly"})
+        self.assertNotIn("_atom_site", text)
+
+        expected = self.handler.parse(
+            self.path, categories=["_pdbx_struct_assembly"], use_index=False
+        )
+        container = self.handler.parse(self.path, categories=["_pdbx_struct_assembly"])
+        self.assertEqual([block.name for block in container.data], ["FIRST", "SECOND"])
+        self.assertEqual(
+            container.data[0]._pdbx_struct_assembly.details,
+            expected.data[0]._pdbx_struct_assembly.details,
+        )
+
+        container = self.handler.parse(self.path, items=["_atom_site.Cartn_x"])
+        self.assertEqual(list(container.data[0].categories), ["_atom_site"])
+        self.assertEqual(container.data[0]._atom_site.Cartn_x, ["1.0", "2.0"])
+
+    def test_stale_index_is_ignored(self):
+        self.handler.build_index(self.path)
+        with open(self.path, "a") as f:
+            f.write("_extra.id 1\n")
+        self.assertIsNone(load_index(self.path))
+        container = self.handler.parse(self.path, categories=["_entry"])
+        self.assertEqual(container.data[1]._entry.id, ["SECOND"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,7 @@ from sloth import (
     PickleLoader,
     CsvLoader,
     DictToMMCIFConverter,
+    EncodedItem,
 )
 
 
@@ -85,6 +86,330 @@ _database_2.database_code    7XJP
         finally:
             os.unlink(temp_file)
 
+    def test_loop_columns_match_per_cell_extraction(self):
+        import gemmi
+
+        content = """data_LOOP
+loop_
+_atom_site.id
+_atom_site.label_atom_id
+_atom_site.auth_comp_id
+_atom_site.Cartn_x
+1 "O5'" DA 10.1
+2 C1 'D A' ?
+3 N . 12.3
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cif", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        try:
+            mmcif = self.handler.parse(temp_file)
+            atom_site = mmcif["LOOP"]["_atom_site"]
+
+            loop = gemmi.cif.read_file(temp_file)[0].find_loop("_atom_site.id").get_loop()
+            for i, tag in enumerate(loop.tags):
+                expected = [str(loop[row, i]) for row in range(loop.length())]
+                self.assertEqual(atom_site[tag.split(".", 1)[1]], expected)
+        finally:
+            os.unlink(temp_file)
+
+    def test_lazy_mode_defers_column_conversion(self):
+        content = """data_LAZY
+_entry.id LAZY
+loop_
+_atom_site.id
+_atom_site.label_atom_id
+_atom_site.Cartn_x
+1 N 10.1
+2 CA 11.2
+3 C 12.3
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cif", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        try:
+            eager = self.handler.parse(temp_file)
+            lazy = self.handler.parse(temp_file, lazy=True)
+            atom_site = lazy["LAZY"]["_atom_site"]
+
+            self.assertEqual(atom_site.row_count, 3)
+            self.assertFalse(atom_site.get_item("Cartn_x").is_loaded)
+
+            self.assertEqual(atom_site.Cartn_x, ["10.1", "11.2", "12.3"])
+            self.assertTrue(atom_site.get_item("Cartn_x").is_loaded)
+            self.assertFalse(atom_site.get_item("label_atom_id").is_loaded)
+
+            self.assertEqual(atom_site[1].label_atom_id, "CA")
+            self.assertEqual(lazy["LAZY"]["_entry"].id, ["LAZY"])
+            self.assertEqual(
+                atom_site.data, eager["LAZY"]["_atom_site"].data
+            )
+        finally:
+            os.unlink(temp_file)
+
+    def test_item_projection(self):
+        content = """data_PROJ
+_entry.id PROJ
+_struct.title 'Projected entry'
+_struct.pdbx_descriptor ?
+loop_
+_atom_site.id
+_atom_site.type_symbol
+_atom_site.label_atom_id
+_atom_site.Cartn_x
+_atom_site.Cartn_y
+_atom_site.Cartn_z
+1 N N 1.0 2.0 3.0
+2 C CA 4.0 5.0 6.0
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cif", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        try:
+            mmcif = self.handler.parse(
+                temp_file,
+                categories=["_entry"],
+                items=["_atom_site.Cartn_x", "_atom_site.label_atom_id", "_struct.title"],
+            )
+            block = mmcif["PROJ"]
+            self.assertEqual(
+                sorted(block.categories), ["_atom_site", "_entry", "_struct"]
+            )
+            self.assertEqual(list(block._atom_site.items), ["label_atom_id", "Cartn_x"])
+            self.assertEqual(block._atom_site.Cartn_x, ["1.0", "4.0"])
+            self.assertEqual(block._atom_site[1].label_atom_id, "CA")
+            self.assertEqual(list(block._struct.items), ["title"])
+            self.assertEqual(block._entry.id, ["PROJ"])
+
+            lazy = self.handler.parse(temp_file, items=["_atom_site.Cartn_y"], lazy=True)
+            self.assertEqual(list(lazy["PROJ"].categories), ["_atom_site"])
+            self.assertEqual(lazy["PROJ"]._atom_site.Cartn_y, ["2.0", "5.0"])
+        finally:
+            os.unlink(temp_file)
+
+    def test_row_filters(self):
+        rows = "\n".join(
+            f"{i} {'H' if i % 3 == 0 else 'C'} {'CA' if i % 2 else 'CB'} {float(i)}"
+            for i in range(1, 41)
+        )
+        content = f"""data_FILT
+_entry.id FILT
+loop_
+_atom_site.id
+_atom_site.type_symbol
+_atom_site.label_atom_id
+_atom_site.Cartn_x
+{rows}
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cif", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        expected_ids = [str(i) for i in range(1, 41) if i % 2 and i % 3]
+        try:
+            for lazy in (False, True):
+                mmcif = self.handler.parse(
+                    temp_file,
+                    lazy=lazy,
+                    row_filters={
+                        "_atom_site.label_atom_id": "CA",
+                        "_atom_site.type_symbol": lambda v: v != "H",
+                    },
+                )
+                atom_site = mmcif["FILT"]._atom_site
+                self.assertEqual(atom_site.row_count, len(expected_ids))
+                self.assertEqual(atom_site.id, expected_ids)
+                self.assertEqual(atom_site.Cartn_x[0], "1.0")
+                self.assertEqual(set(atom_site.label_atom_id), {"CA"})
+                self.assertEqual(mmcif["FILT"]._entry.id, ["FILT"])
+
+            # Membership filters keep most rows and take the bulk path
+            mmcif = self.handler.parse(
+                temp_file, row_filters={"_atom_site.type_symbol": ("C", "N")}
+            )
+            self.assertEqual(mmcif["FILT"]._atom_site.row_count, 27)
+
+            # Few survivors: only the kept rows' cells are fetched
+            mmcif = self.handler.parse(
+                temp_file, row_filters={"_atom_site.id": {"2", "39"}}
+            )
+            self.assertEqual(mmcif["FILT"]._atom_site.Cartn_x, ["2.0", "39.0"])
+
+            # Key-value categories are filtered as a single row
+            mmcif = self.handler.parse(temp_file, row_filters={"_entry.id": "OTHER"})
+            self.assertEqual(mmcif["FILT"]._entry.row_count, 0)
+        finally:
+            os.unlink(temp_file)
+
+    def test_model_selection(self):
+        rows = "\n".join(
+            f"{model * 10 + i} A {i} CA {float(model)} {model}"
+            for model in (1, 2, 3)
+            for i in range(1, 5)
+        )
+        content = f"""data_NMR
+_entry.id NMR
+loop_
+_atom_site.id
+_atom_site.label_asym_id
+_atom_site.label_seq_id
+_atom_site.label_atom_id
+_atom_site.Cartn_x
+_atom_site.pdbx_PDB_model_num
+{rows}
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cif", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        try:
+            for lazy in (False, True):
+                mmcif = self.handler.parse(temp_file, lazy=lazy, models=[2])
+                atom_site = mmcif["NMR"]._atom_site
+                self.assertEqual(atom_site.id, ["21", "22", "23", "24"])
+                self.assertEqual(set(atom_site.pdbx_PDB_model_num), {"2"})
+                self.assertEqual(mmcif["NMR"]._entry.id, ["NMR"])
+
+            # Model numbers may be given as strings and combine with row filters
+            mmcif = self.handler.parse(
+                temp_file, models=["1", "3"], row_filters={"_atom_site.label_seq_id": "4"}
+            )
+            self.assertEqual(mmcif["NMR"]._atom_site.id, ["14", "34"])
+
+            models = list(self.handler.iter_models(temp_file))
+            self.assertEqual([model for model, _ in models], ["1", "2", "3"])
+            for model, container in models:
+                atom_site = container["NMR"]._atom_site
+                self.assertEqual(atom_site.row_count, 4)
+                self.assertEqual(set(atom_site.Cartn_x), {f"{float(model)}"})
+            # Categories without a model number are converted once and shared
+            self.assertIs(models[0][1]["NMR"]._entry, models[2][1]["NMR"]._entry)
+
+            # A model selection limits the yielded models
+            models = list(self.handler.iter_models(temp_file, models=[3, "1"]))
+            self.assertEqual([model for model, _ in models], ["1", "3"])
+            self.assertEqual(models[1][1]["NMR"]._atom_site.id[0], "31")
+            from sloth import MMCIFParser
+            self.assertEqual(
+                [model for model, _ in MMCIFParser(models=["2"]).iter_models(temp_file)], ["2"]
+            )
+
+            models = list(self.handler.iter_models(temp_file, categories=["_entry"]))
+            self.assertEqual([model for model, _ in models], ["1"])
+            self.assertEqual(list(models[0][1]["NMR"].categories), ["_entry"])
+        finally:
+            os.unlink(temp_file)
+
+        # Rows of a model need not be contiguous
+        from sloth.parser import _group_rows
+
+        groups = _group_rows(["1", "1", "2", "2", "1", "3"])
+        self.assertEqual(groups, {"1": [0, 1, 4], "2": range(2, 4), "3": range(5, 6)})
+
+    def test_parse_in_memory_and_compressed(self):
+        import bz2
+        import gzip
+        import io
+        import lzma
+        from sloth import MMCIFParser
+
+        parser = MMCIFParser(categories=["_database_2"])
+        raw = self.mmcif_content.encode("utf-8")
+
+        def check(mmcif):
+            self.assertEqual(mmcif["7XJP"]._database_2.database_code, ["7XJP"])
+
+        check(parser.parse_string(self.mmcif_content))
+        check(parser.parse_bytes(raw))
+        check(parser.parse_stream(io.StringIO(self.mmcif_content)))
+        for compress in (gzip.compress, bz2.compress, lzma.compress):
+            check(parser.parse_bytes(compress(raw)))
+            check(parser.parse_stream(io.BytesIO(compress(raw))))
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for suffix, compress in ((".gz", gzip.compress), (".bz2", bz2.compress), (".xz", lzma.compress)):
+                path = os.path.join(temp_dir, f"7xjp.cif{suffix}")
+                with open(path, "wb") as f:
+                    f.write(compress(raw))
+                check(parser.parse_file(path))
+                check(MMCIFImporter.auto_detect_format(path))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_blocks_are_converted_on_first_access(self):
+        from sloth import MMCIFParser
+
+        content = "data_A\n_entry.id A\ndata_B\n_entry.id B\ndata_C\n_entry.id C\n"
+        mmcif = MMCIFParser().parse_string(content)
+        self.assertEqual(list(mmcif.blocks), ["data_A", "data_B", "data_C"])
+        self.assertFalse(any(mmcif.data.is_loaded(name) for name in "ABC"))
+
+        self.assertEqual(mmcif.data_B._entry.id, ["B"])
+        self.assertTrue(mmcif.data.is_loaded("B"))
+        self.assertFalse(mmcif.data.is_loaded("A"))
+        self.assertIs(mmcif["B"], mmcif.data[1])
+
+        self.assertEqual([block.name for block in mmcif], ["A", "B", "C"])
+        self.assertTrue(all(mmcif.data.is_loaded(name) for name in "ABC"))
+
+    def test_save_frames_are_converted_on_first_access(self):
+        from sloth import MMCIFParser
+
+        content = (
+            "data_test.dic\n"
+            "_dictionary.title test.dic\n"
+            "save_entry\n_category.id entry\n_category_key.name '_entry.id'\nsave_\n"
+            "save__entry.id\n_item.name '_entry.id'\n_item.category_id entry\n"
+            "_item_type.code code\nsave_\n"
+        )
+        block = MMCIFParser().parse_string(content).data[0]
+        self.assertEqual(block.categories, ["_dictionary"])
+        self.assertEqual(block.frames.keys(), ["entry", "_entry.id"])
+        self.assertFalse(block.frames.is_loaded("entry"))
+
+        frame = block.frames["save__entry.id"]
+        self.assertEqual(frame.name, "_entry.id")
+        self.assertEqual(frame._item_type.code, ["code"])
+        self.assertFalse(block.frames.is_loaded("entry"))
+        self.assertEqual(block.frames[0]._category.id, ["entry"])
+
+    def test_dictionary_definitions_from_save_frames(self):
+        from sloth.serializers import XMLMappingGenerator
+
+        content = (
+            "data_test.dic\n"
+            "save_entry\n_category.id entry\n_category.mandatory_code yes\n"
+            "_category.description\n;\n   Entry\n\n   details.\n;\n"
+            "_category_key.name '_entry.id'\nsave_\n"
+            "save__entry.id\nloop_\n_item.name\n_item.category_id\n_item.mandatory_code\n"
+            "'_entry.id' entry yes\n'_other.entry_id' other no\n"
+            "_item_type.code code\nsave_\n"
+            # Descriptions read as the line-based reader did: quoted values are
+            # ignored, '#' lines dropped and the text ends at its first ';'
+            "save_other\n_category.id other\n_category.description 'Quoted'\nsave_\n"
+            "save__entry.title\n_item.name '_entry.title'\n_item.category_id entry\n"
+            "_item.description\n;  Title  ;  rest\n# note\n  more\n;\nsave_\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, "test.dic")
+            with open(dict_file, "w") as f:
+                f.write(content)
+            generator = XMLMappingGenerator(dict_file=dict_file, cache_dir=temp_dir, quiet=True)
+
+            entry = generator.categories["entry"]
+            self.assertEqual(entry["keys"], ["id"])
+            self.assertEqual(entry["mandatory"], "yes")
+            self.assertEqual(entry["description"], "Entry\ndetails.")
+            self.assertEqual(generator.items["_entry.id"]["category_id"], "entry")
+            self.assertEqual(generator.items["_entry.id"]["data_type"], "code")
+            self.assertNotIn("_other.entry_id", generator.items)
+            self.assertEqual(generator.categories["other"]["description"], "")
+            self.assertEqual(generator.items["_entry.title"]["description"], "Title")
+
 
 class TestMMCIFWriter(unittest.TestCase):
     def setUp(self):
@@ -109,6 +434,88 @@ class TestMMCIFWriter(unittest.TestCase):
         expected_content = "data_7XJP\n_database_2.database_id PDB\n_database_2.database_code 7XJP\n"
         mock_file().write.assert_called_with(expected_content)
 
+    def test_unmodified_categories_pass_through(self):
+        from sloth import MMCIFParser
+
+        content = """data_PASS
+_struct.entry_id PASS
+_struct.title 'Two words'
+loop_
+_struct_keywords.entry_id
+_struct_keywords.text
+PASS 'DNA BINDING'
+loop_
+_atom_site.id
+_atom_site.Cartn_x
+1 1.000
+2 2.000
+"""
+        mmcif = MMCIFParser().parse_string(content)
+        block = mmcif["PASS"]
+        self.assertFalse(block.is_dirty)
+        self.assertFalse(block._atom_site.is_dirty)
+
+        output = StringIO()
+        self.writer.write(output, mmcif)
+        written = output.getvalue()
+        # Clean categories are copied as read: quoting and one-row loops are kept
+        self.assertIn("_struct.title 'Two words'", written)
+        self.assertIn("loop_\n_struct_keywords.entry_id\n_struct_keywords.text\nPASS 'DNA BINDING'", written)
+
+        block._struct.title = ["Edited"]
+        self.assertTrue(block._struct.is_dirty)
+        self.assertTrue(block.is_dirty)
+        self.assertFalse(block._atom_site.is_dirty)
+        output = StringIO()
+        self.writer.write(output, mmcif)
+        reparsed = MMCIFParser().parse_string(output.getvalue())["PASS"]
+        self.assertEqual(reparsed._struct.title, ["Edited"])
+        self.assertEqual(reparsed._atom_site.Cartn_x, ["1.000", "2.000"])
+
+        # Filtered or projected categories differ from the source and are rebuilt
+        filtered = MMCIFParser(row_filters={"_atom_site.id": "2"}).parse_string(content)["PASS"]
+        self.assertTrue(filtered._atom_site.is_dirty)
+        self.assertFalse(filtered._struct.is_dirty)
+
+        # Unmodified lazy categories are written without loading their values
+        lazy = MMCIFParser(lazy=True).parse_string(content)
+        self.writer.write(StringIO(), lazy)
+        self.assertFalse(lazy["PASS"]._atom_site.get_item("Cartn_x").is_loaded)
+
+        self.assertTrue(Category("_entity").is_dirty)
+
+    def test_in_place_edits_reach_the_output(self):
+        from sloth import MMCIFParser
+
+        content = """data_EDIT
+_database_2.database_id PDB
+_database_2.database_code EDIT
+loop_
+_atom_site.id
+_atom_site.Cartn_x
+1 1.000
+2 2.000
+"""
+        for lazy in (False, True):
+            mmcif = MMCIFParser(lazy=lazy).parse_string(content)
+            block = mmcif["EDIT"]
+            block._atom_site.Cartn_x[0] = "9.9"
+            block._database_2.database_id[-1] = "X"
+            self.assertTrue(block._atom_site.is_dirty)
+            output = StringIO()
+            self.writer.write(output, mmcif)
+            reparsed = MMCIFParser().parse_string(output.getvalue())["EDIT"]
+            self.assertEqual(reparsed._atom_site.Cartn_x, ["9.9", "2.000"])
+            self.assertEqual(reparsed._database_2.database_id, ["X"])
+
+        # Parsed lists report edits however they were reached
+        mmcif = MMCIFParser().parse_string(content)
+        mmcif["EDIT"]._atom_site.get_item("id")[1] = "7"
+        self.assertTrue(mmcif["EDIT"]._atom_site.is_dirty)
+        output = StringIO()
+        self.writer.write(output, mmcif)
+        self.assertEqual(MMCIFParser().parse_string(output.getvalue())["EDIT"]._atom_site.id, ["1", "7"])
+
 
 class TestMMCIFHandler(unittest.TestCase):
     mmcif_content = """
@@ -142,6 +549,114 @@ _database_2.database_code    7XJP
         finally:
             os.unlink(temp_file)
 
+    def test_parse_many(self):
+        temp_dir = tempfile.mkdtemp()
+        paths = []
+        for i in range(5):
+            path = os.path.join(temp_dir, f"entry{i}.cif")
+            with open(path, "w") as f:
+                f.write(self.mmcif_content.replace("7XJP", f"ENT{i}"))
+                f.write(f"loop_\n_atom_site.id\n_atom_site.Cartn_x\n1 {i}.5\n2 {i}.7\n")
+            paths.append(path)
+
+        try:
+            ordered = list(self.handler.parse_many(paths, workers=2, ordered=True))
+            self.assertEqual([path for path, _ in ordered], paths)
+            for i, (path, mmcif) in enumerate(ordered):
+                expected = self.handler.parse(path)
+                block = mmcif[f"ENT{i}"]
+                self.assertEqual(block._atom_site.data, expected[f"ENT{i}"]._atom_site.data)
+                self.assertEqual(block._database_2.database_code, [f"ENT{i}"])
+
+            # The pool is reused between calls and results arrive as they finish
+            executor = self.handler._executor
+            unordered = dict(
+                self.handler.parse_many(paths, workers=2, categories=["_atom_site"])
+            )
+            self.assertIs(self.handler._executor, executor)
+            self.assertEqual(set(unordered), set(paths))
+            self.assertEqual(list(unordered[paths[3]]["ENT3"].categories), ["_atom_site"])
+        finally:
+            self.handler.close()
+            shutil.rmtree(temp_dir)
+        self.assertIsNone(self.handler._executor)
+
+    def test_parse_many_errors(self):
+        temp_dir = tempfile.mkdtemp()
+        paths = []
+        for i in range(6):
+            path = os.path.join(temp_dir, f"entry{i}.cif")
+            with open(path, "w") as f:
+                f.write(self.mmcif_content.replace("7XJP", f"ENT{i}"))
+            paths.append(path)
+        with open(paths[2], "w") as f:
+            f.write("data_BAD\nloop_\n_atom_site.id\n_atom_site.Cartn_x\n1\n")
+        paths[4] = os.path.join(temp_dir, "missing.cif")
+
+        try:
+            # One bad file does not cost the results of the others
+            results = list(self.handler.parse_many(paths, workers=2, ordered=True, errors="return"))
+            self.assertEqual([path for path, _ in results], paths)
+            for i, (_, result) in enumerate(results):
+                if i in (2, 4):
+                    self.assertIsInstance(result, Exception)
+                else:
+                    self.assertEqual(result[f"ENT{i}"]._database_2.database_code, [f"ENT{i}"])
+            unordered = dict(self.handler.parse_many(paths, workers=2, errors="return"))
+            self.assertEqual(set(unordered), set(paths))
+
+            with self.assertRaises(Exception):
+                list(self.handler.parse_many(paths, workers=2, ordered=True))
+            with self.assertRaises(ValueError):
+                next(self.handler.parse_many(paths, errors="ignore"))
+
+            # Closing the iterator cancels the files not yet started
+            from concurrent.futures import Future
+
+            futures = []
+
+            def submit(*args):
+                futures.append(Future())
+                return futures[-1]
+
+            with patch.object(self.handler._get_executor(2), "submit", side_effect=submit):
+                results = self.handler.parse_many(paths, workers=2, ordered=True, errors="return")
+                self.assertEqual(futures, [])
+                # Fail the first file so the iterator yields without a worker
+                with patch.object(Future, "result", side_effect=OSError("unreadable")):
+                    path, error = next(results)
+                self.assertEqual(path, paths[0])
+                self.assertIsInstance(error, OSError)
+                results.close()
+            self.assertEqual(len(futures), len(paths))
+            self.assertTrue(all(future.cancelled() for future in futures[1:]))
+        finally:
+            self.handler.close()
+            shutil.rmtree(temp_dir)
+
+    def test_parse_many_encoded_columns(self):
+        # Above the encoding threshold low-cardinality columns come back encoded
+        rows = "\n".join(
+            f"{i} {'CNOS'[i % 4]} {'ALA' if i % 2 else 'GLY'} {i * 0.5:.3f}" for i in range(1, 3001)
+        )
+        temp_dir = tempfile.mkdtemp()
+        path = os.path.join(temp_dir, "large.cif")
+        with open(path, "w") as f:
+            f.write("data_LARGE\nloop_\n_atom_site.id\n_atom_site.type_symbol\n"
+                    f"_atom_site.label_comp_id\n_atom_site.Cartn_x\n{rows}\n")
+
+        try:
+            expected = self.handler.parse(path)["LARGE"]._atom_site
+            [(_, mmcif)] = list(self.handler.parse_many([path], workers=1))
+            atom_site = mmcif["LARGE"]._atom_site
+            self.assertIsInstance(atom_site.get_item("type_symbol"), EncodedItem)
+            self.assertEqual(atom_site.row_count, 3000)
+            for item_name in expected.items:
+                self.assertEqual(atom_site[item_name], expected[item_name])
+        finally:
+            self.handler.close()
+            shutil.rmtree(temp_dir)
+
     @patch("builtins.open", new_callable=mock_open)
     def test_write_file(self, mock_file):
         data_block = DataBlock(
@@ -236,6 +751,124 @@ class TestItemAndCategory(unittest.TestCase):
         self.assertEqual(len(item), 2)
         self.assertEqual(list(item), ["value1", "value2"])
 
+    def test_row_iteration_keeps_no_rows(self):
+        """Test that scans do not retain Row objects and indexing uses a bounded cache."""
+        from sloth.models import _ROW_CACHE_SIZE
+
+        category = Category("_atom_site")
+        category["id"] = [str(i) for i in range(_ROW_CACHE_SIZE + 10)]
+        category["type_symbol"] = ["C", "N"] * ((_ROW_CACHE_SIZE + 10) // 2)
+
+        self.assertEqual(sum(1 for row in category if row.type_symbol == "N"), (_ROW_CACHE_SIZE + 10) // 2)
+        self.assertEqual(len(category._row_cache), 0)
+
+        for i in range(_ROW_CACHE_SIZE + 10):
+            category[i]
+        self.assertEqual(len(category._row_cache), _ROW_CACHE_SIZE)
+        self.assertIs(category[-1], category[_ROW_CACHE_SIZE + 9])
+
+        rows = category.cursor()
+        first = next(rows)
+        self.assertEqual(first.id, "0")
+        self.assertIs(next(rows), first)
+        self.assertEqual(first.id, "1")
+
+        self.assertEqual(next(category.itertuples(["type_symbol", "id"])), ("C", "0"))
+        self.assertEqual(list(category.itertuples())[3], ("3", "N"))
+
+    def test_hash_index_lookup(self):
+        """Test unique and composite hash indexes and their invalidation."""
+        category = Category("_atom_site")
+        category["id"] = ["1", "2", "3", "4"]
+        category["label_asym_id"] = ["A", "A", "B", "B"]
+        category["label_atom_id"] = ["N", "CA", "N", "CA"]
+
+        self.assertEqual([row.label_atom_id for row in category.lookup(id="3")], ["N"])
+        self.assertEqual(category.lookup(id="99"), [])
+        self.assertEqual(category.indexes, [("id",)])
+
+        category.create_index(["label_asym_id", "label_atom_id"])
+        rows = category.lookup(label_atom_id="CA", label_asym_id="B")
+        self.assertEqual([row.id for row in rows], ["4"])
+        self.assertEqual([row.id for row in category.lookup(label_asym_id="A")], ["1", "2"])
+
+        category["label_atom_id"] = ["N", "CA", "CB", "CA"]
+        self.assertIsNotNone(category._indexes[("id",)])
+        self.assertEqual(category.lookup(label_asym_id="B", label_atom_id="N"), [])
+        self.assertEqual(category.lookup(label_asym_id="B", label_atom_id="CB")[0].id, "3")
+
+        with self.assertRaises(KeyError):
+            category.create_index("missing")
+        with self.assertRaises(ValueError):
+            category.lookup()
+
+    @patch("sloth.serializers.PDBMLConverter")
+    def test_dictionary_key_indexes(self, mock_converter_class):
+        """Test the pipeline declares dictionary key indexes that lookup() then uses."""
+        from sloth.serializers import MMCIFToPDBMLPipeline
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dict_path = os.path.join(temp_dir, "keys.dic")
+            with open(dict_path, "w") as f:
+                f.write(
+                    "data_keys.dic\n"
+                    "save_atom_site\n_category.id atom_site\n"
+                    "_category_key.name '_atom_site.id'\nsave_\n"
+                    "save_struct_conn\n_category.id struct_conn\n"
+                    "loop_\n_category_key.name\n'_struct_conn.id'\n'_struct_conn.conn_type_id'\nsave_\n"
+                )
+            cif_path = os.path.join(temp_dir, "keys.cif")
+            with open(cif_path, "w") as f:
+                f.write(
+                    "data_KEYS\n"
+                    "loop_\n_atom_site.id\n_atom_site.label_atom_id\n1 N\n2 CA\n"
+                    "loop_\n_struct_conn.id\n_struct_conn.conn_type_id\n_struct_conn.details\n"
+                    "1 covale a\n1 disulf b\n"
+                    "loop_\n_struct_keywords.entry_id\n_struct_keywords.text\nKEYS x\n"
+                )
+            mock_converter_class.return_value.convert_to_pdbml.return_value = "<datablock/>"
+
+            pipeline = MMCIFToPDBMLPipeline(dictionary_path=dict_path, schema_path=os.path.join(temp_dir, "none.xsd"))
+            block = pipeline.process_mmcif_file(cif_path)["mmcif_data"].data[0]
+
+        self.assertEqual(block._atom_site.indexes, [("id",)])
+        self.assertEqual(block._struct_conn.indexes, [("id", "conn_type_id")])
+        self.assertEqual(block._struct_keywords.indexes, [])
+        self.assertIsNone(block._struct_conn._indexes[("id", "conn_type_id")])
+
+        rows = block._struct_conn.lookup(conn_type_id="disulf", id="1")
+        self.assertEqual([row.details for row in rows], ["b"])
+        self.assertEqual(block._struct_conn.indexes, [("id", "conn_type_id")])
+        self.assertIsNotNone(block._struct_conn._indexes[("id", "conn_type_id")])
+
+    def test_category_views(self):
+        """Test views share storage, chain onto the source and materialise on write."""
+        category = Category("_atom_site")
+        category["id"] = [str(i) for i in range(10)]
+        category["label_atom_id"] = ["N", "CA", "C", "O", "CB"] * 2
+
+        view = category.view(slice(2, 9))
+        self.assertEqual(view.row_count, 7)
+        self.assertEqual(view[0].id, "2")
+        self.assertIs(view.get_item("id")._source, category.get_item("id"))
+
+        chained = view.view([0, 2, -1])
+        self.assertIs(chained.parent, category)
+        self.assertEqual(list(chained.indices), [2, 4, 8])
+        self.assertEqual(chained.id, ["2", "4", "8"])
+        self.assertEqual(chained.view(slice(None, None, -1)).id, ["8", "4", "2"])
+        self.assertEqual(list(chained.itertuples(["label_atom_id"])), [("C",), ("CB",), ("O",)])
+
+        chained.label_atom_id = ["X", "Y", "Z"]
+        self.assertTrue(chained.is_materialized)
+        self.assertEqual([row.label_atom_id for row in chained], ["X", "Y", "Z"])
+        self.assertEqual(chained.id, ["2", "4", "8"])
+        self.assertEqual(category.label_atom_id[2], "C")
+        self.assertFalse(view.is_materialized)
+
+        with self.assertRaises(IndexError):
+            category.view([10])
+
     def test_category_with_items(self):
         """Test Category class with items."""
         category = Category("test_category", None)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test suite for the spatial index over atom coordinates (sloth.spatial).
+"""
+
+import unittest
+
+import numpy as np
+
+from sloth import Category
+from sloth.spatial import SpatialIndex
+
+
+def make_atom_site(coordinates) -> Category:
+    """Build an _atom_site category from an N×3 array."""
+    atom_site = Category("_atom_site")
+    atom_site["id"] = [str(i + 1) for i in range(len(coordinates))]
+    for item_name, values in zip(("Cartn_x", "Cartn_y", "Cartn_z"), np.asarray(coordinates).T):
+        atom_site[item_name] = [f"{value:.3f}" for value in values]
+    return atom_site
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.coordinates = np.round(rng.uniform(0, 30, (1500, 3)), 3)
+        self.atom_site = make_atom_site(self.coordinates)
+        difference = self.coordinates[:, None, :] - self.coordinates[None, :, :]
+        self.distances = np.sqrt((difference ** 2).sum(axis=2))
+
+    def test_pairs_within_match_brute_force(self):
+        index = self.atom_site.spatial_index()
+        for radius in (2.5, 4.0, 9.0):
+            first, second = np.nonzero(np.triu(self.distances <= radius, 1))
+            pairs, distances = index.pairs_within(radius, return_distances=True)
+            self.assertEqual(pairs.tolist(), np.column_stack([first, second]).tolist())
+            np.testing.assert_allclose(distances, self.distances[first, second])
+
+    def test_neighbors(self):
+        index = self.atom_site.spatial_index(cell_size=3.0)
+        point = (15.0, 12.0, 18.0)
+        expected = np.flatnonzero(np.sqrt(((self.coordinates - point) ** 2).sum(axis=1)) <= 6.0)
+        self.assertEqual(index.neighbors(point, 6.0).tolist(), expected.tolist())
+        self.assertEqual(index.neighbors((500.0, 0.0, 0.0), 6.0).tolist(), [])
+
+    def test_cross_category_pairs(self):
+        ligand = self.atom_site.view(slice(0, 20))
+        pairs = self.atom_site.spatial_index().pairs_within(3.5, ligand)
+        protein_rows, ligand_rows = np.nonzero(self.distances[:, :20] <= 3.5)
+        self.assertEqual(pairs.tolist(), np.column_stack([protein_rows, ligand_rows]).tolist())
+
+    def test_null_coordinates_and_invalidation(self):
+        index = self.atom_site.spatial_index()
+        self.assertIs(self.atom_site.spatial_index(), index)
+        self.assertEqual(len(index), 1500)
+
+        x = list(self.atom_site.Cartn_x)
+        x[0] = "?"
+        self.atom_site["Cartn_x"] = x
+        index = self.atom_site.spatial_index()
+        self.assertEqual(len(index), 1499)
+        self.assertNotIn(0, index.pairs_within(5.0)[:, 0].tolist())
+
+        self.atom_site["id"] = list(self.atom_site.id)
+        self.assertIs(self.atom_site.spatial_index(), index)
+        self.assertIsNot(self.atom_site.spatial_index(cell_size=6.0), index)
+
+    def test_empty_index(self):
+        index = SpatialIndex(np.zeros((0, 3)))
+        self.assertEqual(index.pairs_within(4.0).shape, (0, 2))
+        self.assertEqual(len(index.neighbors((0, 0, 0), 4.0)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Test suite for the line-level scanners in sloth.streaming
+(MMCIFHandler.iter_rows, MMCIFHandler.scan_header and MMCIFHandler.inspect).
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from gemmi import cif
+
+from sloth import MMCIFHandler, MMCIFParser
+from sloth.streaming import iter_category_rows
+
+SAMPLE = """data_TEST
+#
+_entry.id TEST
+_struct.title
+;Multi-line
+title
+;
+_struct.pdbx_descriptor 'a protein'
+#
+loop_
+_chem_comp.id
+_chem_comp.name
+ALA 'ALANINE'
+GLY GLYCINE
+#
+loop_
+_atom_site.group_PDB
+_atom_site.id
+_atom_site.label_atom_id
+_atom_site.Cartn_x
+ATOM 1 N 1.0
+ATOM 2 CA 2.0
+ATOM 3 C 3.0 ATOM 4 O
+4.0
+ATOM 5 "O5'" 5.0
+#
+"""
+
+
+class TestIterRows(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "test.cif")
+        with open(self.path, "w") as f:
+            f.write(SAMPLE)
+        self.handler = MMCIFHandler()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _parsed_chunks(self, category, chunk_size, items=None, as_columns=False, unquote=False, path=None):
+        """Chunk the rows of a full parse of the same file the way iter_rows should."""
+        parsed = self.handler.parse(path or self.path).data[0][category]
+        items = items or parsed.items
+        columns = [
+            [cif.as_string(value) if unquote and value[:1] in "'\";" else value for value in parsed[item]]
+            for item in items
+        ]
+        rows = list(zip(*columns))
+        chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+        if as_columns:
+            return [
+                {item: [row[i] for row in chunk] for i, item in enumerate(items)}
+                for chunk in chunks
+            ]
+        return chunks
+
+    def test_chunks_match_parse(self):
+        chunks = list(self.handler.iter_rows(self.path, "_atom_site", chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks, self._parsed_chunks("_atom_site", 2))
+        self.assertEqual(chunks[1][1], ("ATOM", "4", "O", "4.0"))
+        for chunk_size in (1, 3, 5, 100):
+            self.assertEqual(
+                list(self.handler.iter_rows(self.path, "_atom_site", chunk_size=chunk_size)),
+                self._parsed_chunks("_atom_site", chunk_size),
+            )
+
+    def test_items_and_columns(self):
+        chunks = list(
+            iter_category_rows(
+                self.path, "atom_site", items=["Cartn_x", "_atom_site.id"], as_columns=True
+            )
+        )
+        self.assertEqual(
+            chunks, self._parsed_chunks("_atom_site", 100_000, ["Cartn_x", "id"], as_columns=True)
+        )
+        self.assertEqual(chunks[0]["id"], ["1", "2", "3", "4", "5"])
+        chunks = list(
+            iter_category_rows(self.path, "_atom_site", items=["label_atom_id", "id"], chunk_size=2, as_columns=True)
+        )
+        self.assertEqual(
+            chunks, self._parsed_chunks("_atom_site", 2, ["label_atom_id", "id"], as_columns=True)
+        )
+        with self.assertRaises(KeyError):
+            list(iter_category_rows(self.path, "_atom_site", items=["missing"]))
+
+    def test_legacy_backend(self):
+        chunks = list(
+            iter_category_rows(
+                self.path, "_atom_site", items=["label_atom_id"], chunk_size=3, backend="legacy"
+            )
+        )
+        self.assertEqual(chunks, self._parsed_chunks("_atom_site", 3, ["label_atom_id"], unquote=True))
+        self.assertEqual([row[0] for chunk in chunks for row in chunk], ["N", "CA", "C", "O", "O5'"])
+        self.assertEqual(
+            list(iter_category_rows(self.path, "_atom_site", chunk_size=2, backend="legacy")),
+            self._parsed_chunks("_atom_site", 2, unquote=True),
+        )
+        with self.assertRaises(ValueError):
+            list(iter_category_rows(self.path, "_atom_site", backend="unknown"))
+
+    def test_legacy_comments_and_empty_values(self):
+        path = os.path.join(self.temp_dir, "comments.cif")
+        with open(path, "w") as f:
+            f.write(
+                "data_COMMENTS\n"
+                "loop_\n_atom_site.id\n_atom_site.label_alt_id\n_atom_site.label_atom_id\n"
+                "1 '' N # first atom\n"
+                "2 . CA\n"
+                "3 \"\" \"O5'\"   # primed\n"
+                "# a comment line\n"
+                "4 '' 'it's'\n"
+                "#\n"
+                "_struct.title 'a #1 title' # trailing\n"
+                "_struct.pdbx_descriptor ''\n"
+            )
+        for category in ("_atom_site", "_struct"):
+            expected = self._parsed_chunks(category, 2, unquote=True, path=path)
+            chunks = list(iter_category_rows(path, category, chunk_size=2, backend="legacy"))
+            self.assertEqual(chunks, expected)
+        self.assertEqual(
+            [row[1:] for chunk in iter_category_rows(path, "_atom_site", backend="legacy") for row in chunk],
+            [("", "N"), (".", "CA"), ("", "O5'"), ("", "it's")],
+        )
+
+    def test_key_value_category(self):
+        for backend, unquote in (("gemmi", False), ("legacy", True)):
+            chunks = list(
+                iter_category_rows(self.path, "_struct", backend=backend, as_columns=True)
+            )
+            self.assertEqual(
+                chunks, self._parsed_chunks("_struct", 100_000, as_columns=True, unquote=unquote)
+            )
+        self.assertEqual(chunks, [{"title": ["Multi-line\ntitle"], "pdbx_descriptor": ["a protein"]}])
+        self.assertEqual(
+            list(iter_category_rows(self.path, "_struct", chunk_size=1)),
+            self._parsed_chunks("_struct", 1),
+        )
+
+    def test_compressed_input(self):
+        gz_path = self.path + ".gz"
+        with gzip.open(gz_path, "wt") as f:
+            f.write(SAMPLE)
+        chunks = list(self.handler.iter_rows(gz_path, "_chem_comp", chunk_size=1))
+        self.assertEqual(chunks, self._parsed_chunks("_chem_comp", 1))
+        self.assertEqual(chunks, [[("ALA", "'ALANINE'")], [("GLY", "GLYCINE")]])
+
+
+class TestScanHeader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "test.cif")
+        with open(self.path, "w") as f:
+            f.write(SAMPLE)
+        self.handler = MMCIFHandler()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_large_loops_are_skipped(self):
+        header = self.handler.scan_header(self.path, max_loop_lines=4)
+        block = header.data[0]
+        self.assertEqual(set(block.categories), {"_entry", "_struct", "_chem_comp"})
+        full = self.handler.parse(self.path).data[0]
+        self.assertEqual(block._struct.title, full._struct.title)
+        self.assertEqual(block._chem_comp.name, full._chem_comp.name)
+
+        # Raising the limit keeps the loop
+        header = self.handler.scan_header(self.path, max_loop_lines=10)
+        self.assertEqual(header.data[0]._atom_site.row_count, 5)
+
+    def test_category_selection(self):
+        header = self.handler.scan_header(self.path, categories=["_entry", "_atom_site"])
+        block = header.data[0]
+        self.assertEqual(set(block.categories), {"_entry", "_atom_site"})
+        self.assertEqual(block._entry.id, ["TEST"])
+
+
+class TestInspect(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "test.cif")
+        content = SAMPLE + """loop_
+_struct_conf.id
+_struct_conf.details
+HELX1
+;helix # not a comment
+_not.a_tag
+;
+HELX2 'a b' # trailing comment
+HELX3 x_y
+data_SECOND
+_entry.id SECOND
+"""
+        with open(self.path, "w") as f:
+            f.write(content)
+        self.handler = MMCIFHandler()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_parse(self):
+        catalogue = self.handler.inspect(self.path)
+        parsed = self.handler.parse(self.path)
+        self.assertEqual(list(catalogue), ["TEST", "SECOND"])
+        for block in parsed.data:
+            info = catalogue[block.name]
+            self.assertEqual(set(info), set(block.categories))
+            for name in block.categories:
+                category = block[name]
+                self.assertEqual(info[name]["row_count"], category.row_count, name)
+                self.assertEqual(info[name]["items"], list(category.items), name)
+
+    def test_byte_ranges_parse_on_their_own(self):
+        catalogue = self.handler.inspect(self.path)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for block_name, categories in catalogue.items():
+            for name, info in categories.items():
+                chunk = b"".join(data[start:end] for start, end in info["byte_ranges"])
+                container = MMCIFParser().parse_string("data_slice\n" + chunk.decode())
+                category = container.data[0][name]
+                self.assertEqual(category.row_count, info["row_count"], name)
+
+
+if __name__ == "__main__":
+    unittest.main()